@@ -16,7 +16,7 @@ from src.html_generator import HTMLGenerator
 from src.telegram_bot import TelegramNotifier
 from src.utils.logger import setup_logger
 from src.utils.cardnews import generate_top10_card
-from src.utils import llm_client
+from src.utils import article_body, http_client, llm_client
 from src import archiver
 
 KST = timezone(timedelta(hours=9))
@@ -38,8 +38,10 @@ def main():
         logger.info("Step 1: Collecting news from all sources...")
         repo_root = os.path.dirname(__file__)
         raw_data_dir = os.path.join(repo_root, 'data', 'raw')
-        # 전날 이미 실은 기사를 다시 싣지 않으려면 과거 스냅샷을 봐야 한다
-        aggregator = NewsAggregator(raw_data_dir=raw_data_dir)
+        # 전날 이미 실은 기사를 다시 싣지 않으려면 과거 스냅샷을 봐야 한다.
+        # 캐시도 매 실행이 새 러너라 data/에 커밋돼야 다음 실행으로 넘어간다
+        cache_dir = os.path.join(repo_root, 'data', 'cache')
+        aggregator = NewsAggregator(raw_data_dir=raw_data_dir, cache_dir=cache_dir)
         categorized_news = aggregator.collect_all_news()
 
         # 2. HTML 생성
@@ -86,6 +88,9 @@ def main():
             logger.warning(f"Archive rollover failed (non-fatal): {e}")
 
         _report_llm_status(logger)
+        _report_http_status(logger)
+        _report_feed_status(logger, aggregator)
+        _report_body_status(logger, aggregator)
 
         logger.info("=" * 60)
         logger.info("Daily News Briefing System completed successfully!")
@@ -103,7 +108,7 @@ def _record_fallback_rate(buckets) -> None:
     (청크 일부만 실패). 지면에 실제로 반영된 비율을 따로 봐야 한다.
     """
     articles = [a for regions in buckets.values() for arts in regions.values() for a in arts]
-    failed = sum(1 for a in articles if getattr(a, 'llm_failed', False))
+    failed = sum(1 for a in articles if a.llm_failed)
     llm_client.LLM_STATS['articles_total'] = len(articles)
     llm_client.LLM_STATS['articles_fallback'] = failed
 
@@ -133,14 +138,51 @@ def _report_llm_status(logger) -> None:
 
     logger.info(f"LLM status: {headline} | {summary}")
 
+    _write_step_summary(
+        logger,
+        f"### LLM 요약·번역 상태\n\n{headline}\n\n```\n{summary}\n```\n"
+        # 키가 8개라 어느 키가 문제인지 같이 보여야 짚을 수 있다
+        f"\n**API 키 점검**\n\n```\n{keys}\n```\n",
+    )
+
+
+def _report_http_status(logger) -> None:
+    """호스트별 호출 수·시간·바이트 — 어느 호스트가 실행 시간을 잡아먹는지 본다."""
+    summary = http_client.stats_summary()
+    logger.info(f"HTTP usage:\n{summary}")
+    _write_step_summary(logger, f"\n### HTTP 호출 (시간 많이 쓴 호스트 순)\n\n```\n{summary}\n```\n")
+
+
+def _report_feed_status(logger, aggregator) -> None:
+    """
+    피드별 깔때기와 무소득 피드 — 받고 파싱만 하고 전부 버려지는 피드를 목록에서
+    손으로 정리할 근거로 쓴다 (자동으로는 건너뛰기만 한다).
+    """
+    report = aggregator.feed_stats.report()
+    logger.info(f"Feed health:\n{report}")
+    _write_step_summary(logger, f"\n### 피드 상태\n\n```\n{report}\n```\n")
+
+
+def _report_body_status(logger, aggregator) -> None:
+    """
+    매체별 본문 확보 경로 — 피드 전문(content:encoded) 덕에 건너뛴 본문 요청 수 —
+    와 호스트별 추출 경로 적중률(적중률이 낮은 호스트가 위).
+    """
+    summary = article_body.stats_summary()
+    profiles = aggregator.body_profiles.summary()
+    logger.info(f"Article bodies:\n{summary}\nExtraction profiles:\n{profiles}")
+    _write_step_summary(logger, f"\n### 기사 본문 확보\n\n```\n{summary}\n```\n"
+                                f"\n#### 호스트별 추출 경로\n\n```\n{profiles}\n```\n")
+
+
+def _write_step_summary(logger, text: str) -> None:
+    """Actions 실행 요약($GITHUB_STEP_SUMMARY)에 덧붙인다. 로컬 실행이면 아무것도 안 한다."""
     step_summary = os.getenv('GITHUB_STEP_SUMMARY')
     if not step_summary:
         return
     try:
         with open(step_summary, 'a', encoding='utf-8') as f:
-            f.write(f"### LLM 요약·번역 상태\n\n{headline}\n\n```\n{summary}\n```\n")
-            # 키가 8개라 어느 키가 문제인지 같이 보여야 짚을 수 있다
-            f.write(f"\n**API 키 점검**\n\n```\n{keys}\n```\n")
+            f.write(text)
     except OSError as e:
         logger.warning(f"Could not write step summary: {e}")
 
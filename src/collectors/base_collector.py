@@ -6,9 +6,27 @@ from abc import ABC, abstractmethod
 from typing import List, Dict
 from datetime import datetime, timezone
 
+from ..utils.dedup import _canonical_link
+from ..utils.seen_index import canonical_key
+
 
 class NewsArticle:
-    """뉴스 기사 데이터 클래스"""
+    """
+    뉴스 기사 레코드. 필드를 전부 여기서 선언한다(__slots__) — 하루 수천 건이 수집 단계를
+    지나가므로 인스턴스 dict를 없애 메모리를 줄이고, 단계마다 getattr 기본값으로 덧붙이던
+    필드(original_title, detail_summary, is_ai ...)를 한곳에서 본다.
+    직렬화는 to_dict / from_dict 하나뿐이다 — 스냅샷·캐시·렌더링이 같은 형식을 쓴다.
+    """
+    __slots__ = (
+        "title", "link", "published", "summary", "source", "category", "is_important",
+        "body", "body_source", "date_is_approximate", "region", "language",
+        "detail_path", "detail_rel", "llm_failed", "feed_key",
+        "cluster_size", "related_sources", "fingerprint",
+        "original_title", "original_summary", "detail_summary",
+        "is_ai", "ai_subtype", "ai_subtype_label", "summary_key",
+        "_canonical_link", "_link_key",
+    )
+
     def __init__(self, title: str, link: str, published: datetime,
                  summary: str = "", source: str = "", category: str = ""):
         self.title = title
@@ -20,24 +38,73 @@ class NewsArticle:
         self.category = category
         self.is_important = False  # 중요도 플래그
         self.body = ""  # 원문 본문 (article_body.enrich가 채움, 요약 입력으로만 사용)
+        self.body_source = ""  # body를 어디서 얻었나: "feed"(content:encoded) / "page"(기사 페이지)
         self.date_is_approximate = False  # 피드에 날짜가 없어 목록 순서로 추정한 경우
         self.region = "domestic"  # sources.py의 region — 국내/해외 탭 분리 기준
         self.language = "ko"
         self.detail_path = ""  # 해외 기사 상세 요약 페이지 href (base_path 포함)
         self.detail_rel = ""   # 같은 페이지의 상대경로 (텔레그램 링크 조립용)
         self.llm_failed = False  # 요약이 규칙기반으로 떨어졌는지 (재시도 스윕 대상)
-        
-    def to_dict(self) -> Dict:
-        """딕셔너리로 변환"""
-        return {
-            'title': self.title,
-            'link': self.link,
-            'published': self.published.isoformat(),
-            'summary': self.summary,
-            'source': self.source,
-            'category': self.category,
-            'is_important': self.is_important
-        }
+        self.feed_key = ""  # 수집한 피드 (feed_stats.feed_key) — 피드별 깔때기 집계용
+        self.cluster_size = 1  # 같은 사건을 다룬 기사 수 (utils.story_cluster — 중요도 신호)
+        self.related_sources = []  # 묶여서 빠진 다른 매체 기사 [{source, link, fingerprint}]
+        self.fingerprint = ""  # 원래 제목·요약의 SimHash (utils.story_fingerprint — 날짜 넘는 중복 판정)
+        self.original_title = ""  # 외국어 기사의 원문 제목·요약 (요약 단계가 번역하기 전)
+        self.original_summary = ""
+        self.detail_summary = ""  # 해외 기사 상세 요약 (detail_600)
+        self.is_ai = False  # IT 카테고리 AI 서브섹션 (summarizer.extract_ai_items)
+        self.ai_subtype = ""
+        self.ai_subtype_label = ""
+        self.summary_key = ""  # 요약 캐시 키 (summarizer._cache_key — 처음 요약에 넘길 때 정한다)
+        self._canonical_link = None
+        self._link_key = None
+
+    @property
+    def canonical_link(self) -> str:
+        """추적 파라미터를 뗀 비교용 링크 — 한 번만 계산한다 (link는 생성 뒤 바뀌지 않는다)."""
+        if self._canonical_link is None:
+            self._canonical_link = _canonical_link(self.link) if self.link else ""
+        return self._canonical_link
+
+    @property
+    def link_key(self) -> str:
+        """seen_index의 링크 키 (정규화 링크 해시)."""
+        if self._link_key is None:
+            self._link_key = canonical_key(self.canonical_link)
+        return self._link_key
+
+    def to_dict(self, with_body: bool = True) -> Dict:
+        """
+        전 필드를 JSON 직렬화 가능한 dict로 — from_dict와 짝이라 왕복해도 잃는 게 없다.
+        스냅샷은 with_body=False(본문은 요약 입력일 뿐이고 크기만 키운다).
+        """
+        d = {name: getattr(self, name) for name in _FIELDS}
+        d['published'] = self.published.isoformat()
+        d['related_sources'] = [dict(r) for r in self.related_sources]
+        if not with_body:
+            del d['body']
+        return d
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'NewsArticle':
+        """to_dict(또는 예전 스냅샷의 7개 필드 dict)에서 되살린다. 모르는 키는 무시."""
+        published = d.get('published')
+        try:
+            published = datetime.fromisoformat(published) if published else None
+        except (TypeError, ValueError):
+            published = None
+        article = cls(d.get('title', ''), d.get('link', ''),
+                      published or datetime.now(timezone.utc),
+                      d.get('summary', ''), d.get('source', ''), d.get('category', ''))
+        for name in _FIELDS[6:]:
+            if name in d:
+                setattr(article, name, d[name])
+        article.related_sources = [dict(r) for r in article.related_sources]
+        return article
+
+
+# 직렬화 필드 — 생성자 인자 6개가 맨 앞 (캐시 슬롯은 빼고)
+_FIELDS = tuple(name for name in NewsArticle.__slots__ if not name.startswith('_'))
 
 
 class BaseCollector(ABC):
@@ -60,7 +127,8 @@ class BaseCollector(ABC):
         """
         pass
     
-    def _parse_date(self, date_str: str) -> datetime:
+    @staticmethod
+    def _parse_date(date_str: str) -> datetime:
         """
         날짜 문자열을 datetime 객체로 변환.
         언론사마다 RFC822 오프셋 유무가 달라 aware/naive가 섞이면
@@ -2,67 +2,201 @@
 Generic RSS Collector
 sources.py의 설정 하나당 이 클래스 인스턴스 하나 — 언론사 추가는 클래스 작성이 아니라
 sources.py에 항목을 추가하는 것으로 끝난다.
+
+수집은 세 단계로 나뉜다: download(네트워크) → parse_entries(CPU, 순수 함수) →
+absorb(캐시·통계 기록과 NewsArticle 조립). parse_entries는 dict·기본형만 주고받아
+ProcessPoolExecutor에서 돌릴 수 있다 — 같은 스레드 풀에서 파싱하면 feedparser와
+clean_html 정규식이 GIL에 묶여 피드 80여 개의 파싱이 사실상 한 줄로 선다.
 """
 import logging
-from typing import Dict, List
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional
 from .base_collector import BaseCollector, NewsArticle
+from ..utils.feed_cache import MAX_CACHED_ENTRIES, compact_entry, entry_body
+from ..utils.feed_stats import feed_key
+from ..utils.seen_index import link_key
 from ..utils.rss_utils import (
-    fetch_feed, clean_html, extract_date, feed_anchor_time,
+    download_feed, parse_download, clean_html, extract_date, feed_anchor_time,
     strip_title_prefix, strip_google_news_title_suffix,
 )
 
 
+class ParsedFeed(NamedTuple):
+    """parse_entries 결과 — 프로세스 경계를 넘도록 dict·기본형만 담는다."""
+    articles: List[Dict]                # {title, link, summary, published, approximate, body}
+    cache_entries: Optional[List[Dict]]  # 새로 파싱했으면 FeedCache에 넣을 항목 (캐시 적중이면 None)
+    feed_updated: Optional[List[int]]
+    counts: Dict[str, int]              # feed_stats 깔때기: entries / stale / seen
+    seconds: float                      # 파싱에 쓴 시간
+
+
+def _drop_reason(link: str, published: datetime, approximate: bool,
+                 cutoff: Optional[datetime], seen_links) -> str:
+    """버릴 사유(feed_stats 깔때기 단계 이름) 또는 빈 문자열."""
+    # 발행일이 추정치인 건(피드에 날짜가 없는 매체) 나이로 거르지 않는다 —
+    # 나중에 기사 메타로 교정되므로 여기서 버리면 멀쩡한 기사를 잃는다
+    if cutoff is not None and not approximate and published < cutoff:
+        return "stale"
+    if seen_links and link_key(link) in seen_links:
+        return "seen"
+    return ""
+
+
+def parse_entries(source_id: str, download, limit: int, cutoff: Optional[datetime] = None,
+                  seen_links=()) -> Optional[ParsedFeed]:
+    """download_feed 결과 → 기사 레코드. 파싱 실패면 None. 피드 캐시·통계는 건드리지 않는다."""
+    started = time.perf_counter()
+    feed = parse_download(download, limit=limit)
+    if not feed:
+        return None
+
+    cache_entries = feed_updated = None
+    if download.cached is None:
+        cache_entries = [compact_entry(e) for e in feed.entries[:MAX_CACHED_ENTRIES]]
+        updated = feed.feed.get("updated_parsed")
+        feed_updated = list(updated)[:9] if updated else None
+
+    anchor = feed_anchor_time(feed)
+    counts = Counter(entries=len(feed.entries[:limit]))
+    articles = []
+    for index, entry in enumerate(feed.entries[:limit]):
+        try:
+            # 버릴 기사는 날짜·링크만 보고 먼저 거른다 — clean_html과 객체 생성이
+            # 항목당 비용의 대부분이고, 갱신을 멈춘 피드는 항목 전부가 버려진다
+            published, approximate = extract_date(entry, BaseCollector._parse_date, anchor, index)
+            link = entry.get("link", "")
+            dropped = _drop_reason(link, published, approximate, cutoff, seen_links)
+            if dropped:
+                counts[dropped] += 1
+                continue
+
+            # 요약은 clean_html로 엔티티가 풀리는데 제목은 그냥 두면 "&amp;"가
+            # 그대로 남고, 템플릿이 한 번 더 이스케이프해 화면에 "&amp;"로 보인다.
+            title = clean_html(entry.get("title", "")).strip()
+            if source_id == "googlenews":
+                title = strip_google_news_title_suffix(title)
+            summary = clean_html(entry.get("description", "") or entry.get("summary", ""))
+            summary = strip_title_prefix(summary, title)
+            summary = summary or title[:200]
+
+            # 피드가 전문(content:encoded)을 주면 그게 본문이다 — article_body가 페이지를
+            # 다시 받지 않는다. 새로 파싱했으면 캐시 항목을 만들며 이미 뽑아 두었다
+            if cache_entries is not None and index < len(cache_entries):
+                body = cache_entries[index]["body"]
+            else:
+                body = entry_body(entry)
+            # 피드에 날짜가 없어 순서로 추정한 건 나중에 기사 본문 메타에서
+            # 진짜 발행일로 교정한다(article_body가 어차피 본문을 받아온다)
+            articles.append({"title": title, "link": link, "summary": summary,
+                             "published": published, "approximate": approximate, "body": body})
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Error parsing entry from {source_id}: {e}")
+            continue
+    return ParsedFeed(articles, cache_entries, feed_updated, dict(counts),
+                      time.perf_counter() - started)
+
+
+# 파싱 프로세스 안에서 쓰는 필터 — 작업마다 seen_links(수천 개)를 다시 보내지 않도록
+# 풀을 만들 때 init_parse_worker로 한 번만 넘긴다
+_worker_filter: Dict = {"cutoff": None, "seen_links": ()}
+
+
+def init_parse_worker(cutoff: Optional[datetime], seen_links) -> None:
+    """ProcessPoolExecutor(initializer=...)용."""
+    _worker_filter.update(cutoff=cutoff, seen_links=frozenset(seen_links or ()))
+
+
+def parse_in_worker(source_id: str, download, limit: int) -> Optional[ParsedFeed]:
+    return parse_entries(source_id, download, limit, **_worker_filter)
+
+
 class RSSCollector(BaseCollector):
     """설정 기반 범용 RSS 수집기"""
 
-    def __init__(self, source_id: str, display_name: str, feeds: Dict[str, str], language: str = "ko"):
+    def __init__(self, source_id: str, display_name: str, feeds: Dict[str, str], language: str = "ko",
+                 feed_cache=None, feed_stats=None, cutoff: Optional[datetime] = None,
+                 seen_links=None, parse_pool=None):
         super().__init__(display_name)
         self.source_id = source_id
         self.feeds = feeds
         self.language = language
+        self.feed_cache = feed_cache  # utils.feed_cache.FeedCache — 없으면 매번 전체를 받는다
+        self.feed_stats = feed_stats  # utils.feed_stats.FeedStats — 피드별 지연·깔때기 기록
+        # 이보다 오래된 기사와 이미 실은 링크(seen_index.link_key 집합)는 기사 객체를
+        # 만들기 전에 버린다
+        self.cutoff = cutoff
+        self.seen_links = seen_links or ()
+        # 파싱을 넘길 ProcessPoolExecutor — init_parse_worker로 같은 cutoff·seen_links를
+        # 받은 풀이어야 한다. 없으면 부른 스레드에서 파싱한다
+        self.parse_pool = parse_pool
         self.logger = logging.getLogger(__name__)
 
     def collect(self, category: str = None, limit: int = 15) -> List[NewsArticle]:
+        return self.parse(category, self.download(category), limit)
+
+    def download(self, category: str = None):
+        """네트워크 단계만 — 수집 엔진이 파싱과 다른 풀에서 돌릴 수 있게 나눠 둔다."""
         url = self.feeds.get(category)
         if not url:
-            return []
-
+            return None
         self.logger.info(f"Fetching {self.source_name}/{category} from: {url}")
-        feed = fetch_feed(url)
+        started = time.monotonic()
+        download = download_feed(url, cache=self.feed_cache)
+        if self.feed_stats is not None:
+            # 304·실패면 받은 본문이 없다 — 전송량 0으로 센다. 실패는 무소득 실행이 아니다
+            nbytes = len(download.content or b"") if download else 0
+            self.feed_stats.record_fetch(feed_key(self.source_id, category),
+                                         time.monotonic() - started, nbytes, ok=download is not None)
+        return download
 
-        if not feed or not feed.entries:
+    def parse(self, category: str, download, limit: int = 15) -> List[NewsArticle]:
+        """download()의 결과를 기사 목록으로 (CPU 단계 — parse_pool이 있으면 거기서)."""
+        if not self.feeds.get(category) or download is None:
+            return self.absorb(category, download, None)
+        if self.parse_pool is not None:
+            parsed = self.parse_pool.submit(parse_in_worker, self.source_id, download, limit).result()
+        else:
+            parsed = parse_entries(self.source_id, download, limit, self.cutoff, self.seen_links)
+        return self.absorb(category, download, parsed)
+
+    def absorb(self, category: str, download, parsed: Optional[ParsedFeed]) -> List[NewsArticle]:
+        """파싱 결과를 피드 캐시·통계에 기록하고 NewsArticle로 조립한다 (가벼운 단계)."""
+        url = self.feeds.get(category)
+        if not url:
+            return []
+        if parsed is None or not parsed.counts.get("entries"):
             self.logger.warning(f"Feed empty: {self.source_id}/{category} from {url}")
             return []
 
-        anchor = feed_anchor_time(feed)
+        if self.feed_cache is not None and parsed.cache_entries is not None:
+            self.feed_cache.put_record(
+                url, parsed.cache_entries, feed_updated=parsed.feed_updated, etag=download.etag,
+                last_modified=download.last_modified, digest=download.digest,
+            )
+        key = feed_key(self.source_id, category)
+        if self.feed_stats is not None:
+            for stage, n in parsed.counts.items():
+                self.feed_stats.count(key, stage, n)
+            self.feed_stats.count(key, "parse_ms", int(parsed.seconds * 1000))
+
         articles = []
-        for index, entry in enumerate(feed.entries[:limit]):
-            try:
-                # 요약은 clean_html로 엔티티가 풀리는데 제목은 그냥 두면 "&amp;"가
-                # 그대로 남고, 템플릿이 한 번 더 이스케이프해 화면에 "&amp;"로 보인다.
-                title = clean_html(entry.get("title", "")).strip()
-                if self.source_id == "googlenews":
-                    title = strip_google_news_title_suffix(title)
-                summary = clean_html(entry.get("description", "") or entry.get("summary", ""))
-                summary = strip_title_prefix(summary, title)
-                summary = summary or title[:200]
-
-                published, approximate = extract_date(entry, self._parse_date, anchor, index)
-                article = NewsArticle(
-                    title=title,
-                    link=entry.get("link", ""),
-                    published=published,
-                    summary=summary,
-                    source=self.source_name,
-                    category=category,
-                )
-                # 피드에 날짜가 없어 순서로 추정한 건 나중에 기사 본문 메타에서
-                # 진짜 발행일로 교정한다(article_body가 어차피 본문을 받아온다)
-                article.date_is_approximate = approximate
-                articles.append(article)
-            except Exception as e:
-                self.logger.error(f"Error parsing entry from {self.source_id}: {e}")
-                continue
+        for record in parsed.articles:
+            article = NewsArticle(
+                title=record["title"],
+                link=record["link"],
+                published=record["published"],
+                summary=record["summary"],
+                source=self.source_name,
+                category=category,
+            )
+            article.date_is_approximate = record["approximate"]
+            if record["body"]:
+                article.body = record["body"]
+                article.body_source = "feed"
+            article.feed_key = key
+            articles.append(article)
 
         self.logger.info(f"Collected {len(articles)} articles from {self.source_id}/{category}")
         return articles
@@ -15,6 +15,8 @@ from .collectors.sources import CATEGORIES, CATEGORY_META, REGIONS, REGION_META
 from .utils.logger import setup_logger
 from .utils.indicators import get_market_indicators, write_indicators_json
 from .utils.pagekey import load_or_create_salt, obfuscate
+from .utils.seen_index import SeenIndex, link_key
+from .utils.story_fingerprint import record_fingerprints
 from .utils import stock_data
 from . import summarizer
 
@@ -179,14 +181,14 @@ class HTMLGenerator:
         made = 0
         for category in CATEGORIES:
             for article in buckets.get(category, {}).get('overseas', []):
-                detail = (getattr(article, 'detail_summary', '') or '').strip()
+                detail = (article.detail_summary or '').strip()
                 if not detail:
                     continue
                 filename = obfuscate('a.html', salt, date_str, article.link)
                 with open(os.path.join(output_path, filename), 'w', encoding='utf-8') as f:
                     f.write(template.render(
                         title=article.title,
-                        original_title=getattr(article, 'original_title', ''),
+                        original_title=article.original_title,
                         source=article.source,
                         published=article.published.astimezone(KST).strftime('%Y-%m-%d %H:%M'),
                         detail=detail,
@@ -212,21 +214,9 @@ class HTMLGenerator:
 
     @staticmethod
     def _article_to_dict(article: NewsArticle) -> Dict:
-        d = {
-            'title': article.title,
-            'link': article.link,
-            'published': article.published.astimezone(KST).strftime('%Y-%m-%d %H:%M'),
-            'summary': article.summary,
-            'source': article.source,
-            'is_important': article.is_important,
-            'detail_path': getattr(article, 'detail_path', ''),
-        }
-        if hasattr(article, 'original_title'):
-            d['original_title'] = article.original_title
-        if hasattr(article, 'original_summary'):
-            d['original_summary'] = article.original_summary
-        if hasattr(article, 'ai_subtype_label'):
-            d['ai_subtype_label'] = article.ai_subtype_label
+        """렌더링용 — 스냅샷과 같은 NewsArticle.to_dict에 표시용 발행 시각만 바꿔 끼운다."""
+        d = article.to_dict(with_body=False)
+        d['published'] = article.published.astimezone(KST).strftime('%Y-%m-%d %H:%M')
         return d
 
     def _generate_briefing_page(self, category: str, regions: Dict[str, List[NewsArticle]],
@@ -243,8 +233,8 @@ class HTMLGenerator:
         for region in REGIONS:
             articles = regions.get(region, [])
             if category == 'it':
-                ai_items.extend(self._article_to_dict(a) for a in articles if getattr(a, 'is_ai', False))
-                articles = [a for a in articles if not getattr(a, 'is_ai', False)]
+                ai_items.extend(self._article_to_dict(a) for a in articles if a.is_ai)
+                articles = [a for a in articles if not a.is_ai]
             region_blocks.append({
                 'key': region,
                 'name': REGION_META[region]['name'],
@@ -344,8 +334,8 @@ class HTMLGenerator:
             articles = [a for region in REGIONS for a in regions.get(region, [])]
             articles.sort(key=lambda a: (a.is_important, a.published), reverse=True)
             if key == 'it':
-                all_ai_items.extend(a for a in articles if getattr(a, 'is_ai', False))
-                articles = [a for a in articles if not getattr(a, 'is_ai', False)]
+                all_ai_items.extend(a for a in articles if a.is_ai)
+                articles = [a for a in articles if not a.is_ai]
             category_previews.append({
                 **cat,
                 'top5': [self._article_to_dict(a) for a in articles[:PREVIEW_COUNT]],
@@ -424,6 +414,7 @@ class HTMLGenerator:
                             stock_picks: Dict, date_str: str):
         """
         docs/ 밖에 그날의 원본 데이터를 저장 (archiver.py의 3개월 롤오버 압축용).
+        기사는 NewsArticle.to_dict 전 필드(본문 제외)라 from_dict로 되살려 다시 렌더링할 수 있다.
         raw_data_dir이 지정 안 됐으면 스냅샷을 만들지 않는다(예: 테스트 환경).
         """
         if not self.raw_data_dir:
@@ -436,7 +427,7 @@ class HTMLGenerator:
         snapshot = {
             'date': date_str,
             'categories': {
-                key: {region: [a.to_dict() for a in articles]
+                key: {region: [a.to_dict(with_body=False) for a in articles]
                       for region, articles in regions.items()}
                 for key, regions in categorized_news.items()
             },
@@ -445,3 +436,18 @@ class HTMLGenerator:
 
         with open(os.path.join(snapshot_dir, f'{day}.json'), 'w', encoding='utf-8') as f:
             json.dump(snapshot, f, ensure_ascii=False, indent=2)
+
+        # 다음 실행의 '이미 실은 기사' 필터는 스냅샷 대신 이 인덱스를 읽는다
+        # 같은 사건으로 묶여 빠진 다른 매체 기사도 내일 다시 올라오지 않게 함께 남긴다
+        keys = [key for regions in categorized_news.values()
+                for articles in regions.values() for a in articles
+                for key in [a.link_key] + [link_key(r['link']) for r in a.related_sources]]
+        # 새 URL로 다시 올라오는 같은 기사는 원래 제목·요약의 지문으로 거른다
+        fingerprints = [key for regions in categorized_news.values()
+                        for articles in regions.values() for a in articles
+                        for key in [a.fingerprint] + [r.get('fingerprint', '') for r in a.related_sources]]
+        try:
+            SeenIndex(self.raw_data_dir).record_keys(keys, date_str)
+            record_fingerprints(self.raw_data_dir, fingerprints, date_str)
+        except OSError as e:
+            self.logger.warning(f"Seen-link index not updated: {e}")
@@ -4,17 +4,30 @@ News Aggregator
 """
 import os
 import re
+import time
 from datetime import datetime, timedelta, timezone
 from collections import OrderedDict, defaultdict
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional
 
-from .collectors.rss_collector import RSSCollector
+from .collectors import async_collector
+from .collectors.rss_collector import RSSCollector, init_parse_worker
 from .collectors.sources import SOURCES, CATEGORIES, CATEGORY_META, REGIONS
 from .collectors.base_collector import NewsArticle
 from .utils import article_body
-from .utils.dedup import normalize_title, load_recent_links, _canonical_link
+from .utils.body_cache import BodyCache
+from .utils.body_hosts import HostHistory
+from .utils.body_profiles import ExtractionProfiles
+from .utils.chunk_planner import ChunkPlanner
+from .utils.dedup import normalize_title
+from .utils.feed_cache import FeedCache
+from .utils.feed_stats import FeedStats, feed_key, predict_makespan
 from .utils.logger import setup_logger
+from .utils.near_dup import NearDupIndex
+from .utils.seen_index import load_seen_keys
+from .utils.story_cluster import cluster_stories
+from .utils.story_fingerprint import fingerprint, load_seen_fingerprints
+from .utils.summary_cache import SummaryCache
 from . import summarizer
 
 # 발행일이 이보다 오래된 기사는 버린다. 피드가 살아 있어도 갱신을 멈춘 곳이 있어
@@ -22,9 +35,25 @@ from . import summarizer
 # 죽은 피드를 목록에서 빼는 것과 별개로, 일간 브리핑에는 오래된 기사가 들어오면 안 된다.
 MAX_ARTICLE_AGE_DAYS = 3
 
-# 전날 이미 실은 기사를 다시 싣지 않기 위해 되돌아볼 일수
+# 전날 이미 실은 기사를 다시 싣지 않기 위해 되돌아볼 일수 (seen_index.KEEP_DAYS 이하)
 CROSS_DAY_LOOKBACK_DAYS = 7
 
+# 피드 수집 동시 스레드 수 (http_client.POOL_MAXSIZE가 이보다 작으면 연결을 재사용 못 한다)
+FEED_WORKERS = 12
+
+# 수집 엔진: "threads"(기본, FEED_WORKERS 고정 풀) 또는 "async"(모든 피드를 동시에,
+# 호스트별 상한만 둔다 — collectors/async_collector.py). COLLECT_MODE 환경변수로 고른다.
+COLLECT_MODES = ("threads", "async")
+
+# 피드 파싱 프로세스 수 상한 (실제로는 CPU 수와 이 값 중 작은 쪽). 파싱을 I/O 스레드에서
+# 하면 GIL에 묶여 코어가 여럿이어도 한 줄로 선다. 1 이하면 프로세스 없이 스레드에서
+# 파싱한다. PARSE_PROCESSES 환경변수로 바꾼다.
+PARSE_PROCESSES = 4
+# 본문 추출(lxml 파싱·XPath·산문 점수)도 같은 이유로 프로세스에서 한다 — 상한과 규칙은
+# PARSE_PROCESSES와 같고 BODY_PROCESSES 환경변수로 바꾼다. 페이지를 받는 스레드 수는
+# 따로 BODY_WORKERS 환경변수로(기본 article_body._WORKERS).
+BODY_PROCESSES = 4
+
 # 지역별 상한. 예전엔 카테고리당 통합 30건이었는데, 그러면 국내 기사에 밀려
 # 해외 기사가 거의 안 보였다.
 REGION_ARTICLE_CAP = 20
@@ -33,26 +62,56 @@ REGION_ARTICLE_CAP = 20
 # 한겨레 society 피드에서 실제 확인됨. 뉴스 가치가 없어 통째로 제외한다.
 _WIRE_BULLETIN_PATTERN = re.compile(r'^\d{1,2}월\s*\d{1,2}일\s*(궂긴\s*소식|인사|동정|부고|알림|일정)\s*$')
 
-# 같은 매체가 같은 사안을 제목만 조금 바꿔 두 번 내보내는 경우가 있어
-# (예: "…발사체 포착" / "…발사체 감지") 제목 토큰 자카드 유사도로 잡는다.
-_NEAR_DUP_THRESHOLD = 0.5
-_TOKEN_PATTERN = re.compile(r'[가-힣A-Za-z0-9]{2,}')
 
 
 def _is_wire_bulletin(title: str) -> bool:
     return bool(_WIRE_BULLETIN_PATTERN.match((title or '').strip()))
 
 
-def _title_tokens(title: str) -> set:
-    return set(_TOKEN_PATTERN.findall(title or ''))
-
-
 class NewsAggregator:
     """뉴스 통합 및 분류 클래스"""
 
-    def __init__(self, raw_data_dir: str = ''):
+    def __init__(self, raw_data_dir: str = '', cache_dir: str = '', collect_mode: str = '',
+                 parse_processes: Optional[int] = None, body_processes: Optional[int] = None,
+                 body_workers: Optional[int] = None):
+        """
+        raw_data_dir: 과거 일일 스냅샷 위치 (전날 기사 재게재 차단용)
+        cache_dir: 실행 간 캐시 위치. 비우면 캐시 없이 매번 전부 받는다(예: 테스트 환경).
+        collect_mode: COLLECT_MODES 중 하나. 비우면 COLLECT_MODE 환경변수, 그것도 없으면 threads.
+        parse_processes: 피드 파싱 프로세스 수. 비우면 PARSE_PROCESSES 환경변수, 그것도 없으면
+            min(PARSE_PROCESSES, CPU 수).
+        body_processes: 본문 추출 프로세스 수. 규칙은 parse_processes와 같다(BODY_PROCESSES).
+        body_workers: 본문 페이지를 받는 스레드 수. 비우면 BODY_WORKERS 환경변수, 그것도
+            없으면 article_body 기본값.
+        """
         self.logger = setup_logger()
         self.raw_data_dir = raw_data_dir
+        self.cache_dir = cache_dir
+        mode = (collect_mode or os.getenv('COLLECT_MODE') or 'threads').strip().lower()
+        if mode not in COLLECT_MODES:
+            self.logger.warning(f"Unknown COLLECT_MODE {mode!r} — using threads")
+            mode = 'threads'
+        self.collect_mode = mode
+        if parse_processes is None:
+            env = os.getenv('PARSE_PROCESSES', '').strip()
+            parse_processes = int(env) if env.isdigit() else min(PARSE_PROCESSES, os.cpu_count() or 1)
+        self.parse_processes = parse_processes
+        if body_processes is None:
+            env = os.getenv('BODY_PROCESSES', '').strip()
+            body_processes = int(env) if env.isdigit() else min(BODY_PROCESSES, os.cpu_count() or 1)
+        self.body_processes = body_processes
+        if body_workers is None:
+            env = os.getenv('BODY_WORKERS', '').strip()
+            body_workers = int(env) if env.isdigit() else None
+        self.body_workers = body_workers
+        # 피드별 지연·깔때기·무소득 연속 기록. 수집부터 요약까지 단계마다 채우고
+        # collect_all_news 끝에서 한 번 정산해 저장한다
+        self.feed_stats = FeedStats(os.path.join(cache_dir, 'feed_stats.json') if cache_dir else '')
+        # 호스트별로 본문이 있던 컨테이너 경로 — 다음 실행의 본문 추출이 그것부터 본다
+        self.body_profiles = ExtractionProfiles(
+            os.path.join(cache_dir, 'body_profiles.json') if cache_dir else '')
+        # 호스트별 최근 본문 수집 성공 여부 — 받을 순서를 정하고 늘 막히는 호스트는 건너뛴다
+        self.body_hosts = HostHistory(os.path.join(cache_dir, 'body_hosts.json') if cache_dir else '')
 
     def collect_all_news(self) -> Dict[str, Dict[str, List[NewsArticle]]]:
         """
@@ -70,75 +129,240 @@ class NewsAggregator:
         selected = [a for regions in buckets.values() for arts in regions.values() for a in arts]
         self.logger.info(f"Selected {len(selected)} articles; fetching article bodies...")
         if os.getenv('NVIDIA_API_KEY') or os.getenv('NVIDIA_API_KEY_POLITICS'):
-            article_body.enrich(selected)
+            # 같은 날 재실행·재시도는 이미 추출한 본문(과 실패 기록)을 다시 쓴다
+            body_cache = BodyCache(os.path.join(self.cache_dir, 'bodies.json') if self.cache_dir else '')
+            self._enrich_bodies(selected, body_cache)
+            try:
+                body_cache.save()
+                self.body_profiles.save()
+                self.body_hosts.save()
+            except OSError as e:
+                self.logger.warning(f"Body cache not saved: {e}")
 
-        summarizer.summarize_all(buckets)
+        # 기사별 요약 결과 — 같은 날 재실행·재시도는 캐시에 없는 기사만 LLM에 보낸다
+        summary_cache = SummaryCache(os.path.join(self.cache_dir, 'summaries.json') if self.cache_dir else '')
+        # 청크 토큰 추정의 보정 배율 — 응답 usage로 실행마다 다듬는다
+        chunk_planner = ChunkPlanner(os.path.join(self.cache_dir, 'token_usage.json') if self.cache_dir else '')
+        summarizer.summarize_all(buckets, summary_cache, chunk_planner)
+        try:
+            summary_cache.save()
+            chunk_planner.save()
+        except OSError as e:
+            self.logger.warning(f"Summary cache not saved: {e}")
+        self._finish_feed_stats(selected, buckets)
 
         for category, regions in buckets.items():
             for region in REGIONS:
                 # is_important는 요약 단계에서 확정되므로 여기서 최종 정렬
-                regions[region].sort(key=lambda x: (x.is_important, x.published), reverse=True)
+                regions[region].sort(key=lambda x: (x.is_important, x.cluster_size, x.published),
+                                     reverse=True)
             self.logger.info(
                 f"  {category}: 국내 {len(regions['domestic'])} / 해외 {len(regions['overseas'])}"
             )
 
         return buckets
 
+    def _enrich_bodies(self, selected: List[NewsArticle], body_cache: BodyCache) -> None:
+        """받기는 스레드, 추출은 프로세스 풀(body_processes > 1일 때) — 두 단계 시간은 따로 찍힌다."""
+        extract_pool = None
+        if self.body_processes > 1:
+            extract_pool = ProcessPoolExecutor(max_workers=self.body_processes)
+        try:
+            article_body.enrich(selected, cache=body_cache, profiles=self.body_profiles,
+                                hosts=self.body_hosts, extract_pool=extract_pool,
+                                workers=self.body_workers)
+        finally:
+            if extract_pool is not None:
+                # 예산이 끝나 버린 요청의 추출은 기다리지 않는다
+                extract_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _finish_feed_stats(self, selected: List[NewsArticle], buckets) -> None:
+        """요약 단계에서 빠진 기사(분야 무관·제외)를 피드별로 세고 이번 실행 기록을 저장한다."""
+        remaining = {id(a) for regions in buckets.values() for arts in regions.values() for a in arts}
+        for article in selected:
+            if id(article) not in remaining:
+                self.feed_stats.count(article.feed_key, 'off_topic')
+        self.feed_stats.finish_run()
+        try:
+            self.feed_stats.save()
+        except OSError as e:
+            self.logger.warning(f"Feed stats not saved: {e}")
+
     def _collect_raw(self) -> Dict[str, Dict[str, List[NewsArticle]]]:
-        """수집 → 오래된/전날 기사 제거 → 공지성 제거 → 중복 제거 → 매체 균형 선별."""
+        """수집 → 오래된/전날 기사 제거 → 공지성 제거 → 중복 제거 → 같은 사건 묶기 → 매체 균형 선별."""
         raw = {key: {region: [] for region in REGIONS} for key in CATEGORIES}
-        seen_before = load_recent_links(self.raw_data_dir, CROSS_DAY_LOOKBACK_DAYS)
+        # 스냅샷을 다시 열지 않고 seen_index 한 파일에서 날짜 범위로 (정규화 링크 해시)
+        seen_before = load_seen_keys(self.raw_data_dir, CROSS_DAY_LOOKBACK_DAYS)
+        # 새 URL로 다시 온 같은 기사 — 원래 제목·요약의 지문으로 (_keep_fresh)
+        seen_fingerprints = load_seen_fingerprints(self.raw_data_dir, CROSS_DAY_LOOKBACK_DAYS)
         cutoff = datetime.now(timezone.utc) - timedelta(days=MAX_ARTICLE_AGE_DAYS)
-        dropped = {'old': 0, 'seen': 0}
+        feed_cache = FeedCache(os.path.join(self.cache_dir, 'feeds.json') if self.cache_dir else '')
+        feed_stats = self.feed_stats
+        parse_pool = None
+        if self.parse_processes > 1:
+            # 워커마다 seen_before를 한 번만 넘긴다 (피드마다 보내면 수천 개 링크를 80번 직렬화)
+            parse_pool = ProcessPoolExecutor(max_workers=self.parse_processes,
+                                             initializer=init_parse_worker,
+                                             initargs=(cutoff, seen_before))
 
-        def fetch(job):
-            source, category = job
-            collector = RSSCollector(
-                source["id"], source["name"], source["feeds"], source.get("language", "ko")
+        def make_collector(source):
+            return RSSCollector(
+                source["id"], source["name"], source["feeds"], source.get("language", "ko"),
+                feed_cache=feed_cache, feed_stats=feed_stats,
+                cutoff=cutoff, seen_links=seen_before, parse_pool=parse_pool,
             )
+
+        def download(job):
+            source, category = job
+            try:
+                return make_collector(source).download(category)
+            except Exception as e:
+                self.logger.warning(f"[{source['id']}] failed category {category}: {e}")
+                return None
+
+        def parse(job, fetched):
+            source, category = job
             try:
-                articles = collector.collect(category, limit=source.get("limit", 15))
+                return source, category, make_collector(source).parse(
+                    category, fetched, limit=source.get("limit", 15))
             except Exception as e:
                 self.logger.warning(f"[{source['id']}] failed category {category}: {e}")
                 return source, category, []
-            kept = []
-            for article in articles:
-                article.language = source.get("language", "ko")
-                article.region = source.get("region", "domestic")
-                if _is_wire_bulletin(article.title):
-                    continue
-                # 발행일이 추정치인 건(피드에 날짜가 없는 매체) 나이로 거르지 않는다 —
-                # 나중에 기사 메타로 교정되므로 여기서 버리면 멀쩡한 기사를 잃는다
-                if not article.date_is_approximate and article.published < cutoff:
-                    dropped['old'] += 1
-                    continue
-                if _canonical_link(article.link) in seen_before:
-                    dropped['seen'] += 1
-                    continue
-                kept.append(article)
-            return source, category, kept
 
-        jobs = [(s, c) for s in SOURCES for c in s["feeds"]]
-        # 피드 수가 늘어 순차 수집이면 그것만 몇 분 걸린다 — 네트워크 대기라 병렬이 안전
-        with ThreadPoolExecutor(max_workers=12) as pool:
-            for source, category, articles in pool.map(fetch, jobs):
-                raw[category][source.get("region", "domestic")].extend(articles)
+        # SOURCES 선언 순서 그대로면 뒤에 선언된 느린 피드가 맨 마지막에 시작해 수집 단계
+        # 전체가 늘어난다 — 지난 실행들에서 느렸던 피드부터 띄운다(LPT)
+        jobs = []
+        for source in SOURCES:
+            for category in source["feeds"]:
+                key = feed_key(source["id"], category)
+                # 몇 번 연속 쓸 기사를 하나도 못 낸 피드(죽었거나 갱신을 멈춘 곳)는
+                # 받지 않는다 — 주기적으로만 다시 확인한다
+                if feed_stats.should_skip(key):
+                    feed_stats.mark_skipped(key)
+                else:
+                    jobs.append((source, category))
+        jobs = feed_stats.order_slowest_first(
+            jobs, key_of=lambda job: feed_key(job[0]["id"], job[1]),
+        )
+        predicted = self._predict_makespan(jobs, feed_stats)
+        started = time.monotonic()
+        try:
+            if self.collect_mode == 'async':
+                # 다운로드와 파싱이 피드마다 이어서 겹쳐 돈다 — 단계별 시간은 합계로만 본다
+                results = async_collector.collect_all(jobs, make_collector)
+                stage_times = ""
+            else:
+                # 피드 수가 늘어 순차 수집이면 그것만 몇 분 걸린다 — 네트워크 대기라 병렬이 안전.
+                # 다운로드를 다 끝낸 뒤 파싱을 몰아서 해 두 단계의 시간을 따로 잰다
+                with ThreadPoolExecutor(max_workers=FEED_WORKERS) as pool:
+                    downloads = list(pool.map(download, jobs))
+                    io_done = time.monotonic()
+                    results = list(pool.map(parse, jobs, downloads))
+                stage_times = (f"download {io_done - started:.1f}s + "
+                               f"parse {time.monotonic() - io_done:.1f}s, ")
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown()
+        totals = feed_stats.totals()
+        self.logger.info(
+            f"Fetched {len(jobs)} feeds in {time.monotonic() - started:.1f}s "
+            f"({stage_times}predicted makespan {predicted:.1f}s, {self.collect_mode} mode; "
+            f"summed download {totals['fetch_ms'] / 1000:.1f}s, "
+            f"parse {totals['parse_ms'] / 1000:.1f}s in "
+            f"{self.parse_processes if parse_pool else 'no'} parse processes)"
+        )
+        skipped = sum(len(s["feeds"]) for s in SOURCES) - len(jobs)
+        if skipped:
+            self.logger.info(f"Skipped {skipped} feeds with no usable articles in recent runs")
+        for source, category, articles in results:
+            raw[category][source.get("region", "domestic")].extend(
+                self._keep_fresh(source, articles, feed_stats, seen_fingerprints)
+            )
 
+        try:
+            feed_cache.save()
+        except OSError as e:
+            self.logger.warning(f"Feed cache not saved: {e}")
         self.logger.info(
-            f"Filtered out {dropped['old']} stale (>{MAX_ARTICLE_AGE_DAYS}d) "
+            f"Feed cache: {feed_cache.stats['not_modified']} not modified (304), "
+            f"{feed_cache.stats['same_digest']} unchanged body, "
+            f"{feed_cache.stats['refreshed']} re-parsed ({len(feed_cache)} feeds cached)"
+        )
+
+        dropped = feed_stats.totals()
+        self.logger.info(
+            f"Filtered out {dropped['stale']} stale (>{MAX_ARTICLE_AGE_DAYS}d) "
             f"and {dropped['seen']} already-published articles "
-            f"({len(seen_before)} links seen in last {CROSS_DAY_LOOKBACK_DAYS} days)"
+            f"({len(seen_before)} links and {seen_fingerprints.size} story fingerprints "
+            f"seen in last {CROSS_DAY_LOOKBACK_DAYS} days)"
         )
 
+        clustered = 0
         for category in CATEGORIES:
+            deduped = {region: self._remove_duplicates(raw[category][region]) for region in REGIONS}
+            # 같은 사건의 다른 매체 기사는 지역을 가로질러 묶고 대표만 선별·요약에 넘긴다
+            candidates = [a for region in REGIONS for a in deduped[region]]
+            kept = {id(a) for a in cluster_stories(candidates)}
+            clustered += len(candidates) - len(kept)
             for region in REGIONS:
-                articles = self._remove_duplicates(raw[category][region])
+                raw_before = raw[category][region]
+                articles = [a for a in deduped[region] if id(a) in kept]
                 raw[category][region] = self._select_balanced(articles, REGION_ARTICLE_CAP)
+                for article in raw_before:
+                    if id(article) not in kept:
+                        feed_stats.count(article.feed_key, 'dup')
+                for article in raw[category][region]:
+                    feed_stats.count(article.feed_key, 'selected')
+        self.logger.info(f"Merged {clustered} same-story articles into their cluster representatives")
         return raw
 
+    def _predict_makespan(self, jobs, feed_stats: FeedStats) -> float:
+        """
+        지난 지연 기록으로 본 이번 수집 단계의 예상 소요 시간. threads 모드는 워커
+        FEED_WORKERS개에 순서대로 배정, async 모드는 호스트마다 상한만큼의 워커가 있는
+        것으로 보고 가장 늦게 끝나는 호스트를 잡는다.
+        """
+        def latency(job):
+            return feed_stats.expected_latency(feed_key(job[0]["id"], job[1]))
+
+        if self.collect_mode != 'async':
+            return predict_makespan((latency(j) for j in jobs), FEED_WORKERS)
+        by_host = defaultdict(list)
+        for job in jobs:
+            by_host[async_collector.host_of(job[0]["feeds"][job[1]])].append(latency(job))
+        return max((predict_makespan(d, async_collector.PER_HOST_CONCURRENCY)
+                    for d in by_host.values()), default=0.0)
+
+    @staticmethod
+    def _keep_fresh(source: Dict, articles: List[NewsArticle], feed_stats=None,
+                    seen_fingerprints=None) -> List[NewsArticle]:
+        """
+        공지성 기사를 빼고 매체 설정(언어·지역)을 붙인다. 오래된·이미 실은 기사는
+        수집기가 파싱하면서 이미 걸렀다(RSSCollector._drop_reason) — 링크가 바뀐 채 다시 온
+        기사는 여기서 seen_fingerprints(story_fingerprint)로 거르고 seen으로 센다.
+        feed_stats가 있으면 남은 기사를 피드별 깔때기의 fresh로 센다.
+        """
+        kept = []
+        for article in articles:
+            article.language = source.get("language", "ko")
+            article.region = source.get("region", "domestic")
+            if _is_wire_bulletin(article.title):
+                continue
+            # LLM이 제목을 바꾸기 전에 — 스냅샷에 남길 지문도 이것이다
+            article.fingerprint = fingerprint(article.title, article.summary)
+            if seen_fingerprints is not None and seen_fingerprints.match(article.fingerprint):
+                if feed_stats is not None:
+                    feed_stats.count(article.feed_key, 'seen')
+                continue
+            if feed_stats is not None:
+                feed_stats.count(article.feed_key, 'fresh')
+            kept.append(article)
+        return kept
+
     def _remove_duplicates(self, articles: List[NewsArticle]) -> List[NewsArticle]:
         """
-        정규화 제목 완전일치 + 같은 매체 내 근사 중복 제거.
+        정규화 제목 완전일치 + 근사 중복 제거(utils.near_dup — 같은 매체의 재탕과 다른
+        매체의 거의 같은 제목, 기준은 near_dup의 두 임계값).
         근사 중복은 요약이 더 긴(= 내용이 더 상세한) 쪽을 남긴다.
         """
         unique = OrderedDict()
@@ -149,18 +373,11 @@ class NewsAggregator:
                 unique[key] = article
 
         kept: List[NewsArticle] = []
-        tokens_by_source = defaultdict(list)
+        index = NearDupIndex()
         for article in unique.values():
-            tokens = _title_tokens(article.title)
-            duplicate_of = None
-            for index, seen_tokens in tokens_by_source[article.source]:
-                union = tokens | seen_tokens
-                if union and len(tokens & seen_tokens) / len(union) >= _NEAR_DUP_THRESHOLD:
-                    duplicate_of = index
-                    break
-
+            duplicate_of = index.match(article.title, article.source)
             if duplicate_of is None:
-                tokens_by_source[article.source].append((len(kept), tokens))
+                index.add(len(kept), article.title, article.source)
                 kept.append(article)
             elif len(article.summary or '') > len(kept[duplicate_of].summary or ''):
                 kept[duplicate_of] = article  # 더 상세한 쪽으로 교체
@@ -169,7 +386,7 @@ class NewsAggregator:
 
     def _select_balanced(self, articles: List[NewsArticle], cap: int) -> List[NewsArticle]:
         """
-        매체별로 최신순 정렬한 뒤 라운드로빈으로 뽑는다.
+        매체별로 최신순(여러 매체가 다룬 사건 먼저) 정렬한 뒤 라운드로빈으로 뽑는다.
         단순 최신순 상위 N을 자르면 발행이 잦은 매체 한두 곳이 전부 차지한다
         (실측: 경제·문화 카테고리가 매체 2곳으로만 채워졌다).
         """
@@ -177,10 +394,12 @@ class NewsAggregator:
         for article in articles:
             by_source[article.source].append(article)
         for group in by_source.values():
-            group.sort(key=lambda a: a.published, reverse=True)
+            # 여러 매체가 함께 다룬 사건(story_cluster)이 매체 안에서 먼저 뽑힌다
+            group.sort(key=lambda a: (a.cluster_size, a.published), reverse=True)
 
-        # 최신 기사를 가진 매체부터 돌아 같은 순번끼리는 최신순이 되게 한다
-        order = sorted(by_source.values(), key=lambda g: g[0].published, reverse=True)
+        # 최신 기사를 가진 매체부터 돈다 — 매체 안 첫 기사는 묶음 크기순이라 최신이 아닐 수 있어
+        # 매체의 가장 최신 발행 시각으로 비교한다
+        order = sorted(by_source.values(), key=lambda g: max(a.published for a in g), reverse=True)
         selected = []
         for rank in range(max((len(g) for g in order), default=0)):
             for group in order:
@@ -8,8 +8,10 @@ LLM Summarizer Orchestration
 import html
 import os
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .collectors.base_collector import NewsArticle
 from .collectors.sources import CATEGORY_META
@@ -17,6 +19,9 @@ from .utils import llm_client
 from .utils.llm_client import call_llm_json
 from .utils.importance_analyzer import ImportanceAnalyzer, AI_SUBTYPE_LABELS
 from .utils.rss_utils import clean_html, strip_title_prefix
+from .utils.story_cluster import IMPORTANT_CLUSTER_SIZE
+from .utils.chunk_planner import ChunkPlanner
+from .utils.summary_cache import SummaryCache, cache_key, input_digest
 from .utils.logger import setup_logger
 
 logger = setup_logger()
@@ -46,8 +51,8 @@ COMMON_RULES = """당신은 뉴스 요약 보조자입니다. 아래 규칙을 
 # 카테고리 30건을 한 번에 요청하면 한국어 출력이 1.3~1.9토큰/자라 응답이
 # max_tokens에 걸려 배열이 닫히기 전에 잘리고, 그러면 JSON 파싱이 실패해
 # 카테고리 전체가 규칙기반으로 폴백된다(실제로 매일 8개 카테고리 전부 이랬다).
-# 한 번에 8건씩 끊어 요청해 응답이 상한에 닿지 않게 한다.
-CHUNK_SIZE = 8
+# 청크는 기사 수가 아니라 기사별 추정 토큰으로 끊는다(chunk_planner) — 고정 8건은
+# 긴 본문이 몰리면 잘리고 RSS 한 줄짜리만 모이면 호출만 늘었다.
 # max_tokens는 '상한'일 뿐이라 크게 잡아도 응답이 짧으면 지연이 늘지 않는다.
 # 6144로 두었더니 한 청크(8건)의 응답이 배열이 닫히기 전에 잘려 뒷부분 기사가
 # 통째로 규칙기반으로 떨어졌다 — 실측 8/15 발행분에서 국내 청크마다 8~10건씩
@@ -57,15 +62,21 @@ CHUNK_MAX_TOKENS = 10240
 TOP10_MAX_TOKENS = 8192
 
 # 해외 기사는 250자 요약에 600~800자 상세 요약까지 한 호출에서 받으므로
-# 기사당 출력이 3배 이상이다 — 청크를 작게 잡아야 응답이 안 잘린다.
-DETAIL_CHUNK_SIZE = 3
+# 기사당 출력이 3배 이상이다 — 청크 추정도 상세 요약 분량을 따로 잡는다.
 DETAIL_MAX_TOKENS = 8192
 
-# 카테고리마다 전용 API 키를 쓰므로 카테고리 8개를 동시에 돌린다.
-# 카테고리 안쪽 청크 동시 실행은 키 하나에 몰리므로 낮게 유지한다.
-CATEGORY_WORKERS = 8
+# summarize_region을 따로 부를 때(한 카테고리·지역) 청크 동시 실행 수 — 키 하나에
+# 몰리므로 낮게 유지한다. 전체 파이프라인은 전역 스케줄러가 키별 자리만큼 돌린다.
 CHUNK_WORKERS = 3
 
+# 요약 청크는 스트리밍으로 받는다 (llm_client.call_llm stream=True) — 기사 항목이 닫히는
+# 대로 넘겨받아, 시간 예산 마감이나 연결 끊김에도 그때까지 생성된 기사는 살린다
+STREAM_RESPONSES = True
+
+# 요약 프롬프트(a)의 판 — 프롬프트나 응답 형식을 바꾸면 올린다. 요약 캐시 키에 들어가
+# 예전 프롬프트로 받은 결과를 다시 쓰지 않게 한다
+PROMPT_VERSION = 1
+
 
 _SENTENCE_END = re.compile(r'[.!?]\s|다\.\s|요\.\s|다\.$|요\.$')
 # 자르는 위치가 엔티티 안쪽이면 '&quo' 같은 조각이 남아 화면에 그대로 노출된다
@@ -111,25 +122,41 @@ def _rule_based_fallback(article: NewsArticle) -> None:
     """LLM 실패 시 Phase1 규칙기반 동작으로 복귀 (번역은 생략, 원문 그대로 유지)."""
     article.summary = clean_html(article.summary)
     article.summary = strip_title_prefix(article.summary, article.title)
-    article.is_important = _analyzer.analyze(article.title, article.summary)
+    article.is_important = (_analyzer.analyze(article.title, article.summary)
+                            or article.cluster_size >= IMPORTANT_CLUSTER_SIZE)
     # 재시도 스윕 대상 표시 — LLM 실패는 실행마다 편차가 커서(같은 코드로 0%~26%)
     # 한 번 더 훑어주면 그날 운에 따라 품질이 흔들리는 걸 줄일 수 있다
     article.llm_failed = True
 
 
+def _also_reported(article: NewsArticle) -> str:
+    """story_cluster로 묶여 빠진 다른 매체 이름 (요약 입력의 출처 근거)."""
+    names = []
+    for related in article.related_sources:
+        if related["source"] not in names and related["source"] != article.source:
+            names.append(related["source"])
+    return f" +{', '.join(names)}" if names else ""
+
+
 def _summarize_chunk(category_name: str, articles: List[NewsArticle],
-                      api_key: Optional[str] = None, want_detail: bool = False) -> List[NewsArticle]:
+                      api_key: Optional[str] = None, want_detail: bool = False,
+                      cache: Optional[SummaryCache] = None,
+                      planner: Optional[ChunkPlanner] = None) -> List[NewsArticle]:
     """
     한 덩어리를 LLM 1회 호출로 처리. 반환은 남길 기사 목록.
     want_detail=True(해외 기사)면 상세 요약 페이지용 detail_summary도 같이 받는다 —
     별도 호출로 나누면 호출 수가 두 배가 되어 30분 제한에 걸린다.
+    cache가 있으면 받은 항목을 기사별로 남기고, planner가 있으면 응답 usage로
+    토큰 추정을 보정한다.
     """
+    # 기사를 고치기 전에 — 키는 원래 입력으로 정한다
+    keys = [_cache_key(category_name, a) for a in articles] if cache is not None else None
     # 항목 하나는 반드시 한 줄이어야 한다. RSS 요약문(clean_html 통과분)에 개행이
     # 남아 있으면 번호 목록 한 항목이 여러 줄로 쪼개지고, 모델이 번호와 기사를
     # 잘못 대응시켜 일부 기사가 응답에서 누락된다 — 그 기사는 규칙기반으로 떨어진다.
     listing = "\n".join(
-        f"{i + 1}. [{a.source}/{getattr(a, 'language', 'ko')}] "
-        f"{_one_line(a.title)} — {_one_line(getattr(a, 'body', '') or a.summary)}"
+        f"{i + 1}. [{a.source}/{a.language}{_also_reported(a)}] "
+        f"{_one_line(a.title)} — {_one_line(a.body or a.summary)}"
         for i, a in enumerate(articles)
     )
     detail_field = (
@@ -147,7 +174,9 @@ def _summarize_chunk(category_name: str, articles: List[NewsArticle],
         " - summary_250: 최대 250자의 한국어 요약. 제공된 원문에 있는 내용만으로 쓰고,\n"
         "   내용이 부족하면 짧게 끝낼 것 (분량을 채우려고 지어내지 말 것)\n"
         f"{detail_field}"
-        " - is_important: 이 기사가 오늘 이 카테고리에서 특히 중요한 뉴스인지 (true/false)\n"
+        " - is_important: 이 기사가 오늘 이 카테고리에서 특히 중요한 뉴스인지 (true/false).\n"
+        "   출처 옆 '+매체'는 같은 사건을 함께 보도한 다른 매체 — 여러 매체가 다룬 사건일수록\n"
+        "   중요할 가능성이 크다\n"
         f" - off_topic: 이 기사가 '{category_name}' 분야와 무관하면 true "
         "(예: IT 분야에 사형 집행·환전소 기사, 과학 분야에 연예 기사). "
         "분야에 조금이라도 관련되면 false로 둘 것\n"
@@ -158,9 +187,31 @@ def _summarize_chunk(category_name: str, articles: List[NewsArticle],
         f"기사 목록:\n{listing}"
     )
 
+    received = []
+    stored = set()
+
+    def hand_over(item):
+        # 스트림에서 객체가 닫히는 대로 — 뒤에서 끊겨도 이미 받은 기사는 캐시에 남는다
+        received.append(item)
+        try:
+            i = int(item["id"]) - 1
+        except (KeyError, TypeError, ValueError):
+            return
+        if cache is not None and 0 <= i < len(articles) and i not in stored and _complete(item):
+            cache.store(keys[i], item)
+            stored.add(i)
+
+    def observe(usage):
+        if planner is not None:
+            planner.observe(articles, want_detail, COMMON_RULES + user_prompt, usage)
+
     max_tokens = DETAIL_MAX_TOKENS if want_detail else CHUNK_MAX_TOKENS
-    result = call_llm_json(COMMON_RULES, user_prompt, max_tokens=max_tokens, api_key=api_key)
+    result = call_llm_json(COMMON_RULES, user_prompt, max_tokens=max_tokens, api_key=api_key,
+                           stream=STREAM_RESPONSES, on_item=hand_over, on_usage=observe)
     if not isinstance(result, list):
+        # 재프롬프트까지 실패했어도 첫 스트림에서 완성된 항목은 쓴다
+        result = received
+    if not result:
         for article in articles:
             _rule_based_fallback(article)
         return list(articles)
@@ -175,37 +226,65 @@ def _summarize_chunk(category_name: str, articles: List[NewsArticle],
     kept = []
     for i, article in enumerate(articles):
         item = by_id.get(i + 1)
-        if item is None:
-            _rule_based_fallback(article)
+        if item is not None and i not in stored:
+            hand_over(item)
+        if _apply_item(article, item, want_detail):
             kept.append(article)
-            continue
 
-        # 피드 이름과 실제 내용이 다른 경우가 있어(전자신문 '오늘의뉴스'가 IT로
-        # 매핑돼 사형 집행 기사가 올라왔다) 분야 무관 기사도 여기서 걸러낸다.
-        if item.get("exclude") or item.get("off_topic"):
-            continue
+    return kept
 
-        new_title = clean_llm_text(item.get("paraphrased_title"))
-        new_summary = clean_llm_text(item.get("summary_250"))
-        new_summary = strip_title_prefix(new_summary, new_title)
-        if not new_title or not new_summary:
-            _rule_based_fallback(article)
-            kept.append(article)
-            continue
 
-        if getattr(article, "language", "ko") == "en":
-            article.original_title = article.title
-            article.original_summary = clean_html(article.summary)
+def _complete(item: Dict) -> bool:
+    """캐시에 남길 만한 항목인가 — 제외 판정이거나 제목·요약이 다 있는 것."""
+    if item.get("exclude") or item.get("off_topic"):
+        return True
+    return bool(clean_llm_text(item.get("paraphrased_title")) and clean_llm_text(item.get("summary_250")))
 
-        article.title = new_title
-        article.summary = new_summary
-        article.is_important = bool(item.get("is_important"))
-        article.llm_failed = False
-        if want_detail:
-            article.detail_summary = clean_llm_text(item.get("detail_600"))
-        kept.append(article)
 
-    return kept
+def _apply_item(article: NewsArticle, item: Optional[Dict], want_detail: bool) -> bool:
+    """
+    응답 항목 하나(LLM 또는 summary_cache)를 기사에 반영한다. 남길 기사면 True.
+    항목이 없거나 비었으면 규칙기반으로 떨어뜨리고 남긴다.
+    """
+    if item is None:
+        _rule_based_fallback(article)
+        return True
+
+    # 피드 이름과 실제 내용이 다른 경우가 있어(전자신문 '오늘의뉴스'가 IT로
+    # 매핑돼 사형 집행 기사가 올라왔다) 분야 무관 기사도 여기서 걸러낸다.
+    if item.get("exclude") or item.get("off_topic"):
+        return False
+
+    new_title = clean_llm_text(item.get("paraphrased_title"))
+    new_summary = clean_llm_text(item.get("summary_250"))
+    new_summary = strip_title_prefix(new_summary, new_title)
+    if not new_title or not new_summary:
+        _rule_based_fallback(article)
+        return True
+
+    if article.language == "en":
+        article.original_title = article.title
+        article.original_summary = clean_html(article.summary)
+
+    article.title = new_title
+    article.summary = new_summary
+    article.is_important = bool(item.get("is_important"))
+    article.llm_failed = False
+    if want_detail:
+        article.detail_summary = clean_llm_text(item.get("detail_600"))
+    return True
+
+
+def _cache_key(category_name: str, article: NewsArticle) -> str:
+    """
+    요약 캐시 키. 처음 요약에 넘길 때 한 번 정한다 — 폴백이 요약문을 정리하고(clean_html)
+    성공하면 제목이 바뀌므로, 재시도 스윕이 다시 계산하면 재실행의 키와 어긋난다.
+    """
+    if not article.summary_key:
+        digest = input_digest(category_name, article.title, article.body or article.summary)
+        article.summary_key = cache_key(article.canonical_link, digest,
+                                        llm_client.NVIDIA_MODEL, PROMPT_VERSION)
+    return article.summary_key
 
 
 def category_api_key(category_key: str) -> Optional[str]:
@@ -217,40 +296,73 @@ def category_api_key(category_key: str) -> Optional[str]:
 
 
 def summarize_region(category_key: str, category_name: str, articles: List[NewsArticle],
-                      region: str, api_key: Optional[str]) -> List[NewsArticle]:
+                      region: str, api_key: Optional[str],
+                      cache: Optional[SummaryCache] = None,
+                      planner: Optional[ChunkPlanner] = None) -> List[NewsArticle]:
     """
-    한 카테고리·한 지역의 기사를 청크로 끊어 요약한다.
+    한 카테고리·한 지역의 기사를 청크로 끊어 요약한다. 청크는 planner가 토큰 예산에
+    맞춰 나눈다(없으면 이번 호출 안에서만 보정하는 새 planner).
     해외 기사는 상세 요약(detail_600)까지 같은 호출에서 받아 온다 — 페이월 기사는
     원문을 못 가져오니 RSS 요약문 기준으로만 작성된다.
     한 덩어리가 실패해도 그 덩어리만 규칙기반으로 대체되고 나머지는 살아남는다.
+    cache(summary_cache)에 결과가 있는 기사는 호출 없이 반영하고, 청크는 나머지로만 만든다.
+    전체 파이프라인(summarize_all)은 이 함수 대신 전역 스케줄러(_run_chunk_jobs)로 청크를 돌린다.
     """
     if not articles:
         return articles
 
     want_detail = region == "overseas"
-    size = DETAIL_CHUNK_SIZE if want_detail else CHUNK_SIZE
-    chunks = [articles[i:i + size] for i in range(0, len(articles), size)]
+    pending, from_cache = _apply_cached(category_name, articles, want_detail, cache)
+    planner = planner or ChunkPlanner()
+    max_tokens = DETAIL_MAX_TOKENS if want_detail else CHUNK_MAX_TOKENS
+    chunks = planner.plan(pending, want_detail, max_tokens)
 
     # 청크끼리는 서로 의존이 없으므로 병렬로 부른다. 카테고리들도 동시에 도는
     # 상황이라 카테고리 안쪽 동시 실행 수는 낮게 잡는다(키 하나당 rate limit).
-    results = [None] * len(chunks)
     with ThreadPoolExecutor(max_workers=CHUNK_WORKERS) as pool:
-        futures = {
-            pool.submit(_summarize_chunk, category_name, c, api_key, want_detail): i
-            for i, c in enumerate(chunks)
-        }
-        for future in as_completed(futures):
-            i = futures[future]
-            try:
-                results[i] = future.result()
-            except Exception as e:
-                logger.warning(f"[{category_key}/{region}] chunk {i} failed ({e}) — rule-based fallback")
-                for article in chunks[i]:
-                    _rule_based_fallback(article)
-                results[i] = list(chunks[i])
+        results = list(pool.map(
+            lambda c: _run_chunk(category_key, region, category_name, c, api_key, want_detail,
+                                 cache, planner),
+            chunks))
+    return _assemble(articles, results, from_cache)
+
+
+def _apply_cached(category_name: str, articles: List[NewsArticle], want_detail: bool,
+                  cache: Optional[SummaryCache]) -> Tuple[List[NewsArticle], Dict[int, bool]]:
+    """캐시에 있는 기사는 바로 반영한다. (LLM에 보낼 기사, id(기사) → 남길지)."""
+    if cache is None:
+        return list(articles), {}
+    pending = []
+    from_cache = {}
+    for article in articles:
+        item = cache.lookup(_cache_key(category_name, article), need_detail=want_detail)
+        if item is None:
+            pending.append(article)
+        else:
+            from_cache[id(article)] = _apply_item(article, item, want_detail)
+    llm_client.record_cache(len(from_cache), len(pending))
+    return pending, from_cache
+
+
+def _run_chunk(category_key: str, region: str, category_name: str, chunk: List[NewsArticle],
+               api_key: Optional[str], want_detail: bool, cache: Optional[SummaryCache],
+               planner: Optional[ChunkPlanner]) -> List[NewsArticle]:
+    """청크 하나를 요약한다 — 예외가 나도 그 청크만 규칙기반으로 남긴다."""
+    try:
+        return _summarize_chunk(category_name, chunk, api_key, want_detail, cache, planner)
+    except Exception as e:
+        logger.warning(f"[{category_key}/{region}] chunk of {len(chunk)} failed ({e}) — rule-based fallback")
+        for article in chunk:
+            _rule_based_fallback(article)
+        return list(chunk)
+
 
-    # 원래 순서(중요도 정렬 전 최신순)를 유지해서 이어 붙인다
-    return [article for chunk_result in results for article in chunk_result]
+def _assemble(articles: List[NewsArticle], results: List[List[NewsArticle]],
+              from_cache: Dict[int, bool]) -> List[NewsArticle]:
+    """청크 결과와 캐시 반영분을 원래 순서(중요도 정렬 전 최신순)대로 이어 붙인다."""
+    kept = {id(article) for chunk_result in results for article in chunk_result}
+    kept.update(key for key, keep in from_cache.items() if keep)
+    return [article for article in articles if id(article) in kept]
 
 
 def resolve_keys(category_keys: List[str]) -> Dict[str, Optional[str]]:
@@ -293,36 +405,160 @@ def resolve_keys(category_keys: List[str]) -> Dict[str, Optional[str]]:
     return resolved
 
 
-def summarize_all(buckets: Dict[str, Dict[str, List[NewsArticle]]]) -> None:
+def summarize_all(buckets: Dict[str, Dict[str, List[NewsArticle]]],
+                  cache: Optional[SummaryCache] = None,
+                  planner: Optional[ChunkPlanner] = None) -> None:
     """
     {카테고리: {지역: [기사]}} 전체를 in-place로 요약한다.
-    카테고리마다 전용 API 키를 쓰므로 8개 카테고리를 동시에 돌린다 — 순차로 하면
+    카테고리마다 전용 API 키를 쓰므로 키 여러 개에 나눠 동시에 돌린다 — 순차로 하면
     호출 수가 늘어난 만큼 그대로 벽시계 시간이 되어 30분 제한을 넘긴다.
+    cache가 있으면 같은 날 재실행·재시도는 이미 요약한 기사를 다시 보내지 않는다.
+    planner(chunk_planner)는 청크를 한꺼번에 나눈 뒤 응답 usage로 보정한다 — 보정은 재시도 스윕과
+    다음 실행의 청크에 반영된다.
+
+    예전에는 카테고리마다 스레드 하나가 국내 → 해외 → (IT) AI 추출을 차례로 돌렸다.
+    기사가 적은 카테고리의 키는 일찍 놀고, world·it은 청크를 줄줄이 처리하느라 LLM 단계
+    전체가 가장 느린 카테고리의 직렬 사슬만큼 걸렸다. 이제 모든 카테고리·지역의 청크를
+    한 스케줄러(_run_chunk_jobs)에 넣고 큰 청크부터, 자리가 남는 키로 돌린다.
     """
     keys = list(buckets.keys())
     resolved = resolve_keys(keys)
+    planner = planner or ChunkPlanner()
+    home_keys = {key: resolved.get(key) or category_api_key(key) for key in keys}
 
-    def run(category_key):
-        api_key = resolved.get(category_key) or category_api_key(category_key)
-        category_name = CATEGORY_META[category_key]["name"]
+    jobs = []
+    remaining = {}
+    plans = {}  # (카테고리, 지역) → (원래 기사, 캐시 반영분, 청크 결과 목록)
+    lock = threading.Lock()
+
+    def finish(category_key):
+        """카테고리의 마지막 청크가 끝나면 지역별로 이어 붙인다. IT면 AI 항목 추출이 후속 일감."""
         for region in ("domestic", "overseas"):
-            articles = buckets[category_key].get(region) or []
-            buckets[category_key][region] = summarize_region(
-                category_key, category_name, articles, region, api_key
-            )
-        if category_key == "it":
+            articles, from_cache, results = plans[(category_key, region)]
+            buckets[category_key][region] = _assemble(articles, results, from_cache)
+        if category_key != "it":
+            return []
+
+        def extract(api_key):
             for region in ("domestic", "overseas"):
                 extract_ai_items(buckets[category_key][region], api_key)
 
-    keys = list(buckets.keys())
-    with ThreadPoolExecutor(max_workers=min(len(keys), CATEGORY_WORKERS)) as pool:
-        list(pool.map(run, keys))
+        # IT의 마지막 일이라 기다리는 것 없이 바로 돌도록 가장 큰 일감으로 친다
+        return [_ChunkJob(category_key, float("inf"), extract)]
+
+    def chunk_job(category_key, region, chunk, want_detail, results, i):
+        category_name = CATEGORY_META[category_key]["name"]
+
+        def work(api_key):
+            results[i] = _run_chunk(category_key, region, category_name, chunk, api_key,
+                                    want_detail, cache, planner)
+            with lock:
+                remaining[category_key] -= 1
+                last = remaining[category_key] == 0
+            return finish(category_key) if last else []
+
+        cost = sum(planner.estimate(a, want_detail)[1] for a in chunk)
+        return _ChunkJob(category_key, cost, work)
+
+    for category_key in keys:
+        category_name = CATEGORY_META[category_key]["name"]
+        remaining[category_key] = 0
+        for region in ("domestic", "overseas"):
+            articles = buckets[category_key].get(region) or []
+            want_detail = region == "overseas"
+            pending, from_cache = _apply_cached(category_name, articles, want_detail, cache)
+            max_tokens = DETAIL_MAX_TOKENS if want_detail else CHUNK_MAX_TOKENS
+            chunks = planner.plan(pending, want_detail, max_tokens)
+            results = [None] * len(chunks)
+            plans[(category_key, region)] = (articles, from_cache, results)
+            jobs.extend(chunk_job(category_key, region, chunk, want_detail, results, i)
+                        for i, chunk in enumerate(chunks))
+            remaining[category_key] += len(chunks)
+
+    # 캐시로 다 끝난(또는 기사가 없는) 카테고리는 바로 정리한다
+    for category_key in keys:
+        if remaining[category_key] == 0:
+            jobs.extend(finish(category_key))
+
+    _run_chunk_jobs(jobs, home_keys)
+    _retry_failed(buckets, resolved, cache, planner)
+
+
+class _ChunkJob:
+    """
+    전역 스케줄러의 일감 하나 — 청크 요약이나 IT의 AI 항목 추출.
+    cost(추정 출력 토큰)가 큰 것부터 꺼낸다. work(api_key)는 후속 일감 목록을 돌려준다.
+    """
+    __slots__ = ("category_key", "cost", "work")
 
-    _retry_failed(buckets, resolved)
+    def __init__(self, category_key: str, cost: float,
+                 work: Callable[[Optional[str]], Optional[List["_ChunkJob"]]]):
+        self.category_key = category_key
+        self.cost = cost
+        self.work = work
+
+
+def _run_chunk_jobs(jobs: List[_ChunkJob], home_keys: Dict[str, Optional[str]]) -> None:
+    """
+    모든 카테고리의 일감을 워커 풀 하나로 돌린다. 워커는 남은 일감 중 가장 큰 것부터
+    꺼낸다 — 큰 청크가 끝에 남아 혼자 도는 꼬리를 없앤다(LPT). 일감은 제 카테고리 키로
+    보내되, 그 키에 자리가 없으면(맡긴 일감 수가 llm_client.key_capacity에 찼으면) 자리가
+    가장 많이 남는 다른 키가 가져간다.
+    키는 rate limit을 나누려고 카테고리마다 둔 것이라 어느 키로 보내도 결과는 같다.
+    후속 일감(IT AI 추출)은 큐 맨 앞에 넣는다 — 그 카테고리의 마지막 일이다.
+    """
+    if not jobs:
+        return
+    queue = deque(sorted(jobs, key=lambda job: -job.cost))
+    working = sorted({key for key in home_keys.values() if key})
+    lock = threading.Lock()
+    counts = {"done": 0, "stolen": 0}
+    assigned = {key: 0 for key in working}  # 키별로 맡겨 놓고 아직 안 끝난 일감 수
+
+    def pick_key(home: Optional[str]) -> Optional[str]:
+        """lock 안에서 부른다 — 고르는 것과 자리를 잡는 것이 한 번에 일어나야 둘이 같은 자리를 안 본다."""
+        def room(key):
+            return llm_client.key_capacity(key) - assigned[key]
+
+        if home in assigned and (len(working) < 2 or room(home) > 0):
+            return home
+        spare = max(working, key=room) if working else None
+        return spare if spare is not None and (home not in assigned or room(spare) > 0) else home
+
+    def worker():
+        while True:
+            with lock:
+                if not queue:
+                    return
+                job = queue.popleft()
+                home = home_keys.get(job.category_key)
+                api_key = pick_key(home)
+                if api_key in assigned:
+                    assigned[api_key] += 1
+            try:
+                follow_up = job.work(api_key)
+            finally:
+                with lock:
+                    if api_key in assigned:
+                        assigned[api_key] -= 1
+            with lock:
+                counts["done"] += 1
+                counts["stolen"] += api_key != home
+                queue.extendleft(reversed(follow_up or []))
+
+    # 워커 수는 전체 동시 호출 상한만큼 — 더 두면 키 자리를 기다리며 일감만 붙잡고 있다
+    workers = max(1, min(len(jobs), llm_client.concurrency_ceiling()))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(worker) for _ in range(workers)]:
+            future.result()
+    logger.info(f"Ran {counts['done']} LLM jobs with {workers} workers over {len(working)} keys "
+                f"({counts['stolen']} on another category's key)")
 
 
 def _retry_failed(buckets: Dict[str, Dict[str, List[NewsArticle]]],
-                   resolved: Dict[str, Optional[str]]) -> int:
+                   resolved: Dict[str, Optional[str]],
+                   cache: Optional[SummaryCache] = None,
+                   planner: Optional[ChunkPlanner] = None) -> int:
     """
     1차 통과에서 폴백된 기사만 한 번 더 요약한다.
     같은 코드로 같은 시간대에 돌려도 폴백 비율이 0%~26%로 튀는데(429·타임아웃 등
@@ -332,7 +568,7 @@ def _retry_failed(buckets: Dict[str, Dict[str, List[NewsArticle]]],
     """
     failed = {
         key: [a for region in ("domestic", "overseas")
-              for a in buckets[key].get(region, []) if getattr(a, "llm_failed", False)]
+              for a in buckets[key].get(region, []) if a.llm_failed]
         for key in buckets
     }
     total = sum(len(v) for v in failed.values())
@@ -347,27 +583,29 @@ def _retry_failed(buckets: Dict[str, Dict[str, List[NewsArticle]]],
 
     logger.info(f"Retry sweep: {total} articles fell back on the first pass")
 
-    def run(category_key):
-        articles = failed[category_key]
-        if not articles:
-            return
-        api_key = resolved.get(category_key) or category_api_key(category_key)
+    def retry_job(category_key, chunk):
         category_name = CATEGORY_META[category_key]["name"]
-        for start in range(0, len(articles), CHUNK_SIZE):
-            chunk = articles[start:start + CHUNK_SIZE]
+
+        def work(api_key):
             try:
-                # 재시도에서는 want_detail을 끈다 — 상세 요약까지 다시 받으면
-                # 출력이 커져 또 실패할 확률이 높다. 250자 요약을 살리는 게 우선.
-                _summarize_chunk(category_name, chunk, api_key, want_detail=False)
+                _summarize_chunk(category_name, chunk, api_key, want_detail=False, cache=cache,
+                                 planner=planner)
             except Exception as e:
                 logger.warning(f"[{category_key}] retry sweep chunk failed: {e}")
 
-    with ThreadPoolExecutor(max_workers=min(len(buckets), CATEGORY_WORKERS)) as pool:
-        list(pool.map(run, list(buckets.keys())))
+        return _ChunkJob(category_key, sum(planner.estimate(a, False)[1] for a in chunk), work)
+
+    # 재시도에서는 want_detail을 끈다 — 상세 요약까지 다시 받으면
+    # 출력이 커져 또 실패할 확률이 높다. 250자 요약을 살리는 게 우선.
+    # 1차와 같은 전역 스케줄러로 — 실패가 한 카테고리에 몰려도 모든 키가 나눠 든다
+    planner = planner or ChunkPlanner()
+    home_keys = {key: resolved.get(key) or category_api_key(key) for key in buckets}
+    _run_chunk_jobs([retry_job(key, chunk) for key, articles in failed.items()
+                     for chunk in planner.plan(articles, False, CHUNK_MAX_TOKENS)], home_keys)
 
     recovered = total - sum(
         1 for key in buckets for region in ("domestic", "overseas")
-        for a in buckets[key].get(region, []) if getattr(a, "llm_failed", False)
+        for a in buckets[key].get(region, []) if a.llm_failed
     )
     llm_client.LLM_STATS["retry_recovered"] = recovered
     logger.info(f"Retry sweep recovered {recovered}/{total} articles")
@@ -444,7 +682,7 @@ def select_top10(categorized_news: Dict[str, List[NewsArticle]],
         {"category": category, "article": article}
         for category, articles in categorized_news.items()
         for article in sorted(
-            articles, key=lambda a: (a.is_important, a.published), reverse=True
+            articles, key=lambda a: (a.is_important, a.cluster_size, a.published), reverse=True
         )[:TOP10_CANDIDATES_PER_CATEGORY]
     ]
     if not flat:
@@ -453,13 +691,14 @@ def select_top10(categorized_news: Dict[str, List[NewsArticle]],
     listing = "\n".join(
         f"{i + 1}. [{e['category']}] {_one_line(e['article'].title)} — "
         f"{_one_line(e['article'].summary)[:120]} "
-        f"(is_important={e['article'].is_important})"
+        f"(is_important={e['article'].is_important}, sources={e['article'].cluster_size})"
         for i, e in enumerate(flat)
     )
     user_prompt = (
         "입력은 오늘 8개 카테고리에서 요약된 전체 기사 목록입니다. 이 중 오늘 가장 "
         "중요하고 관심도가 높을 것으로 판단되는 10건을 선정하세요 (특정 카테고리에 "
-        "몰리지 않도록 다양성을 고려하되, 중요도가 최우선 기준입니다).\n"
+        "몰리지 않도록 다양성을 고려하되, 중요도가 최우선 기준입니다). sources는 같은 사건을 "
+        "보도한 매체 수입니다.\n"
         "각 항목에 대해:\n"
         " - id: 아래 번호와 동일한 정수\n"
         " - rank: 1~10\n"
@@ -488,8 +727,8 @@ def select_top10(categorized_news: Dict[str, List[NewsArticle]],
                 "link": article.link,
                 "source": article.source,
                 # 해외 기사는 원문이 유료일 수 있어 한국어 상세 요약 링크도 같이 준다
-                "detail_path": getattr(article, "detail_path", ""),
-                "detail_rel": getattr(article, "detail_rel", ""),
+                "detail_path": article.detail_path,
+                "detail_rel": article.detail_rel,
                 "card_headline": clean_llm_text(item.get("card_headline")) or trim_at_boundary(article.title, CARD_HEADLINE_LIMIT),
                 "card_blurb": clean_llm_text(item.get("card_blurb")) or trim_at_boundary(article.summary, CARD_BLURB_LIMIT),
             })
@@ -498,7 +737,8 @@ def select_top10(categorized_news: Dict[str, List[NewsArticle]],
             return cards[:TOP10_COUNT]
 
     logger.warning("Top10 selection failed — falling back to importance+recency sort")
-    flat.sort(key=lambda e: (e["article"].is_important, e["article"].published), reverse=True)
+    flat.sort(key=lambda e: (e["article"].is_important, e["article"].cluster_size,
+                             e["article"].published), reverse=True)
     cards = []
     for rank, entry in enumerate(flat[:TOP10_COUNT], start=1):
         article = entry["article"]
@@ -508,8 +748,8 @@ def select_top10(categorized_news: Dict[str, List[NewsArticle]],
             "category_name": CATEGORY_META[entry["category"]]["name"],
             "link": article.link,
             "source": article.source,
-            "detail_path": getattr(article, "detail_path", ""),
-            "detail_rel": getattr(article, "detail_rel", ""),
+            "detail_path": article.detail_path,
+            "detail_rel": article.detail_rel,
             "card_headline": trim_at_boundary(article.title, CARD_HEADLINE_LIMIT),
             "card_blurb": trim_at_boundary(article.summary, CARD_BLURB_LIMIT),
         })
@@ -0,0 +1,94 @@
+"""
+Adaptive (AIMD) Concurrency per API Key
+llm_client는 요약 시작 전에 살아 있는 키 수로 동시 호출 수를 한 번 정했다(키당 2, 3~16).
+무료 키가 실제로 버티는 동시 요청 수는 키·시간대마다 다르다 — 어떤 날은 키 하나에 4개를
+붙여도 멀쩡하고, 어떤 날은 2개에도 429가 쏟아진다. 고정값은 한쪽에선 처리량을 버리고
+다른 쪽에선 429 재시도로 시간을 버렸다. 429를 받아도 그 스레드만 잠들고, 같은 키의 다른
+스레드는 계속 요청을 보내 또 429를 받았다.
+
+키마다 TCP 혼잡 제어처럼 동시 호출 상한을 조정한다: 성공하면 상한만큼 성공할 때마다 1씩
+늘리고(additive increase), 429·타임아웃이면 절반으로 줄인다(multiplicative decrease).
+같은 혼잡에 물려 있던 요청들의 429가 잇달아 와도 한 번만 줄인다 — 마지막으로 줄인 뒤에
+시작한 요청의 실패만 센다. Retry-After는 그 키 전체의 일시 정지로 반영한다.
+"""
+import threading
+import time
+from typing import Dict, Optional
+
+# 처음 상한 — 예전 고정값(키당 2)에서 출발해 위아래로 찾아간다
+INITIAL_LIMIT = 2.0
+MIN_LIMIT = 1.0
+# 키 하나의 상한의 상한. 전체 동시 호출은 llm_client.set_concurrency가 따로 묶는다
+MAX_LIMIT = 8.0
+DECREASE_FACTOR = 0.5
+# 지연 평균(지수 가중)에서 새 관측의 가중치
+LATENCY_WEIGHT = 0.2
+
+OK, THROTTLED, TIMEOUT, ERROR = "ok", "throttled", "timeout", "error"
+
+
+class AdaptiveLimit:
+    """키 하나의 동시 호출 상한 (스레드 안전). acquire()로 받은 시각을 release()에 돌려준다."""
+
+    def __init__(self, initial: float = INITIAL_LIMIT, floor: float = MIN_LIMIT,
+                 ceiling: float = MAX_LIMIT):
+        self.limit = float(initial)
+        self.floor = floor
+        self.ceiling = ceiling
+        self.in_flight = 0
+        self.peak = 0
+        self.latency: Optional[float] = None
+        self.counts = {OK: 0, THROTTLED: 0, TIMEOUT: 0, ERROR: 0}
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self, ignore_pause: bool = False) -> float:
+        """
+        자리가 날 때까지(그리고 Retry-After 정지가 풀릴 때까지) 기다린다.
+        ignore_pause는 429를 받은 스레드가 정지 시간만큼 이미 잠든 뒤 다시 들어올 때 쓴다.
+        """
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                paused = 0.0 if ignore_pause else self._paused_until - now
+                if paused <= 0 and self.in_flight < int(self.limit):
+                    break
+                self._cond.wait(timeout=paused if paused > 0 else None)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            return now
+
+    def release(self, started: float, outcome: str, pause: Optional[float] = None) -> None:
+        """outcome: OK / THROTTLED / TIMEOUT / ERROR(상한은 그대로). pause는 Retry-After(초)."""
+        now = time.monotonic()
+        with self._cond:
+            self.in_flight -= 1
+            self.counts[outcome] = self.counts.get(outcome, 0) + 1
+            if outcome == OK:
+                elapsed = now - started
+                self.latency = elapsed if self.latency is None else (
+                    self.latency + LATENCY_WEIGHT * (elapsed - self.latency))
+                self.limit = min(self.ceiling, self.limit + 1 / self.limit)
+            elif outcome in (THROTTLED, TIMEOUT) and started >= self._last_decrease:
+                self.limit = max(self.floor, self.limit * DECREASE_FACTOR)
+                self._last_decrease = now
+            if pause:
+                self._paused_until = max(self._paused_until, now + pause)
+            self._cond.notify_all()
+
+    def capacity(self) -> int:
+        """지금 동시에 보낼 수 있는 요청 수 (Retry-After 정지 중이면 0)."""
+        with self._cond:
+            if self._paused_until > time.monotonic():
+                return 0
+            return int(self.limit)
+
+    def gauges(self) -> Dict[str, float]:
+        with self._cond:
+            return {
+                "limit": round(self.limit, 1), "in_flight": self.in_flight, "peak": self.peak,
+                "latency": round(self.latency, 1) if self.latency is not None else None,
+                "ok": self.counts[OK], "throttled": self.counts[THROTTLED],
+                "timeout": self.counts[TIMEOUT],
+            }
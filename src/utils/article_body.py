@@ -8,16 +8,33 @@ RSS description만으로는 요약 근거가 부족한 문제를 보완한다 
 가져오지 못하면 조용히 None을 반환하고 호출부가 기존 RSS 요약문을 그대로 쓴다 —
 언론사가 봇을 차단하거나 레이아웃이 달라도 파이프라인이 멈추지 않는다.
 전체 시간 예산(_BUDGET_SECONDS)을 두어 느린 사이트가 실행 시간을 잡아먹지 않게 한다.
+
+WordPress 계열 피드(연합뉴스TV, TechCrunch, Ars Technica)는 content:encoded에 본문
+전체를 실어 보낸다. 수집 단계가 그걸 body_from_html로 본문으로 만들어 두면
+(body_source="feed") 여기서는 다시 받지 않는다 — 매체별로 아낀 요청 수를 BODY_STATS에 센다.
+이전 실행에서 이미 받은 페이지는 body_cache에서 꺼내 쓴다. 호스트마다 본문이 있던
+컨테이너 경로는 body_profiles에 배워 두고 다음 페이지부터 그 경로를 먼저 본다.
+받는 순서는 body_hosts의 호스트별 성공 기록으로 정하고, 늘 막히는 호스트는 받지 않는다.
+
+받기(_fetch, 스레드)와 추출(extract_page, 순수 함수)은 나뉘어 있다 — 추출은 lxml 파싱·
+XPath·정규식이라 같은 스레드에서 하면 GIL에 묶여 네트워크 슬롯이 논다. enrich에
+extract_pool을 주면 추출은 프로세스에서 돈다.
 """
+import json
 import re
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
 
 import requests
+from lxml import etree
 from lxml import html as lxml_html
+from urllib3.exceptions import ReadTimeoutError
 
+from . import http_client
 from .logger import setup_logger
 
 logger = setup_logger()
@@ -25,10 +42,16 @@ logger = setup_logger()
 _HEADERS = {"User-Agent": "Mozilla/5.0 (NewsAggregator Bot)"}
 _TIMEOUT = 5
 _WORKERS = 8
+# 한 호스트에 동시에 거는 요청 수 — 나머지 워커는 다른 매체를 받는다
+_PER_HOST_WORKERS = 2
 # 실행 '전체'에 걸친 예산이다. 카테고리마다 새로 잡으면 8배가 되어 워크플로
 # 30분 제한을 혼자서 넘긴다(실제로 넘겨서 run이 취소됐다).
 _TOTAL_BUDGET_SECONDS = 300
 _deadline = None
+# 요청 하나의 전체 시간 상한. requests의 timeout은 소켓 연산 하나(연결, recv 한 번)에
+# 대한 것이라, 리다이렉트를 몇 번 타거나 조금씩 흘려보내는 페이지는 _TIMEOUT의 몇 배를
+# 쓴다. 읽는 도중에도 이 시각(과 전체 예산 중 이른 쪽)을 넘기면 받은 데까지만 쓴다.
+_REQUEST_SECONDS = 12
 
 # RSS 요약문이 이보다 짧으면(또는 …로 잘려 있으면) 본문을 시도한다
 _SHORT_SUMMARY_CHARS = 300
@@ -37,10 +60,27 @@ _MIN_BODY_CHARS = 400
 # 카테고리별 전용 API 키로 병렬화한 뒤 여유가 생겨 900 → 1500으로 되돌렸다.
 _MAX_BODY_CHARS = 1500
 
-_DROP_XPATH = (
-    '//script | //style | //noscript | //nav | //header | //footer | //aside '
-    '| //form | //iframe | //figure | //figcaption'
-)
+# 기사 페이지는 인라인 스크립트째 300KB~1MB인데 쓰는 건 본문 1500자뿐이다. 응답을
+# 조금씩 읽다가 본문을 다 받은 것 같으면(<article>이 닫혔거나 문단이 충분히 모였으면)
+# 나머지는 받지 않는다. 어느 쪽도 아니면 _MAX_PAGE_BYTES에서 끊는다.
+_CHUNK_BYTES = 16 * 1024
+_MAX_PAGE_BYTES = 512 * 1024
+# 이보다 짧은 <article>은 '관련기사' 카드다 — 닫혀도 멈추지 않는다 (한글 3바이트 기준)
+_MIN_ARTICLE_BYTES = 3 * _MIN_BODY_CHARS
+# <article>이 없는 레이아웃의 멈춤 기준 — 앞쪽 '관련기사' 문단이 섞여도 본문 후보가
+# _MAX_BODY_CHARS(의 두 배)를 채울 만큼 여유를 둔다
+_ENOUGH_PARAGRAPHS = 40
+# 받기(스레드)와 추출(extract_pool의 프로세스)을 나눠 돌린 시간 합계 — 실행 요약용
+STAGE_SECONDS = {"download": 0.0, "extract": 0.0}
+_stage_lock = threading.Lock()
+# 본문이 아닌 부분 — 파싱하면서 닫히는 대로 트리에서 떼어 낸다
+_NON_BODY_TAGS = {"script", "style", "noscript", "nav", "header", "footer", "aside",
+                  "form", "iframe", "figure", "figcaption"}
+
+# 매체(article.source) → {"from_feed": 피드 전문으로 대신한 건수, "fetched": 받아 온 건수,
+#                        "failed": 시도했지만 못 얻은 건수, "skipped": 막힌 호스트라 안 받은 건수}
+BODY_STATS: Dict[str, Dict[str, int]] = {}
+
 _CONTAINER_XPATH = (
     '//article'
     ' | //div[contains(@id, "article") or contains(@class, "article")]'
@@ -80,115 +120,524 @@ def _node_text(node) -> str:
     return _clean(node.text_content())
 
 
-# 매체마다 property= / name= 을 섞어 쓴다(한겨레는 name=) — 속성명은 가리지 않는다
-_META_DATE_PATTERNS = (
-    re.compile(r'article:published_time["\'][^>]*?content=["\']([^"\']+)', re.I),
-    re.compile(r'content=["\']([^"\']+)["\'][^>]*?article:published_time', re.I),
-    re.compile(r'["\']datePublished["\']\s*:\s*["\']([^"\']+)', re.I),
-)
+# 발행일 메타. 매체마다 property= / name= 을 섞어 쓴다(한겨레는 name=) — 속성명은 가리지 않는다
+_META_DATE_NAMES = {"article:published_time", "datepublished"}
+_JSON_LD_TYPE = "application/ld+json"
 
 
-def extract_published(page_html: str):
-    """기사 페이지 메타태그의 발행일. 한겨레처럼 RSS에 날짜가 없는 매체용."""
-    for pattern in _META_DATE_PATTERNS:
-        match = pattern.search(page_html)
-        if not match:
-            continue
-        try:
-            dt = datetime.fromisoformat(match.group(1).strip().replace("Z", "+00:00"))
-        except ValueError:
-            continue
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
-    return None
+def _passes(text: str) -> bool:
+    return len(text) >= _MIN_BODY_CHARS and _prose_score(text) >= _MIN_PROSE_SCORE
 
 
-def fetch_body(url: str, want_date: bool = False):
+def _node_path(node) -> Optional[str]:
     """
-    기사 본문 텍스트. 못 가져오면 None.
-    want_date=True면 (본문, 발행일) 튜플을 준다 — 발행일도 못 찾으면 None.
+    이긴 컨테이너를 다음 실행에서 다시 찾을 XPath (body_profiles에 남긴다). id에 기사
+    번호가 들어가는 매체(id="article-12345")는 페이지마다 달라 class로, 그것도 없으면
+    태그만으로 찾는다. 따옴표가 섞인 값은 XPath 문자열로 못 쓰니 배우지 않는다.
     """
+    for attr in ("id", "class"):
+        value = node.get(attr)
+        if value and not any(c.isdigit() or c in "\"'" for c in value):
+            return f'//{node.tag}[@{attr}="{value}"]'
+    return f"//{node.tag}" if node.tag == "article" else None
+
+
+def _pick_body(tree) -> Tuple[Optional[str], Optional[str]]:
+    """
+    충분히 길고(_MIN_BODY_CHARS) 산문다운(_MIN_PROSE_SCORE) 후보 중 가장 작은 것을
+    고른다 — 바깥 래퍼일수록 메뉴/공유버튼이 섞이므로 작을수록 좋고, 산문 점수는
+    '관련기사 헤드라인 목록'을 본문으로 착각하는 걸 막는다.
+    반환: (본문, 이긴 컨테이너의 경로). 문단 폴백이면 경로는 None.
+    """
+    candidates = [(text, node) for text, node in
+                  ((_node_text(n), n) for n in tree.xpath(_CONTAINER_XPATH)) if _passes(text)]
+    if candidates:
+        text, node = min(candidates, key=lambda c: len(c[0]))
+        return text[:_MAX_BODY_CHARS], _node_path(node)
+    # 컨테이너를 못 찾는 레이아웃 — 문서 전체 <p>로 폴백
+    fallback = _paragraph_text(tree)
+    return (fallback[:_MAX_BODY_CHARS] if len(fallback) >= _MIN_BODY_CHARS else None), None
+
+
+def _body_at(tree, path: str) -> Optional[str]:
+    """배워 둔 경로만 본다. 같은 기준(길이·산문 점수)을 못 넘기면 None — 전체 탐색으로."""
     try:
-        resp = requests.get(url, headers=_HEADERS, timeout=_TIMEOUT)
-        if not resp.ok or not resp.content:
-            return (None, None) if want_date else None
-
-        published = extract_published(resp.text) if want_date else None
-        tree = lxml_html.fromstring(resp.content)
-        for el in tree.xpath(_DROP_XPATH):
-            parent = el.getparent()
-            if parent is not None:
-                parent.remove(el)
-
-        # 충분히 길고(_MIN_BODY_CHARS) 산문다운(_MIN_PROSE_SCORE) 후보 중
-        # 가장 작은 것을 고른다 — 바깥 래퍼일수록 메뉴/공유버튼이 섞이므로 작을수록 좋고,
-        # 산문 점수는 '관련기사 헤드라인 목록'을 본문으로 착각하는 걸 막는다.
-        candidates = [
-            text for text in (_node_text(n) for n in tree.xpath(_CONTAINER_XPATH))
-            if len(text) >= _MIN_BODY_CHARS and _prose_score(text) >= _MIN_PROSE_SCORE
-        ]
-        if candidates:
-            body = min(candidates, key=len)[:_MAX_BODY_CHARS]
-        else:
-            # 컨테이너를 못 찾는 레이아웃 — 문서 전체 <p>로 폴백
-            fallback = _paragraph_text(tree)
-            body = fallback[:_MAX_BODY_CHARS] if len(fallback) >= _MIN_BODY_CHARS else None
+        nodes = tree.xpath(path)
+    except etree.XPathError:
+        return None
+    texts = [text for text in (_node_text(n) for n in nodes if hasattr(n, "text_content"))
+             if _passes(text)]
+    return min(texts, key=len)[:_MAX_BODY_CHARS] if texts else None
 
-        return (body, published) if want_date else body
+
+def body_from_html(fragment: str) -> Optional[str]:
+    """
+    피드가 준 전문(content:encoded) HTML 조각 → 본문 텍스트. 페이지에서 뽑은 본문과
+    같은 기준(길이·산문 점수)을 통과해야 한다 — 사진 캡션 몇 줄만 있는 전문도 있다.
+    """
+    if not fragment or len(fragment) < _MIN_BODY_CHARS:
+        return None
+    try:
+        tree = lxml_html.fromstring(f"<div>{fragment}</div>")
     except Exception:
-        return (None, None) if want_date else None
+        return None
+    text = _node_text(tree)
+    if not _passes(text):
+        return None
+    return text[:_MAX_BODY_CHARS]
 
 
-def needs_body(article) -> bool:
+def _parse_iso(value) -> Optional[datetime]:
+    if not isinstance(value, str):
+        return None
+    try:
+        dt = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _json_ld_date(data) -> Optional[datetime]:
+    """JSON-LD의 datePublished — @graph·목록 안에 중첩돼 있어도 찾는다."""
+    if isinstance(data, list):
+        for item in data:
+            found = _json_ld_date(item)
+            if found:
+                return found
+    elif isinstance(data, dict):
+        found = _parse_iso(data.get("datePublished"))
+        if found:
+            return found
+        return _json_ld_date(data.get("@graph"))
+    return None
+
+
+class Extracted(NamedTuple):
+    """extract_page 결과 — 프로세스 경계를 넘도록 기본형만 담는다."""
+    body: Optional[str]
+    published: Optional[datetime]   # 메타(article:published_time) 또는 JSON-LD의 발행일
+    hit: Optional[bool]             # 배운 경로로 뽑았으면 True, 안 맞았으면 False, 없었으면 None
+    path: Optional[str]             # 전체 탐색에서 이긴 컨테이너 경로 (배울 것)
+    seconds: float                  # 파싱·추출에 쓴 시간
+
+
+def _drop(el) -> None:
+    """요소를 떼어 낸다. 뒤에 붙은 텍스트(tail)는 본문일 수 있어 앞쪽에 남긴다."""
+    parent = el.getparent()
+    if parent is None:
+        return
+    if el.tail:
+        previous = el.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + el.tail
+        else:
+            parent.text = (parent.text or "") + el.tail
+    parent.remove(el)
+
+
+def extract_page(content: bytes, charset: Optional[str] = None,
+                 learned: Optional[str] = None) -> Extracted:
+    """
+    받은 페이지 바이트 → 본문·발행일 (CPU 단계, 순수 함수 — ProcessPoolExecutor에서 돈다).
+    learned: 이 호스트에서 배워 둔 컨테이너 경로. 있으면 그것부터 보고, 길이·산문 기준을
+    못 넘기면 전체 탐색으로 돌아간다.
+
+    파싱은 이 한 번뿐이다. 발행일 메타·JSON-LD는 해당 요소가 닫힐 때 읽고,
+    스크립트·내비게이션 등 _NON_BODY_TAGS는 닫히는 대로 떼어 낸다 — 응답을 문자열로
+    다시 디코딩해 정규식을 돌리거나, 다 만든 트리를 xpath로 다시 훑어 지우지 않는다.
+    """
+    started = time.perf_counter()
+    # charset은 응답 헤더에 있을 때만 — 없으면 lxml이 <meta charset>을 보고 정한다
+    parser = etree.HTMLPullParser(events=("end",), tag=("meta", *_NON_BODY_TAGS), encoding=charset)
+    parser.set_element_class_lookup(lxml_html.HtmlElementClassLookup())
+    dates = {"meta": None, "json_ld": None}
+
+    def consume() -> None:
+        for _, el in parser.read_events():
+            if el.tag == "meta":
+                name = (el.get("property") or el.get("name") or el.get("itemprop") or "").lower()
+                if name in _META_DATE_NAMES and dates["meta"] is None:
+                    dates["meta"] = _parse_iso(el.get("content"))
+                continue
+            if el.tag == "script" and el.get("type") == _JSON_LD_TYPE and dates["json_ld"] is None:
+                try:
+                    dates["json_ld"] = _json_ld_date(json.loads(el.text or ""))
+                except ValueError:
+                    pass
+            _drop(el)
+
+    for start in range(0, len(content), _CHUNK_BYTES):
+        parser.feed(content[start:start + _CHUNK_BYTES])
+        consume()
+    tree = parser.close() if content else None
+    # 덜 받고 끊은 페이지면 close가 열린 요소를 닫는다 — 그중 본문이 아닌 것도 떼어 낸다
+    consume()
+    published = dates["meta"] or dates["json_ld"]
+    if tree is None:
+        return Extracted(None, published, None, None, time.perf_counter() - started)
+
+    hit = None
+    if learned:
+        body = _body_at(tree, learned)
+        if body:
+            return Extracted(body, published, True, None, time.perf_counter() - started)
+        hit = False
+    body, path = _pick_body(tree)
+    return Extracted(body, published, hit, path, time.perf_counter() - started)
+
+
+def _read_bytes(resp, max_bytes: int, stop_at: float = float("inf")) -> Tuple[bytes, bool]:
+    """
+    응답을 _CHUNK_BYTES씩 읽는다. 본문을 다 받은 것 같으면(충분히 긴 <article>이
+    닫혔거나 </p>가 _ENOUGH_PARAGRAPHS개 모였으면), max_bytes에 닿으면, stop_at(monotonic)을
+    넘기면 멈춘다. 파싱은 하지 않는다 — I/O 스레드가 GIL을 잡지 않게 바이트 검색으로만
+    판단하고, 파싱은 extract_page가 따로 한다.
+    반환: (받은 바이트, 시간 상한으로 끊었는지)
+    """
+    raw = bytearray()
+    paragraphs = 0
+    article_at = -1
+    for chunk in resp.iter_content(_CHUNK_BYTES):
+        # 청크 경계에 걸린 태그도 찾도록 앞 청크의 끝 몇 바이트를 겹쳐 본다
+        overlap = min(len(raw), len(b"</article") - 1)
+        raw.extend(chunk)
+        base = len(raw) - len(chunk) - overlap
+        window = bytes(raw[base:]).lower()
+        # 겹친 부분 안에서 이미 센 </p>는 다시 세지 않는다
+        paragraphs += window.count(b"</p>", max(0, overlap - 3))
+        if article_at < 0:
+            found = window.find(b"<article")
+            article_at = base + found if found >= 0 else -1
+        if article_at >= 0:
+            closed = window.rfind(b"</article")
+            if closed >= 0 and base + closed - article_at >= _MIN_ARTICLE_BYTES:
+                break
+        if paragraphs >= _ENOUGH_PARAGRAPHS or len(raw) >= max_bytes:
+            break
+        if time.monotonic() >= stop_at:
+            return bytes(raw), True
+    return bytes(raw), False
+
+
+def _host(url: str) -> str:
+    host = urlsplit(url).hostname or ""
+    return host[4:] if host.startswith("www.") else host
+
+
+def _learn(profiles, host: str, page: Extracted) -> None:
+    """extract_page의 결과를 호스트별 추출 경로 기록에 반영한다."""
+    if page.hit:
+        profiles.hit(host)
+        return
+    if page.hit is False:
+        profiles.miss(host)
+    if page.path:
+        profiles.learn(host, page.path)
+
+
+def _past_deadline() -> bool:
+    return _deadline is not None and time.monotonic() >= _deadline
+
+
+def _time_stage(stage: str, seconds: float) -> None:
+    with _stage_lock:
+        STAGE_SECONDS[stage] += seconds
+
+
+def _fetch(url: str, want_date: bool, max_bytes: int = _MAX_PAGE_BYTES, profiles=None,
+           extract_pool=None):
+    """
+    (본문, 발행일, 결과, 호스트). 결과는 body_cache에 남기는 값 — "ok", 페이지는 받았지만
+    본문을 못 찾은 "no_body"(JS 리다이렉트·로그인 벽), "http_403" 같은 상태 코드,
+    네트워크 예외 "error", 시간 상한(_REQUEST_SECONDS·전체 예산)이나 소켓 타임아웃에 걸린
+    "timeout" — "timeout"은 페이지 탓이라 할 수 없어 캐시에도 호스트 기록에도 남기지 않는다.
+    호스트는 리다이렉트(단축 링크·Google News) 뒤의 실제 호스트 — 응답을 못 받았으면 "".
+    profiles(body_profiles.ExtractionProfiles)를 주면 호스트별로 배운 컨테이너를 먼저 본다.
+    extract_pool(ProcessPoolExecutor)을 주면 추출을 거기로 넘긴다 — 없으면 이 스레드에서.
+    """
+    nbytes = 0
+    host = ""
+    stop_at = time.monotonic() + _REQUEST_SECONDS
+    if _deadline is not None:
+        stop_at = min(stop_at, _deadline)
+    try:
+        remaining = stop_at - time.monotonic()
+        if remaining <= 0:
+            return None, None, "timeout", host
+        started = time.monotonic()
+        resp = http_client.get(url, headers=_HEADERS, timeout=min(_TIMEOUT, remaining), stream=True)
+        try:
+            # 리다이렉트 뒤의 실제 호스트 기준으로 배우고 기록한다
+            host = _host(getattr(resp, "url", "") or url)
+            if not resp.ok:
+                return None, None, f"http_{resp.status_code}", host
+            content_type = (resp.headers.get("Content-Type") or "").lower()
+            charset = resp.encoding if "charset" in content_type else None
+            content, timed_out = _read_bytes(resp, max_bytes, stop_at)
+            nbytes = len(content)
+        finally:
+            # 덜 읽고 끊은 연결은 재사용할 수 없다 — 닫아서 풀에 돌려준다
+            resp.close()
+            _time_stage("download", time.monotonic() - started)
+        if not content:
+            return None, None, "timeout" if timed_out else "no_body", host
+
+        # 예산이 끝난 뒤까지 남은 스레드는 아무것도 하지 않는다 — enrich는 이미 돌아갔고,
+        # 추출 풀은 닫혔고(submit이 RuntimeError), 추출 경로 기록은 이미 저장됐다
+        if _past_deadline():
+            return None, None, "timeout", host
+        learned = profiles.path_for(host) if profiles is not None else None
+        if extract_pool is not None:
+            page = extract_pool.submit(extract_page, content, charset, learned).result()
+        else:
+            page = extract_page(content, charset, learned)
+        _time_stage("extract", page.seconds)
+        if _past_deadline():
+            return None, None, "timeout", host
+        if profiles is not None:
+            _learn(profiles, host, page)
+
+        published = page.published if want_date else None
+        if page.body:
+            return page.body, published, "ok", host
+        return None, published, "timeout" if timed_out else "no_body", host
+    except Exception as e:
+        return None, None, "timeout" if _timed_out(e) or time.monotonic() >= stop_at else "error", host
+    finally:
+        # stream=True라 http_client가 바이트를 못 셌다 — 실제로 받은 만큼 보고
+        http_client.record(url, nbytes=nbytes)
+
+
+def _timed_out(exc: Exception) -> bool:
+    if isinstance(exc, (requests.Timeout, ReadTimeoutError)):
+        return True
+    # 본문을 읽다 난 소켓 타임아웃은 iter_content가 ConnectionError(ReadTimeoutError)로 감싸 올린다
+    return isinstance(exc, requests.ConnectionError) and any(
+        isinstance(arg, ReadTimeoutError) for arg in exc.args)
+
+
+def fetch_body(url: str, want_date: bool = False, max_bytes: int = _MAX_PAGE_BYTES):
+    """
+    기사 본문 텍스트. 못 가져오면 None.
+    want_date=True면 (본문, 발행일) 튜플을 준다 — 발행일도 못 찾으면 None.
+    max_bytes: 본문을 다 못 봤어도 이만큼 받으면 멈춘다.
+    """
+    body, published, _, _ = _fetch(url, want_date, max_bytes)
+    return (body, published) if want_date else body
+
+
+def _summary_too_short(article) -> bool:
     summary = (article.summary or "").strip()
     return len(summary) < _SHORT_SUMMARY_CHARS or summary.endswith(("...", "…"))
 
 
-def enrich(articles: List) -> int:
+def needs_body(article) -> bool:
+    # 피드 전문으로 이미 본문이 있다. 단, 날짜가 추정치면 페이지 메타로 교정해야 해서 받는다
+    if article.body_source and not article.date_is_approximate:
+        return False
+    return _summary_too_short(article)
+
+
+def _count(source: str, key: str) -> None:
+    entry = BODY_STATS.setdefault(source or "?",
+                                  {"from_feed": 0, "cached": 0, "fetched": 0, "failed": 0,
+                                   "skipped": 0})
+    entry[key] += 1
+
+
+def stats_summary() -> str:
+    """매체별 본문 확보 경로 — 피드 전문으로 아낀 요청 수가 많은 순."""
+    if not BODY_STATS:
+        return "(본문 수집 기록 없음)"
+    rows = sorted(BODY_STATS.items(), key=lambda kv: (-kv[1]["from_feed"], kv[0]))
+    saved = sum(r["from_feed"] for _, r in rows)
+    cached = sum(r["cached"] for _, r in rows)
+    fetched = sum(r["fetched"] for _, r in rows)
+    failed = sum(r["failed"] for _, r in rows)
+    skipped = sum(r["skipped"] for _, r in rows)
+    lines = [f"피드 전문 사용 {saved}건 · 캐시 {cached}건(요청 절약) · "
+             f"페이지에서 확보 {fetched}건 · 실패 {failed}건 · 막힌 호스트 건너뜀 {skipped}건"]
+    width = max(len(source) for source, _ in rows)
+    for source, r in rows:
+        lines.append(f"{source.ljust(width)}  전문 {r['from_feed']} · 캐시 {r['cached']} · "
+                     f"확보 {r['fetched']} · 실패 {r['failed']} · 건너뜀 {r['skipped']}")
+    lines.append(f"받기 합계 {STAGE_SECONDS['download']:.1f}s · 추출 합계 {STAGE_SECONDS['extract']:.1f}s")
+    return "\n".join(lines)
+
+
+def _apply(article, body: Optional[str], published) -> Tuple[int, int]:
+    """받아 온(또는 캐시의) 결과를 기사에 반영. (본문 확보 여부, 날짜 교정 여부)."""
+    filled = dated = 0
+    if body:
+        if not article.body:
+            article.body = body
+            article.body_source = "page"
+        filled = 1
+    # 피드에 날짜가 없어 순서로 추정했던 건 진짜 발행일로 교정
+    if published and article.date_is_approximate:
+        article.published = published
+        article.date_is_approximate = False
+        dated = 1
+    return filled, dated
+
+
+def _target_host(article, hosts) -> str:
+    """
+    스케줄·호스트당 상한·건너뛰기에 쓰는 호스트. 지난 실행에서 리다이렉트로 알아낸 실제
+    호스트가 있으면 그것 — 구글 뉴스 링크 여럿이 한 호스트로 묶이지 않게.
+    """
+    learned = hosts.redirect_for(article.link) if hosts is not None else None
+    return learned or _host(article.link)
+
+
+def _expected_value(article, hosts) -> Tuple[int, float, str]:
+    """
+    정렬 키 (작을수록 먼저). 해외 기사는 600~800자 상세 요약(detail_600)까지 만들어야 해서
+    본문이 없으면 손해가 가장 크다 — 먼저. 그다음은 최근 성공률이 높은 호스트부터.
+    같은 호스트끼리는 붙여 둬서 연결(keep-alive)을 이어 쓴다.
+    """
+    host = _target_host(article, hosts)
+    rate = hosts.expected_rate(host) if hosts is not None else 0.0
+    return (0 if article.region == "overseas" else 1, -rate, host)
+
+
+def _schedule(targets: List, hosts) -> List:
+    """받을 순서로 정렬하고, 늘 실패하는 호스트(body_hosts.should_skip)의 기사는 뺀다."""
+    if hosts is not None:
+        by_host: Dict[str, List] = {}
+        for article in targets:
+            by_host.setdefault(_target_host(article, hosts), []).append(article)
+        kept = []
+        for host, articles in by_host.items():
+            if hosts.should_skip(host):
+                hosts.mark_skipped(host, len(articles))
+                for article in articles:
+                    _count(article.source, "skipped")
+            else:
+                kept.extend(articles)
+        if hosts.skipped_now:
+            logger.info(f"Skipping body fetch for blocked hosts: {sorted(hosts.skipped_now)}")
+        targets = kept
+    return sorted(targets, key=lambda a: _expected_value(a, hosts))
+
+
+def _run_scheduled(targets: List, submit, workers: int = _WORKERS, hosts=None):
+    """
+    정렬된 targets를 순서대로 넣되 한 호스트(_target_host)에 동시에 _PER_HOST_WORKERS개까지만
+    — 워커 여러 개가 한 매체에 몰리면 그 매체의 봇 차단(429)을 부르고 나머지 매체가 논다.
+    (기사, 본문, 발행일, 결과, 실제 호스트)를 끝나는 대로 내놓는다. 예산이 끝나면 남은 건 포기한다 —
+    끝날 때를 기다리지 않고 예산 시각에 깨어나 바로 돌아간다.
+    """
+    queue = [(article, _target_host(article, hosts)) for article in targets]
+    running: Dict = {}
+    per_host: Dict[str, int] = {}
+    while queue or running:
+        # 빈 자리를 순서상 가장 앞선, 자리가 남은 호스트의 기사로 채운다
+        index = 0
+        while len(running) < workers and index < len(queue) and time.monotonic() < _deadline:
+            host = queue[index][1]
+            if per_host.get(host, 0) >= _PER_HOST_WORKERS:
+                index += 1
+                continue
+            article, host = queue.pop(index)
+            per_host[host] = per_host.get(host, 0) + 1
+            running[submit(article)] = article, host
+        done, _ = wait(running, timeout=max(0.0, _deadline - time.monotonic()),
+                       return_when=FIRST_COMPLETED)
+        for future in done:
+            article, host = running.pop(future)
+            per_host[host] -= 1
+            try:
+                body, published, outcome, resolved = future.result()
+            except Exception:
+                body, published, outcome, resolved = None, None, "error", ""
+            yield article, body, published, outcome, resolved or host
+        if time.monotonic() >= _deadline and (queue or running):
+            # 남은 건은 포기 — RSS 요약문으로 진행한다. 돌고 있는 요청은 enrich가
+            # 기다리지 않고 풀을 닫는다(각자 stop_at에서 알아서 끝난다)
+            logger.warning(f"Article body fetch budget exhausted — abandoning {len(running)} "
+                           f"in-flight and {len(queue)} queued, using RSS summaries for the rest")
+            return
+
+
+def enrich(articles: List, cache=None, profiles=None, hosts=None, extract_pool=None,
+           workers: Optional[int] = None) -> int:
     """
     요약 근거가 부족한 기사에 article.body를 채운다 (in-place).
     반환값은 실제로 본문을 확보한 건수.
+    cache(body_cache.BodyCache)를 주면 먼저 거기서 찾고 — 실패 기록도 '다시 받지 않음'으로
+    쓴다 — 새로 받은 결과를 남긴다.
+    profiles(body_profiles.ExtractionProfiles)를 주면 호스트별로 배운 컨테이너 경로를 먼저 쓴다.
+    hosts(body_hosts.HostHistory)를 주면 해외·성공률 높은 호스트 순으로 받고, 늘 실패하는
+    호스트는 건너뛰고, 결과를 리다이렉트 뒤의 실제 호스트로 거기에 남긴다.
+    extract_pool(ProcessPoolExecutor)을 주면 lxml 파싱·추출을 거기서 한다 — 받기 스레드
+    workers개(기본 _WORKERS)가 파싱에 GIL을 잡지 않고 네트워크만 기다린다.
     """
     global _deadline
     if _deadline is None:
         _deadline = time.monotonic() + _TOTAL_BUDGET_SECONDS
 
+    for article in articles:
+        if article.body_source == "feed" and _summary_too_short(article) \
+                and not needs_body(article):
+            _count(article.source, "from_feed")
     targets = [a for a in articles if a.link and needs_body(a)]
     if not targets:
         return 0
-    if time.monotonic() > _deadline:
-        logger.warning("Article body budget already spent — using RSS summaries")
-        return 0
 
     filled = 0
     dated = 0
-    with ThreadPoolExecutor(max_workers=_WORKERS) as pool:
-        futures = {
-            pool.submit(fetch_body, a.link, getattr(a, "date_is_approximate", False)): a
-            for a in targets
-        }
-        for future in as_completed(futures):
-            if time.monotonic() > _deadline:
-                # 남은 건은 포기 — RSS 요약문으로 진행한다
-                for f in futures:
-                    f.cancel()
-                logger.warning("Article body fetch budget exhausted — using RSS summaries for the rest")
-                break
-            article = futures[future]
-            try:
-                result = future.result()
-            except Exception:
-                result = None
-            body, published = result if isinstance(result, tuple) else (result, None)
-            if body:
-                article.body = body
-                filled += 1
-            # 피드에 날짜가 없어 순서로 추정했던 건 진짜 발행일로 교정
-            if published and getattr(article, "date_is_approximate", False):
-                article.published = published
-                article.date_is_approximate = False
-                dated += 1
-
-    logger.info(f"Article bodies fetched: {filled}/{len(targets)} attempted, {dated} dates corrected")
+    cached = 0
+    if cache is not None:
+        remaining = []
+        for article in targets:
+            hit = cache.lookup(article.link, article.canonical_link)
+            if hit is None:
+                remaining.append(article)
+                continue
+            got, fixed = _apply(article, hit["body"], hit["published"])
+            filled, dated = filled + got, dated + fixed
+            cached += 1
+            _count(article.source, "cached")
+        targets = remaining
+    if targets and time.monotonic() > _deadline:
+        logger.warning("Article body budget already spent — using RSS summaries")
+        targets = []
+    targets = _schedule(targets, hosts)
+
+    # with 블록을 쓰지 않는다 — 빠져나갈 때 돌고 있는 요청이 끝나길 기다려서, 예산이
+    # 끝난 뒤에도 요청 하나의 최대 시간만큼 단계가 늘어난다
+    workers = workers or _WORKERS
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        # 캐시에 남길 거면 발행일도 같이 뽑아 둔다 — 다음 실행에서 날짜 교정에 쓸 수 있게
+        def submit(article):
+            want_date = cache is not None or article.date_is_approximate
+            return pool.submit(_fetch, article.link, want_date, _MAX_PAGE_BYTES, profiles, extract_pool)
+
+        for article, body, published, outcome, host in _run_scheduled(targets, submit, workers, hosts):
+            # 시간 상한에 잘린 건 페이지 탓이 아니다(느린 망·전체 예산) — 음성 캐시에 넣어
+            # 같은 날 재실행에서 건너뛰거나 호스트 실패율에 세지 않는다
+            timed_out = outcome == "timeout"
+            if cache is not None and not timed_out:
+                cache.store(article.link, body, published, outcome, article.canonical_link)
+            if hosts is not None and host != _host(article.link):
+                hosts.learn_redirect(article.link, host)
+            if hosts is not None and not timed_out:
+                hosts.record(host, outcome == "ok")
+            got, fixed = _apply(article, body, published)
+            filled, dated = filled + got, dated + fixed
+            _count(article.source, "fetched" if got else "failed")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    logger.info(
+        f"Article bodies fetched: {filled}/{len(targets) + cached} attempted "
+        f"({cached} from cache), {dated} dates corrected; "
+        f"summed download {STAGE_SECONDS['download']:.1f}s in {workers} threads, "
+        f"extract {STAGE_SECONDS['extract']:.1f}s "
+        f"{'in worker processes' if extract_pool is not None else 'in the same threads'}"
+    )
     return filled
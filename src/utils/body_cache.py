@@ -0,0 +1,104 @@
+"""
+Persistent Article Body Cache
+article_body.fetch_body는 매 실행 대상 기사 페이지를 전부 다시 받아 다시 추출한다 —
+같은 날 재실행이나 workflow_dispatch 재시도에서도. 정규화 링크(_canonical_link)마다
+추출한 본문·발행일·결과(실패 포함)·시각을 남겨 두고 enrich가 먼저 여기를 본다.
+재실행은 300초 예산을 새 URL에만 쓴다.
+
+실패도 기록한다 — 403을 주거나 JS 리다이렉트만 있는 호스트는 매번 같은 결과인데
+타임아웃까지 예산을 잡아먹는다. 다만 일시적인 실패일 수 있어 성공보다 짧게 둔다.
+data/ 아래에 커밋되는 파일이라 나이(TTL)와 전체 크기(오래 안 쓴 것부터)로 줄인다.
+"""
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from .dedup import _canonical_link
+from .json_store import load_json, save_json
+
+# 기사는 MAX_ARTICLE_AGE_DAYS(3일)가 지나면 다시 실리지 않는다 — 그 뒤의 본문은 쓸 일이 없다
+TTL_DAYS = 3
+# 실패 기록은 같은 날 재실행만 건너뛰게 — 다음 날 정기 실행에서는 다시 시도한다
+NEGATIVE_TTL_HOURS = 12
+MAX_BYTES = 4 * 1024 * 1024
+
+OK = "ok"
+
+
+class BodyCache:
+    """canonical link → {body, published, outcome, at, used} (스레드 안전)."""
+
+    def __init__(self, path: str = "", ttl_days: float = TTL_DAYS,
+                 negative_ttl_hours: float = NEGATIVE_TTL_HOURS, max_bytes: int = MAX_BYTES):
+        self.path = path
+        self.ttl = ttl_days * 86400
+        self.negative_ttl = negative_ttl_hours * 3600
+        self.max_bytes = max_bytes
+        self._records: Dict[str, Dict] = load_json(path, {}) if path else {}
+        self._lock = threading.Lock()
+        self.stats = {"hit": 0, "negative_hit": 0, "miss": 0, "stored": 0}
+
+    def _fresh(self, record: Dict, now: float) -> bool:
+        ttl = self.ttl if record.get("outcome") == OK else self.negative_ttl
+        return now - record.get("at", 0) <= ttl
+
+    def lookup(self, link: str, canonical: str = "") -> Optional[Dict]:
+        """
+        유효한 기록이면 {"body", "published"(datetime|None), "outcome"}. 없거나 만료면 None.
+        실패 기록이면 body가 None이다 — 호출부는 다시 받지 않고 RSS 요약으로 간다.
+        canonical은 이미 정규화한 링크(NewsArticle.canonical_link)가 있으면 넘긴다.
+        """
+        key = canonical or _canonical_link(link)
+        now = time.time()
+        with self._lock:
+            record = self._records.get(key)
+            if record is None or not self._fresh(record, now):
+                self.stats["miss"] += 1
+                return None
+            record["used"] = now
+            self.stats["hit" if record.get("outcome") == OK else "negative_hit"] += 1
+        published = None
+        if record.get("published"):
+            try:
+                published = datetime.fromisoformat(record["published"])
+            except ValueError:
+                pass
+        return {"body": record.get("body") or None, "published": published,
+                "outcome": record.get("outcome", "")}
+
+    def store(self, link: str, body: Optional[str], published: Optional[datetime],
+              outcome: str, canonical: str = "") -> None:
+        now = time.time()
+        record = {
+            "body": body or "",
+            "published": published.isoformat() if published else "",
+            "outcome": outcome,
+            "at": now,
+            "used": now,
+        }
+        with self._lock:
+            self._records[canonical or _canonical_link(link)] = record
+            self.stats["stored"] += 1
+
+    def _evict(self, now: float) -> None:
+        self._records = {k: r for k, r in self._records.items() if self._fresh(r, now)}
+        sizes = {k: len(json.dumps(r, ensure_ascii=False).encode("utf-8"))
+                 for k, r in self._records.items()}
+        total = sum(sizes.values())
+        for key in sorted(self._records, key=lambda k: self._records[k].get("used", 0)):
+            if total <= self.max_bytes:
+                break
+            total -= sizes[key]
+            del self._records[key]
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            self._evict(time.time())
+            save_json(self.path, self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
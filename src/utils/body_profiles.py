@@ -0,0 +1,89 @@
+"""
+Per-host Body Extraction Profiles
+fetch_body는 페이지마다 넓은 _CONTAINER_XPATH 합집합을 돌려 후보 전부의 텍스트와
+산문 점수를 계산하고 가장 작은 것을 고른다. 매일 같은 매체 십여 곳에서 같은 컨테이너가
+이긴다(한겨레 div.article-text, BBC article 등) — 호스트마다 이긴 경로를 남겨 두고
+다음엔 그 경로만 먼저 본다. 길이·산문 기준을 못 넘기면(개편, 다른 유형의 페이지)
+전체 탐색으로 돌아가고 새로 이긴 경로를 배운다.
+
+실행마다 호스트별 적중/실패를 세어 요약에 보여 준다 — 적중률이 낮은 호스트는
+컨테이너 id에 기사 번호가 들어가는 등 경로를 배울 수 없는 곳이다.
+"""
+import threading
+import time
+from typing import Dict, Optional
+
+from .json_store import load_json, save_json
+
+# 이만큼 안 쓴 호스트(목록에서 빠진 매체)는 저장할 때 버린다
+MAX_AGE_DAYS = 30
+
+
+class ExtractionProfiles:
+    """host → {"path": 이긴 컨테이너 XPath, "used": 마지막 사용 시각} (스레드 안전)."""
+
+    def __init__(self, path: str = ""):
+        self.path = path
+        self._records: Dict[str, Dict] = load_json(path, {}) if path else {}
+        self._lock = threading.Lock()
+        # 이번 실행: host → {"hit": 저장 경로로 바로 뽑음, "miss": 전체 탐색으로 돌아감,
+        #                    "learned": 새 경로를 배움}
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, host: str, key: str) -> None:
+        entry = self.stats.setdefault(host, {"hit": 0, "miss": 0, "learned": 0})
+        entry[key] += 1
+
+    def path_for(self, host: str) -> Optional[str]:
+        with self._lock:
+            record = self._records.get(host)
+            return record["path"] if record else None
+
+    def hit(self, host: str) -> None:
+        with self._lock:
+            self._records[host]["used"] = time.time()
+            self._count(host, "hit")
+
+    def miss(self, host: str) -> None:
+        with self._lock:
+            self._count(host, "miss")
+
+    def learn(self, host: str, path: str) -> None:
+        with self._lock:
+            previous = self._records.get(host)
+            self._records[host] = {"path": path, "used": time.time()}
+            if not previous or previous["path"] != path:
+                self._count(host, "learned")
+
+    def summary(self) -> str:
+        """이번 실행의 호스트별 적중률 — 적중률이 낮은 순."""
+        with self._lock:
+            rows = {host: dict(counts) for host, counts in self.stats.items()}
+        if not rows:
+            return "(추출 경로 기록 없음)"
+        hits = sum(r["hit"] for r in rows.values())
+        tried = sum(r["hit"] + r["miss"] for r in rows.values())
+        lines = [f"저장 경로 적중 {hits}/{tried}건 · 호스트 {len(rows)}곳 · "
+                 f"새로 배움 {sum(r['learned'] for r in rows.values())}곳"]
+        width = max(len(host) for host in rows)
+
+        def rate(r):
+            total = r["hit"] + r["miss"]
+            return r["hit"] / total if total else 0.0
+
+        for host, r in sorted(rows.items(), key=lambda kv: (rate(kv[1]), kv[0])):
+            lines.append(f"{host.ljust(width)}  적중 {r['hit']}/{r['hit'] + r['miss']}"
+                         + (" · 새 경로" if r["learned"] else ""))
+        return "\n".join(lines)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        now = time.time()
+        with self._lock:
+            self._records = {host: r for host, r in self._records.items()
+                             if now - r.get("used", 0) <= MAX_AGE_DAYS * 86400}
+            save_json(self.path, self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
@@ -0,0 +1,171 @@
+"""
+Token-budgeted Summary Chunks
+요약 청크를 기사 수(국내 8건, 해외 3건)로 고정해 끊었더니 기사 길이와 무관하게 같은 크기가
+됐다. 본문 1,500자짜리 8건은 max_tokens에 걸려 잘리고(규칙기반 폴백), RSS 한 줄짜리 8건은
+응답이 짧아 호출만 늘었다. 한국어 출력이 1.3~1.9토큰/자라 건수로는 응답 크기를 못 맞춘다.
+
+기사마다 입력·출력 토큰을 추정해 출력 예산(OUTPUT_BUDGET_TOKENS, max_tokens의 일부)을
+채우도록 청크를 묶는다. 청크 수는 예산이 허락하는 최소로 잡고 그 안에서 고르게 나눈다 —
+병렬로 도는 청크가 비슷한 때 끝나야 카테고리가 빨리 끝난다.
+
+추정은 응답의 usage(prompt_tokens / completion_tokens)로 보정한다. 보정 배율은 지수 평균으로
+data/cache/token_usage.json에 남겨 다음 실행이 이어 쓴다. 응답이 max_tokens에 잘렸으면
+(finish_reason "length") 실제 출력은 그보다 컸다는 뜻이라 배율을 넉넉히 올린다.
+"""
+import math
+import re
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .json_store import load_json, save_json
+
+# 한글은 1.3~1.9토큰/자(실측), 영문·숫자·공백은 4자에 1토큰 남짓
+HANGUL_TOKENS_PER_CHAR = 1.6
+OTHER_TOKENS_PER_CHAR = 0.3
+
+# 출력 추정 (한국어). 요약은 '최대' 250자라 입력이 짧으면 응답도 짧다(프롬프트 7번 규칙)
+TITLE_CHARS = 40
+SUMMARY_CHARS = 250
+DETAIL_CHARS = 800
+# 입력 1자당 요약이 쓰는 글자 수 — RSS 한 줄(80자)짜리 기사는 요약도 한두 문장이다
+SUMMARY_PER_INPUT_CHAR = 0.6
+DETAIL_PER_INPUT_CHAR = 1.0
+MIN_SUMMARY_CHARS = 60
+# 항목의 JSON 키·불리언·id
+ITEM_OVERHEAD_TOKENS = 45
+
+# 청크 하나의 출력 예산. 생성이 40토큰/초 안팎이라 5,600이면 140초 남짓 —
+# call_llm timeout(180초) 안에 끝난다. max_tokens의 MAX_TOKENS_FILL 이상은 잡지 않아
+# 추정이 빗나가도 배열이 닫힐 여유를 둔다
+OUTPUT_BUDGET_TOKENS = 5600
+MAX_TOKENS_FILL = 0.7
+# 입력(프롬프트) 예산 — 본문 1,500자 기사가 몰려도 프롬프트가 끝없이 커지지 않게
+INPUT_BUDGET_TOKENS = 24000
+# 번호 목록이 길수록 모델이 번호와 기사를 잘못 짝짓는 일이 잦다
+MAX_CHUNK_ARTICLES = 16
+
+# 보정 배율: 새 관측의 가중치, 허용 범위, 잘린 응답에서 올리는 여유
+LEARNING_RATE = 0.3
+MIN_SCALE, MAX_SCALE = 0.5, 3.0
+TRUNCATED_MARGIN = 1.25
+
+_HANGUL = re.compile(r"[가-힣ㄱ-ㅎㅏ-ㅣ]")
+
+
+def text_tokens(text: str) -> float:
+    """보정 전 토큰 추정 — 한글과 그 밖의 글자를 따로 센다."""
+    if not text:
+        return 0.0
+    hangul = len(_HANGUL.findall(text))
+    return hangul * HANGUL_TOKENS_PER_CHAR + (len(text) - hangul) * OTHER_TOKENS_PER_CHAR
+
+
+def _input_text(article) -> str:
+    return f"{article.source} {article.title or ''} {article.body or article.summary or ''}"
+
+
+class ChunkPlanner:
+    """
+    기사 목록을 토큰 예산에 맞는 청크로 나누고, 응답 usage로 추정을 보정한다 (스레드 안전).
+    path가 ''면 보정 배율을 저장하지 않는다(이번 실행 안에서만 배운다).
+    """
+
+    def __init__(self, path: str = ""):
+        self.path = path
+        state = load_json(path, {}) if path else {}
+        self.input_scale = _clamp(state.get("input_scale", 1.0))
+        saved = state.get("output_scale") or {}
+        self.output_scale = {mode: _clamp(saved.get(mode, 1.0)) for mode in ("summary", "detail")}
+        self.samples = int(state.get("samples", 0))
+        self._lock = threading.Lock()
+
+    def estimate(self, article, want_detail: bool) -> Tuple[float, float]:
+        """기사 하나의 (입력, 출력) 토큰 추정 — 보정 배율 반영."""
+        raw_in, raw_out = self._raw(article, want_detail)
+        mode = "detail" if want_detail else "summary"
+        return raw_in * self.input_scale, raw_out * self.output_scale[mode]
+
+    @staticmethod
+    def _raw(article, want_detail: bool) -> Tuple[float, float]:
+        text = _input_text(article)
+        body_chars = len(article.body or article.summary or "")
+        chars = TITLE_CHARS + min(SUMMARY_CHARS, max(MIN_SUMMARY_CHARS, body_chars * SUMMARY_PER_INPUT_CHAR))
+        if want_detail:
+            chars += min(DETAIL_CHARS, max(MIN_SUMMARY_CHARS, body_chars * DETAIL_PER_INPUT_CHAR))
+        return text_tokens(text), chars * HANGUL_TOKENS_PER_CHAR + ITEM_OVERHEAD_TOKENS
+
+    def plan(self, articles: Sequence, want_detail: bool, max_tokens: int) -> List[List]:
+        """
+        순서를 유지한 채 연속 구간으로 나눈다. 청크 수는 출력·입력 예산과 MAX_CHUNK_ARTICLES를
+        모두 지키는 최소, 구간은 추정 출력이 고르게 되도록 자른다.
+        """
+        if not articles:
+            return []
+        costs = [self.estimate(a, want_detail) for a in articles]
+        out_budget = min(OUTPUT_BUDGET_TOKENS, max_tokens * MAX_TOKENS_FILL)
+        total_in = sum(c[0] for c in costs)
+        total_out = sum(c[1] for c in costs)
+        count = max(1, math.ceil(total_out / out_budget), math.ceil(total_in / INPUT_BUDGET_TOKENS),
+                    math.ceil(len(articles) / MAX_CHUNK_ARTICLES))
+        share = total_out / count
+
+        chunks: List[List] = []
+        current: List = []
+        used_in = used_out = 0.0
+        for article, (cost_in, cost_out) in zip(articles, costs):
+            # 다음 기사의 절반이 몫을 넘기면 여기서 끊는다 — 몫 근처에서 고르게 잘린다
+            if current and (used_out + cost_out > out_budget or used_in + cost_in > INPUT_BUDGET_TOKENS
+                            or len(current) >= MAX_CHUNK_ARTICLES
+                            or (len(chunks) < count - 1 and used_out + cost_out / 2 > share)):
+                chunks.append(current)
+                current, used_in, used_out = [], 0.0, 0.0
+            current.append(article)
+            used_in += cost_in
+            used_out += cost_out
+        chunks.append(current)
+        return chunks
+
+    def observe(self, articles: Sequence, want_detail: bool, prompt_text: str,
+                usage: Optional[Dict]) -> None:
+        """
+        청크 호출 하나의 usage를 반영한다. prompt_text는 실제로 보낸 system + user 프롬프트.
+        usage가 없으면(스트림이 끊겼거나 서버가 안 줬으면) 아무것도 안 한다.
+        """
+        if not usage or not articles:
+            return
+        mode = "detail" if want_detail else "summary"
+        prompt_tokens = usage.get("prompt_tokens") or 0
+        completion_tokens = usage.get("completion_tokens") or 0
+        raw_in = text_tokens(prompt_text)
+        raw_out = sum(self._raw(a, want_detail)[1] for a in articles)
+        with self._lock:
+            if prompt_tokens and raw_in:
+                self.input_scale = _blend(self.input_scale, prompt_tokens / raw_in)
+            if completion_tokens and raw_out:
+                observed = completion_tokens / raw_out
+                if usage.get("finish_reason") == "length":
+                    # 잘린 응답의 출력 토큰은 하한일 뿐이다 — 평균하지 않고 바로 올린다
+                    self.output_scale[mode] = _clamp(max(self.output_scale[mode], observed * TRUNCATED_MARGIN))
+                else:
+                    self.output_scale[mode] = _blend(self.output_scale[mode], observed)
+            self.samples += 1
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            state = {"input_scale": round(self.input_scale, 4),
+                     "output_scale": {mode: round(v, 4) for mode, v in self.output_scale.items()},
+                     "samples": self.samples}
+        save_json(self.path, state)
+
+
+def _clamp(value) -> float:
+    try:
+        return min(MAX_SCALE, max(MIN_SCALE, float(value)))
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def _blend(current: float, observed: float) -> float:
+    return _clamp(current + LEARNING_RATE * (observed - current))
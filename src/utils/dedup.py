@@ -36,6 +36,7 @@ def load_recent_links(raw_data_dir: str, days: int = 7, today=None) -> set:
     같은 기사가 며칠씩 피드에 남아 있어 어제 실린 기사가 오늘 또 올라온다
     (실측: 287건 중 61건, 21%). 제목은 LLM이 매일 다르게 재서술해서 못 잡고
     URL이 유일하게 안정적인 키다.
+    수집은 seen_index를 읽는다 — 이건 인덱스가 없을 때 스냅샷에서 만드는 데(backfill)만 쓴다.
     """
     if not raw_data_dir or not os.path.isdir(raw_data_dir):
         return set()
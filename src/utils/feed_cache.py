@@ -0,0 +1,151 @@
+"""
+Conditional-GET Feed Cache
+피드 80여 개를 매 실행 통째로 다시 받아 feedparser로 다시 파싱하는데, 상당수
+(CNN·WSJ·경향 과학)는 며칠씩 내용이 그대로다. URL마다 검증자(ETag/Last-Modified)와
+파싱된 항목을 저장해 두고 If-None-Match/If-Modified-Since를 보낸다 — 304면
+저장해 둔 항목을 그대로 쓴다. 검증자를 안 주는 서버도 있어 응답 본문 해시가
+같으면 파싱을 건너뛴다.
+
+data/ 아래에 커밋되는 파일이라 무한정 커지면 안 된다 — 오래 안 쓴 피드(목록에서
+빠진 것)는 나이로, 전체 크기가 상한을 넘으면 가장 오래 안 쓴 것부터 버린다.
+"""
+import hashlib
+import json
+import threading
+import time
+from typing import Dict, List, Optional
+
+from .article_body import body_from_html
+from .json_store import load_json, save_json
+
+# 수집은 피드마다 앞쪽 limit(10~15)건만 쓴다 — 여유를 두고 이만큼만 저장한다
+MAX_CACHED_ENTRIES = 30
+MAX_AGE_DAYS = 7
+MAX_BYTES = 3 * 1024 * 1024
+
+# 수집 단계가 실제로 읽는 필드만 남긴다 (feedparser 객체 전체는 크고 직렬화도 안 된다)
+_ENTRY_FIELDS = ("title", "link", "summary", "published", "updated")
+_TIME_FIELDS = ("published_parsed", "updated_parsed")
+# 전문(content:encoded) HTML 대신 거기서 뽑은 본문 텍스트(최대 1,500자)를 남긴다 —
+# 항목 30건 × 피드 80개의 전문을 통째로 두면 MAX_BYTES를 혼자 넘기고, HTML을 앞에서
+# 잘라 두면 다음 실행의 추출이 새로 파싱할 때와 다른 본문(또는 None)을 낸다
+
+
+def content_digest(content: bytes) -> str:
+    return hashlib.sha1(content or b"").hexdigest()
+
+
+def entry_content(entry) -> str:
+    """
+    피드가 준 전문 HTML. feedparser는 [{"value": ...}] 목록으로, 캐시 레코드는
+    문자열로 갖고 있다. 없으면 빈 문자열.
+    """
+    content = entry.get("content")
+    if isinstance(content, list):
+        return "".join(part.get("value") or "" for part in content)
+    return content or ""
+
+
+def entry_body(entry) -> str:
+    """
+    피드 전문에서 뽑은 본문 텍스트. 캐시 레코드는 저장할 때 뽑아 둔 본문을 갖고 있다.
+    본문 기준을 못 넘으면 빈 문자열.
+    """
+    if "body" in entry:
+        return entry["body"] or ""
+    return body_from_html(entry_content(entry)) or ""
+
+
+def compact_entry(entry) -> Dict:
+    """feedparser 항목 → JSON으로 저장 가능한 dict (struct_time은 9-튜플 리스트로)."""
+    record = {k: entry.get(k) for k in _ENTRY_FIELDS if entry.get(k)}
+    record["body"] = entry_body(entry)
+    for key in _TIME_FIELDS:
+        parsed = entry.get(key)
+        if parsed:
+            record[key] = list(parsed)[:9]
+    return record
+
+
+class FeedCache:
+    """URL → {etag, last_modified, digest, feed_updated, entries, used} (스레드 안전)."""
+
+    def __init__(self, path: str = "", max_age_days: int = MAX_AGE_DAYS,
+                 max_bytes: int = MAX_BYTES):
+        self.path = path
+        self.max_age_days = max_age_days
+        self.max_bytes = max_bytes
+        self._records = load_json(path, {}) if path else {}
+        self._lock = threading.Lock()
+        self.stats = {"not_modified": 0, "same_digest": 0, "refreshed": 0}
+
+    def get(self, url: str) -> Optional[Dict]:
+        with self._lock:
+            return self._records.get(url)
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """다음 요청에 붙일 조건부 헤더."""
+        record = self.get(url) or {}
+        headers = {}
+        if record.get("etag"):
+            headers["If-None-Match"] = record["etag"]
+        if record.get("last_modified"):
+            headers["If-Modified-Since"] = record["last_modified"]
+        return headers
+
+    def hit(self, url: str, reason: str) -> Optional[Dict]:
+        """304 또는 본문 해시 일치 — 저장된 레코드를 쓰고 사용 시각만 갱신."""
+        with self._lock:
+            record = self._records.get(url)
+            if record is None:
+                return None
+            record["used"] = time.time()
+            self.stats[reason] = self.stats.get(reason, 0) + 1
+            return record
+
+    def put(self, url: str, feed, *, etag: Optional[str] = None,
+            last_modified: Optional[str] = None, digest: str = "") -> None:
+        updated = (getattr(feed, "feed", None) or {}).get("updated_parsed")
+        self.put_record(url, [compact_entry(e) for e in feed.entries[:MAX_CACHED_ENTRIES]],
+                        feed_updated=list(updated)[:9] if updated else None,
+                        etag=etag, last_modified=last_modified, digest=digest)
+
+    def put_record(self, url: str, entries: List[Dict], *, feed_updated: Optional[List[int]] = None,
+                   etag: Optional[str] = None, last_modified: Optional[str] = None,
+                   digest: str = "") -> None:
+        """이미 compact_entry로 줄인 항목을 저장한다 (파싱을 다른 프로세스에서 한 경우)."""
+        record = {
+            "etag": etag or "",
+            "last_modified": last_modified or "",
+            "digest": digest,
+            "feed_updated": feed_updated,
+            "entries": entries[:MAX_CACHED_ENTRIES],
+            "used": time.time(),
+        }
+        with self._lock:
+            self._records[url] = record
+            self.stats["refreshed"] += 1
+
+    def _evict(self, now: float) -> None:
+        max_age = self.max_age_days * 86400
+        self._records = {
+            url: r for url, r in self._records.items() if now - r.get("used", 0) <= max_age
+        }
+        sizes = {url: len(json.dumps(r, ensure_ascii=False).encode("utf-8"))
+                 for url, r in self._records.items()}
+        total = sum(sizes.values())
+        for url in sorted(self._records, key=lambda u: self._records[u].get("used", 0)):
+            if total <= self.max_bytes:
+                break
+            total -= sizes[url]
+            del self._records[url]
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            self._evict(time.time())
+            save_json(self.path, self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
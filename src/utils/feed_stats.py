@@ -0,0 +1,166 @@
+"""
+Per-feed Fetch Statistics
+피드별 최근 수집 지연·바이트·항목 수와 기사 깔때기(오래됨 → 이미 실림 → 중복 →
+선별 → 분야 무관)를 실행 간에 남긴다.
+
+지연 기록은 다음 실행이 '느린 피드부터' 띄우게 하는 데 쓴다.
+jobs를 SOURCES 선언 순서대로 넣으면 뒤에 선언된 느린 피드가 맨 마지막에 시작해
+수집 단계 전체가 그만큼 늘어난다. 오래 걸리는 일부터 배정하는 LPT(longest
+processing time first) 순서면 같은 워커 수로도 마지막 워커가 끝나는 시각(makespan)이
+줄어든다.
+
+지연은 최근 몇 번의 표본 중앙값으로 본다 — 어쩌다 한 번 튄 값에 순서가 흔들리지 않게.
+
+깔때기 기록은 '살아 있지만 멈춘' 피드를 걸러내는 데 쓴다. CNN world(중앙값 1225일),
+WSJ(564일), 경향 과학(513일)은 매 실행 받아서 파싱한 뒤 MAX_ARTICLE_AGE_DAYS 필터가
+전부 버린다. 쓸 만한 기사(오래되지 않았고 전에 안 실린 것)를 BACKOFF_AFTER_EMPTY_RUNS번
+연속으로 하나도 못 낸 피드는 건너뛰고, PROBE_EVERY_RUNS번에 한 번만 다시 찔러 본다 —
+피드가 되살아나면 그 실행에서 바로 복귀한다.
+"""
+import heapq
+import statistics
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from .json_store import load_json, save_json
+
+LATENCY_SAMPLES = 5
+# 기록이 없는 피드의 추정치 — 새 피드를 맨 뒤로 미루지 않도록 알려진 피드 중앙값을 쓰고,
+# 아무 기록도 없으면 이 값
+DEFAULT_LATENCY = 2.0
+
+BACKOFF_AFTER_EMPTY_RUNS = 3
+PROBE_EVERY_RUNS = 7
+
+# 깔때기 단계 (보고서 열 순서)
+FUNNEL = ("entries", "stale", "seen", "fresh", "dup", "selected", "off_topic")
+
+
+def feed_key(source_id: str, category: str) -> str:
+    return f"{source_id}/{category}"
+
+
+def predict_makespan(durations: Iterable[float], workers: int) -> float:
+    """주어진 순서대로 비는 워커에 배정했을 때 마지막 워커가 끝나는 시각."""
+    finish = [0.0] * max(1, workers)
+    for duration in durations:
+        earliest = heapq.heappop(finish)
+        heapq.heappush(finish, earliest + duration)
+    return max(finish)
+
+
+class FeedStats:
+    """
+    feed_key → {"latency": [최근 표본(초)], "last": {이번 실행 깔때기},
+                "empty_runs": 연속 무소득 실행 수, "skipped": 연속 건너뛴 실행 수}
+    (스레드 안전)
+    """
+
+    def __init__(self, path: str = ""):
+        self.path = path
+        self._records: Dict[str, Dict] = load_json(path, {}) if path else {}
+        self._lock = threading.Lock()
+        self._run: Dict[str, Counter] = defaultdict(Counter)
+        self._skipped_now: List[str] = []
+
+    def record_fetch(self, key: str, seconds: float, nbytes: int = 0, ok: bool = True) -> None:
+        """
+        받기 한 번. ok=False(네트워크 오류·5xx)는 지연 표본으로만 쓰고 무소득 실행으로 세지
+        않는다 — 일시적인 장애 몇 번에 멀쩡한 피드가 백오프에 들어가지 않게.
+        """
+        with self._lock:
+            record = self._records.setdefault(key, {})
+            samples = record.setdefault("latency", [])
+            samples.append(round(seconds, 3))
+            del samples[:-LATENCY_SAMPLES]
+            self._run[key]["bytes"] += nbytes
+            self._run[key]["fetches" if ok else "failed"] += 1
+            self._run[key]["fetch_ms"] += int(seconds * 1000)
+
+    def count(self, key: str, stage: str, n: int = 1) -> None:
+        """이번 실행의 깔때기 단계 카운트 (FUNNEL 중 하나)."""
+        if n:
+            with self._lock:
+                self._run[key][stage] += n
+
+    def totals(self) -> Counter:
+        """이번 실행의 단계별 합계 (모든 피드)."""
+        with self._lock:
+            totals = Counter()
+            for counts in self._run.values():
+                totals.update(counts)
+            return totals
+
+    def should_skip(self, key: str) -> bool:
+        """연속 무소득이면 건너뛴다. 단, PROBE_EVERY_RUNS번째 실행마다 한 번은 받아 본다."""
+        with self._lock:
+            record = self._records.get(key) or {}
+            backed_off = record.get("empty_runs", 0) >= BACKOFF_AFTER_EMPTY_RUNS
+            return backed_off and record.get("skipped", 0) < PROBE_EVERY_RUNS - 1
+
+    def mark_skipped(self, key: str) -> None:
+        with self._lock:
+            record = self._records.setdefault(key, {})
+            record["skipped"] = record.get("skipped", 0) + 1
+            self._skipped_now.append(key)
+
+    def finish_run(self) -> None:
+        """이번 실행에 실제로 받은 피드의 무소득 연속 횟수를 갱신한다. 모든 단계가 끝난 뒤 호출."""
+        with self._lock:
+            for key, run in self._run.items():
+                if not run["fetches"]:
+                    continue
+                record = self._records.setdefault(key, {})
+                record["last"] = {k: v for k, v in run.items() if v}
+                record["empty_runs"] = 0 if run["fresh"] else record.get("empty_runs", 0) + 1
+                record["skipped"] = 0
+
+    def report(self) -> str:
+        """실행 요약용 표 — 받았지만 쓸 기사를 하나도 못 낸 피드와 건너뛴 피드."""
+        with self._lock:
+            run = {k: Counter(v) for k, v in self._run.items()}
+            records = {k: dict(v) for k, v in self._records.items()}
+            skipped = sorted(self._skipped_now)
+        totals = self.totals()
+        lines = [
+            f"받은 피드 {len(run)}개 · {totals['bytes'] / 1024 / 1024:.1f}MB · 건너뜀 {len(skipped)}개",
+            f"다운로드 합계 {totals['fetch_ms'] / 1000:.1f}s · 파싱 합계 {totals['parse_ms'] / 1000:.1f}s",
+            "깔때기: " + " → ".join(f"{stage} {totals[stage]}" for stage in FUNNEL),
+        ]
+        failed = sorted(k for k, counts in run.items() if counts["failed"] and not counts["fetches"])
+        wasted = sorted(k for k, counts in run.items() if counts["fetches"] and not counts["fresh"])
+        if wasted:
+            lines.append("쓸 기사 0건 (연속 횟수 · 항목 · KB):")
+            for key in wasted:
+                counts = run[key]
+                lines.append(
+                    f"  {key}  {records.get(key, {}).get('empty_runs', 0)}회 · "
+                    f"{counts['entries']}건 · {counts['bytes'] // 1024}KB"
+                )
+        if failed:
+            lines.append("받기 실패 (무소득으로 세지 않음): " + ", ".join(failed))
+        if skipped:
+            lines.append("건너뜀 (무소득 누적, 주기적으로만 재확인): " + ", ".join(skipped))
+        return "\n".join(lines)
+
+    def expected_latency(self, key: str, default: Optional[float] = None) -> float:
+        with self._lock:
+            samples = (self._records.get(key) or {}).get("latency")
+        if samples:
+            return statistics.median(samples)
+        return DEFAULT_LATENCY if default is None else default
+
+    def order_slowest_first(self, jobs: List, key_of) -> List:
+        """LPT 순서. 기록이 없는 피드는 알려진 피드들의 중앙값으로 친다."""
+        with self._lock:
+            known = [statistics.median(r["latency"]) for r in self._records.values()
+                     if r.get("latency")]
+        prior = statistics.median(known) if known else DEFAULT_LATENCY
+        return sorted(jobs, key=lambda job: self.expected_latency(key_of(job), prior), reverse=True)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            save_json(self.path, self._records)
@@ -0,0 +1,148 @@
+"""
+Streaming, Limit-aware Feed Parser
+수집은 피드마다 앞쪽 limit(10~15)건만 쓰는데, feedparser는 문서 전체를 파싱해
+항목 수백 개(ScienceDaily all.xml, Al Jazeera all.xml, 오마이뉴스)를 전부 객체로
+만든 뒤 앞 몇 개만 남긴다. 여기서는 lxml XMLPullParser에 바이트를 조금씩 밀어
+넣으며 item/entry가 끝날 때마다 필요한 필드만 뽑고, limit건을 채우면 나머지는
+읽지도 않는다.
+
+결과는 feedparser 결과와 같은 모양(entries[*].title/link/summary/published_parsed,
+feed.updated_parsed)이라 호출부가 구분할 필요가 없다. 정식 XML이 아니거나 루트가
+rss/feed/RDF가 아닌 문서는 None을 돌려 호출부가 feedparser로 다시 파싱하게 한다 —
+판정(bozo 피드는 버림)은 예전과 같이 feedparser가 내린다.
+"""
+import io
+from typing import Optional
+
+import feedparser
+from feedparser.datetimes import _parse_date
+from lxml import etree
+
+# 한 번에 파서에 밀어 넣는 크기 — 작을수록 limit에서 일찍 멈추지만 호출 횟수가 는다
+CHUNK_BYTES = 16 * 1024
+
+_ITEM_TAGS = {"item", "entry"}
+_ROOT_TAGS = {"rss", "feed", "RDF"}
+_CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+
+# 항목 필드 (태그 localname → 결과 키). 먼저 나온 값이 우선이다
+_FIELD_OF = {
+    "title": "title",
+    "description": "summary",
+    "summary": "summary",
+    "pubDate": "published",
+    "published": "published",
+    "issued": "published",
+    "date": "updated",  # dc:date — feedparser와 같게
+    "updated": "updated",
+    "modified": "updated",
+}
+# 피드 자체의 갱신 시각 — 항목에 날짜가 없는 피드의 기준점(feed_anchor_time)
+_FEED_UPDATED_TAGS = {"lastBuildDate", "updated", "date", "modified"}
+
+
+def _localname(tag) -> str:
+    return etree.QName(tag).localname if isinstance(tag, str) else ""
+
+
+def _text(el) -> str:
+    """요소의 내용. Atom xhtml content처럼 자식 요소가 있으면 마크업째 이어 붙인다."""
+    if el.get("type") == "xhtml" and len(el) == 1:
+        el = el[0]  # 규격상 감싸는 <div>는 내용이 아니다
+    if len(el):
+        inner = [el.text or ""]
+        inner.extend(etree.tostring(child, encoding="unicode", with_tail=True) for child in el)
+        return "".join(inner).strip()
+    return (el.text or "").strip()
+
+
+def _entry(item) -> feedparser.FeedParserDict:
+    # 다 채운 뒤에 FeedParserDict로 감싼다 — FeedParserDict는 updated가 없으면
+    # published를 대신 돌려주는 별칭이 있어 채우는 도중의 '이미 있나' 검사가 틀어진다
+    entry = {}
+    content = guid = ""
+    for child in item:
+        name = _localname(child.tag)
+        if name == "link":
+            # Atom은 href 속성, RSS는 텍스트. rel이 alternate(기본값)인 것만 본문 링크다
+            href = child.get("href")
+            if href is not None:
+                if child.get("rel", "alternate") == "alternate" and not entry.get("link"):
+                    entry["link"] = href.strip()
+            elif child.text and not entry.get("link"):
+                entry["link"] = child.text.strip()
+        elif name == "guid":
+            if child.get("isPermaLink", "true") == "true":
+                guid = (child.text or "").strip()
+        elif (name == "encoded" and etree.QName(child.tag).namespace == _CONTENT_NS) or name == "content":
+            content = content or _text(child)
+        elif name in _FIELD_OF:
+            key = _FIELD_OF[name]
+            value = _text(child)
+            if value and not entry.get(key):
+                entry[key] = value
+    if not entry.get("link") and guid.startswith(("http://", "https://")):
+        entry["link"] = guid
+    if content:
+        # feedparser와 같은 모양 — 전문은 본문 수집을 건너뛰는 데 쓴다(rss_collector)
+        entry["content"] = [{"value": content}]
+        if not entry.get("summary"):
+            entry["summary"] = content
+    for key in ("published", "updated"):
+        if entry.get(key):
+            parsed = _parse_date(entry[key])
+            if parsed:
+                entry[f"{key}_parsed"] = parsed
+    return feedparser.FeedParserDict(entry)
+
+
+def parse_feed(content: bytes, limit: int) -> Optional[feedparser.FeedParserDict]:
+    """
+    앞쪽 limit건만 파싱한다. XML로 읽을 수 없거나 RSS/Atom이 아니면 None
+    (호출부가 feedparser로 폴백).
+    """
+    if not content or limit <= 0:
+        return None
+    parser = etree.XMLPullParser(events=("start", "end"), resolve_entities=False,
+                                 no_network=True, remove_comments=True)
+    meta = feedparser.FeedParserDict()
+    entries = []
+    depth = 0  # 지금 열려 있는 item/entry 깊이 — 그 안의 updated 등은 피드 필드가 아니다
+    root_seen = False
+    stream = io.BytesIO(content)
+    try:
+        while len(entries) < limit:
+            chunk = stream.read(CHUNK_BYTES)
+            if chunk:
+                parser.feed(chunk)
+            else:
+                parser.close()
+            for event, el in parser.read_events():
+                name = _localname(el.tag)
+                if not root_seen:
+                    if name not in _ROOT_TAGS:
+                        return None
+                    root_seen = True
+                if name in _ITEM_TAGS:
+                    depth += 1 if event == "start" else -1
+                    if event == "end":
+                        entries.append(_entry(el))
+                        # 다 읽은 항목은 트리에서 떼어 메모리를 바로 돌려준다
+                        el.clear()
+                        parent = el.getparent()
+                        if parent is not None:
+                            parent.remove(el)
+                        if len(entries) >= limit:
+                            break
+                elif (event == "end" and depth == 0 and name in _FEED_UPDATED_TAGS
+                      and "updated_parsed" not in meta):
+                    parsed = _parse_date((el.text or "").strip())
+                    if parsed:
+                        meta["updated_parsed"] = parsed
+            if not chunk:
+                break
+    except etree.XMLSyntaxError:
+        return None
+    if not root_seen:
+        return None
+    return feedparser.FeedParserDict(feed=meta, entries=entries, bozo=0)
@@ -0,0 +1,101 @@
+"""
+Shared HTTP Client
+피드·기사 본문·NIM·시세 조회가 전부 맨 requests.get/post를 불러 요청마다 TCP+TLS
+연결을 새로 맺었다 — hani.co.kr, integrate.api.nvidia.com, finance.naver.com 같은
+같은 호스트에 수십 번씩. 짧은 요청은 핸드셰이크가 시간의 대부분이다.
+여기 세션 하나를 두고 모든 모듈이 이걸 거치게 해 호스트별 keep-alive 연결을
+재사용한다.
+
+요청마다 호스트별 호출 수·소요 시간·받은 바이트를 HTTP_STATS에 쌓아 실행 요약에서
+어느 호스트가 시간을 잡아먹는지 볼 수 있게 한다.
+"""
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 호스트 하나당 유지할 연결 수 — 같은 호스트에 동시에 붙는 스레드 수의 최댓값에 맞춘다:
+# 피드 수집 12(news_aggregator.FEED_WORKERS), 본문 8(article_body._WORKERS),
+# LLM 최대 16(llm_client._MAX_CONCURRENT). 모자라면 남는 연결을 매번 버리고 다시 맺는다.
+POOL_MAXSIZE = 16
+# 연결 풀을 유지할 호스트 수 — 피드·본문 도메인이 40여 개라 기본값(10)이면 풀이 밀려난다
+POOL_HOSTS = 64
+
+HTTP_STATS: Dict[str, Dict[str, float]] = {}
+
+_stats_lock = threading.Lock()
+_session_lock = threading.Lock()
+_session = None
+
+
+def session() -> requests.Session:
+    """프로세스 전체가 공유하는 세션 (처음 부를 때 만든다)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            s = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_MAXSIZE)
+            s.mount("http://", adapter)
+            s.mount("https://", adapter)
+            _session = s
+        return _session
+
+
+def _host(url: str) -> str:
+    return urlsplit(url or "").netloc.lower() or "?"
+
+
+def record(url: str, seconds: float = 0.0, nbytes: int = 0, *, calls: int = 0,
+           error: bool = False) -> None:
+    """호스트별 누적 — stream=True로 직접 읽는 호출부는 다 읽은 뒤 바이트를 여기로 보고한다."""
+    host = _host(url)
+    with _stats_lock:
+        entry = HTTP_STATS.setdefault(host, {"calls": 0, "errors": 0, "seconds": 0.0, "bytes": 0})
+        entry["calls"] += calls
+        entry["errors"] += int(error)
+        entry["seconds"] += seconds
+        entry["bytes"] += nbytes
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """세션으로 요청하고 시간·바이트를 집계한다. 예외는 그대로 올려 보낸다."""
+    start = time.monotonic()
+    try:
+        resp = session().request(method, url, **kwargs)
+    except Exception:
+        record(url, time.monotonic() - start, calls=1, error=True)
+        raise
+    # stream=True면 본문을 아직 안 읽었다 — 여기서 .content를 건드리면 스트리밍이 무의미해진다
+    nbytes = 0 if kwargs.get("stream") else len(resp.content or b"")
+    record(url, time.monotonic() - start, nbytes, calls=1, error=resp.status_code >= 400)
+    return resp
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+def stats_summary(top: int = 8) -> str:
+    """시간을 가장 많이 쓴 호스트 순으로 한 줄씩."""
+    with _stats_lock:
+        rows = sorted(HTTP_STATS.items(), key=lambda kv: kv[1]["seconds"], reverse=True)
+    if not rows:
+        return "(HTTP 호출 기록 없음)"
+    total_calls = sum(int(r["calls"]) for _, r in rows)
+    total_bytes = sum(int(r["bytes"]) for _, r in rows)
+    lines = [f"전체 {total_calls}건 · {total_bytes / 1024 / 1024:.1f}MB · 호스트 {len(rows)}곳"]
+    width = max(len(host) for host, _ in rows[:top])
+    for host, r in rows[:top]:
+        avg = r["seconds"] / r["calls"] if r["calls"] else 0
+        lines.append(
+            f"{host.ljust(width)}  {int(r['calls'])}건 · 오류 {int(r['errors'])} · "
+            f"평균 {avg:.2f}s · {int(r['bytes']) // 1024}KB"
+        )
+    return "\n".join(lines)
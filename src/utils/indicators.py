@@ -20,9 +20,9 @@ from io import StringIO
 from typing import Dict, List, Optional
 
 import pandas as pd
-import requests
 import yfinance as yf
 
+from . import http_client
 from .logger import setup_logger
 
 logger = setup_logger()
@@ -105,7 +105,7 @@ def _item(key: str, name: str, value: str, pct: float, history: List[float]) ->
 
 def _fetch_domestic_index_history(code: str, days: int = _HISTORY_DAYS) -> List[float]:
     """최근 거래일 종가 목록, 오래된→최신 순. 실패 시 빈 리스트."""
-    resp = requests.get(
+    resp = http_client.get(
         f"https://finance.naver.com/sise/sise_index_day.naver?code={code}&page=1",
         headers=_HEADERS, timeout=_REQUEST_TIMEOUT,
     )
@@ -160,8 +160,8 @@ def _get_fx() -> List[Dict]:
     results = []
     for code, name in _FX_CODES.items():
         try:
-            resp = requests.get(_FX_URL.format(code=code), headers=_HEADERS,
-                                 timeout=_REQUEST_TIMEOUT)
+            resp = http_client.get(_FX_URL.format(code=code), headers=_HEADERS,
+                                    timeout=_REQUEST_TIMEOUT)
             resp.raise_for_status()
             rows = resp.json()["result"]
             if not rows:
@@ -0,0 +1,40 @@
+"""
+Persistent JSON state helpers
+data/ 아래에 실행 간 상태(캐시·통계)를 남기는 모듈들이 공유한다.
+
+매 실행이 새 러너라 data/에 커밋된 파일만이 다음 실행으로 넘어간다. 쓰다가
+중단되면(타임아웃 취소 등) 반쯤 쓰인 JSON이 커밋돼 다음 실행이 통째로 깨지므로
+항상 임시 파일에 쓰고 rename으로 교체한다. 읽기 실패는 '빈 상태'로 취급한다 —
+캐시가 깨졌다고 발행이 멈추면 안 된다.
+"""
+import json
+import os
+import tempfile
+
+
+def load_json(path: str, default):
+    """path의 JSON. 없거나 깨졌으면 default."""
+    if not path or not os.path.exists(path):
+        return default
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json(path: str, data) -> int:
+    """원자적으로 저장하고 쓴 바이트 수를 돌려준다. 커밋되는 파일이라 공백 없이 압축한다."""
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".json")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return len(payload)
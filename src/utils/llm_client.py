@@ -1,6 +1,6 @@
 """
 NVIDIA NIM REST Client
-OpenAI 호환 chat completions 엔드포인트에 requests.post 1회로 직접 호출한다.
+OpenAI 호환 chat completions 엔드포인트에 POST 1회로 직접 호출한다(http_client 공유 세션).
 JSON POST 요청 하나뿐이라 openai/anthropic 같은 SDK는 불필요.
 
 NVIDIA_API_KEY는 환경변수(GitHub Secrets)로만 전달된다 — 이 파일을 포함해
@@ -11,10 +11,11 @@ import os
 import re
 import threading
 import time
-from typing import Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import requests
 
+from . import adaptive_limit, http_client
 from .logger import setup_logger
 
 logger = setup_logger()
@@ -28,6 +29,9 @@ NVIDIA_MODEL = "google/gemma-4-31b-it"  # NVIDIA NIM 카탈로그에서 모델 
 LLM_STATS = {
     "calls": 0, "ok": 0, "no_key": 0, "http_error": 0,
     "network_error": 0, "parse_fail": 0, "salvaged": 0, "budget": 0, "errors": [],
+    "cache_hit": 0, "cache_miss": 0,  # 기사 단위 요약 캐시 (summary_cache) — 호출 전에 센다
+    "stream_cut": 0,  # 스트리밍 도중 끊겨(마감·연결) 받은 데까지만 쓴 호출
+    "prompt_tokens": 0, "completion_tokens": 0,  # 응답 usage 합계 (청크 크기 보정에도 쓴다)
 }
 
 _stats_lock = threading.Lock()
@@ -49,22 +53,66 @@ _deadline = None
 _RATE_LIMIT_BACKOFF = [5, 15]
 _RATE_LIMIT_MAX_WAIT = 30
 
-# 전체 동시 요청 상한. 카테고리 8개 × 청크 워커를 곱하면 20개가 넘게 붙는데,
-# 살아있는 키가 하나뿐이면 그게 전부 한 계정의 rate limit으로 몰린다.
-# 실제로 쓸 수 있는 키 개수를 확인한 뒤 set_concurrency()로 조정한다.
-_PER_KEY_CONCURRENCY = 2
+# 동시 요청 수는 키마다 AIMD로 찾아간다(adaptive_limit) — 성공하면 늘리고 429·타임아웃이면
+# 절반으로. 여기 전체 상한은 그 합이 연결 풀(http_client.POOL_MAXSIZE)과 키 수를 넘지 않게
+# 묶는 울타리다. 실제로 쓸 수 있는 키 개수를 확인한 뒤 set_concurrency()로 조정한다.
+_PER_KEY_CONCURRENCY = int(adaptive_limit.MAX_LIMIT)
 _MIN_CONCURRENT, _MAX_CONCURRENT = 3, 16
 _slot = threading.Semaphore(_MIN_CONCURRENT)
+_ceiling = _MIN_CONCURRENT
+
+# API 키 → 동시 호출 조절기. 키 값은 로그·요약에 남기지 않는다 — 이름은 _KEY_LABELS(probe_key)
+_limiters: Dict[str, adaptive_limit.AdaptiveLimit] = {}
+_KEY_LABELS: Dict[str, str] = {}
+_limiters_lock = threading.Lock()
 
 
 def set_concurrency(working_keys: int) -> int:
-    """쓸 수 있는 키 개수에 맞춰 전체 동시 호출 수를 정한다. 요약 시작 전에만 호출."""
-    global _slot
+    """쓸 수 있는 키 개수에 맞춰 전체 동시 호출 상한을 정한다. 요약 시작 전에만 호출."""
+    global _slot, _ceiling
     limit = max(_MIN_CONCURRENT, min(working_keys * _PER_KEY_CONCURRENCY, _MAX_CONCURRENT))
     _slot = threading.Semaphore(limit)
-    logger.info(f"LLM concurrency set to {limit} (working keys: {working_keys})")
+    _ceiling = limit
+    logger.info(f"LLM concurrency ceiling set to {limit} (working keys: {working_keys}; "
+                f"per-key limits adapt from {adaptive_limit.INITIAL_LIMIT:g})")
     return limit
 
+
+def _limiter(api_key: str) -> adaptive_limit.AdaptiveLimit:
+    with _limiters_lock:
+        limiter = _limiters.get(api_key)
+        if limiter is None:
+            limiter = _limiters[api_key] = adaptive_limit.AdaptiveLimit()
+        return limiter
+
+
+def concurrency_ceiling() -> int:
+    """set_concurrency로 정한 전체 동시 호출 상한."""
+    return _ceiling
+
+
+def key_capacity(api_key: Optional[str]) -> int:
+    """그 키의 지금 동시 호출 상한 (summarizer의 청크 스케줄러가 키를 고른다)."""
+    if not api_key:
+        return 0
+    return _limiter(api_key).capacity()
+
+
+def concurrency_gauges() -> Dict[str, Dict]:
+    """키 이름 → 현재 상한·진행 중·최대 동시·평균 지연(초)·성공/429/타임아웃 수."""
+    with _limiters_lock:
+        items = list(_limiters.items())
+    gauges = {}
+    for n, (api_key, limiter) in enumerate(items):
+        gauges[_KEY_LABELS.get(api_key) or f"key{n + 1}"] = limiter.gauges()
+    return gauges
+
+# 스트리밍(stream=True) 호출의 연결 대기 / 토큰 사이 최대 공백(초). 전체 길이는 call_llm의
+# timeout이 벽시계로 따로 자른다 — 비스트리밍의 timeout은 소켓 읽기 공백이라 90초짜리
+# 생성을 한 번에 기다리지만, 스트림은 토큰이 계속 오므로 공백 기준이 짧아도 된다
+_STREAM_CONNECT_SECONDS = 10
+_STREAM_IDLE_SECONDS = 60
+
 # 키별 상태 — 실행 시작 시 probe_key로 채우고 실행 요약에 찍는다
 KEY_STATUS = {}
 
@@ -76,6 +124,19 @@ def _record(key: str, detail: Optional[str] = None) -> None:
             LLM_STATS["errors"].append(detail)
 
 
+def record_cache(hits: int, misses: int) -> None:
+    """요약 캐시 적중/미적중 기사 수를 더한다 (summarizer.summarize_region)."""
+    with _stats_lock:
+        LLM_STATS["cache_hit"] += hits
+        LLM_STATS["cache_miss"] += misses
+
+
+def _record_usage(usage: Dict) -> None:
+    with _stats_lock:
+        LLM_STATS["prompt_tokens"] += usage.get("prompt_tokens") or 0
+        LLM_STATS["completion_tokens"] += usage.get("completion_tokens") or 0
+
+
 def _budget_exhausted() -> bool:
     global _deadline
     if _deadline is None:
@@ -90,8 +151,12 @@ def stats_summary() -> str:
         f"호출 {s['calls']}건 · 성공 {s['ok']} · 부분복구 {s['salvaged']} · "
         f"JSON실패 {s['parse_fail']} · HTTP오류 {s['http_error']} · "
         f"네트워크오류 {s['network_error']} · 키없음 {s['no_key']} · "
-        f"시간예산초과 {s['budget']}"
+        f"시간예산초과 {s['budget']} · 스트림중단 {s['stream_cut']}"
     ]
+    if s["cache_hit"] or s["cache_miss"]:
+        lines.append(f"요약 캐시 적중 {s['cache_hit']}건 · 미적중 {s['cache_miss']}건")
+    if s["prompt_tokens"] or s["completion_tokens"]:
+        lines.append(f"토큰 입력 {s['prompt_tokens']:,} · 출력 {s['completion_tokens']:,}")
     if s["errors"]:
         lines.append("첫 오류: " + s["errors"][0])
     return "\n".join(lines)
@@ -99,12 +164,22 @@ def stats_summary() -> str:
 
 def call_llm(system_prompt: str, user_prompt: str, *, temperature: float = 0.3,
              max_tokens: int = 4096, timeout: int = 180, retries: int = 2,
-             api_key: Optional[str] = None) -> Optional[str]:
+             api_key: Optional[str] = None, stream: bool = False,
+             on_item: Optional[Callable[[dict], None]] = None,
+             on_usage: Optional[Callable[[dict], None]] = None) -> Optional[str]:
     """
-    NVIDIA NIM chat completions 1회 호출(비스트리밍).
+    NVIDIA NIM chat completions 1회 호출.
     429/5xx/네트워크 오류 시 지수 백오프로 재시도. 재시도까지 모두 실패하면
     예외를 던지지 않고 None을 반환한다 — 호출부가 규칙기반 폴백으로 넘어가도록.
 
+    stream=True면 SSE로 받는다. 응답이 JSON 배열이면 객체가 닫히는 대로 on_item에
+    넘기고(ArrayItems), timeout(벽시계)·시간 예산 마감이나 연결 끊김이면 그때까지 받은
+    텍스트를 돌려준다 — 8건 청크를 90초 생성하다 끝에서 끊겨도 앞의 기사는 남는다
+    (call_llm_json의 _salvage_array가 완성된 객체만 건진다).
+
+    on_usage가 있으면 응답의 usage(prompt_tokens, completion_tokens)에 finish_reason을 더해
+    넘긴다 — summarizer가 청크 토큰 추정을 보정한다(chunk_planner). 끊긴 스트림은 usage가 없다.
+
     timeout 기본값 주의: 기사 8건 배치는 한국어 요약 3,500토큰가량을 생성해
     호출 하나가 90초 안팎 걸린다. 예전 기본값 60초로는 정상 생성 중인 요청이
     잘려 나가 카테고리가 통째로 규칙기반으로 폴백됐다(실제 발생). 청크 크기를
@@ -132,50 +207,159 @@ def call_llm(system_prompt: str, user_prompt: str, *, temperature: float = 0.3,
         ],
         "temperature": temperature,
         "max_tokens": max_tokens,
-        "stream": False,
+        "stream": stream,
+        # 스트림은 usage를 마지막 청크로 따로 보내 달라고 해야 준다 (OpenAI 호환 옵션)
+        **({"stream_options": {"include_usage": True}} if stream else {}),
         # gemma-4-31b-it은 내장 thinking 모드가 있다 — 켜져 있으면 JSON 앞에
         # 추론 텍스트가 붙어 엄격한 JSON 파싱이 깨질 수 있어 명시적으로 끈다.
         "chat_template_kwargs": {"enable_thinking": False},
     }
 
+    limiter = _limiter(api_key)
+    waited = False
     for attempt in range(retries + 1):
+        # 자리(키별 상한 + 전체 상한)는 응답을 다 읽을 때까지 잡는다 — 스트림은 생성 내내
+        # 연결을 쓰고 있다. 백오프 sleep 동안에는 놓는다: 붙잡고 있으면 다른 스레드가
+        # 빈 슬롯을 못 쓴다
+        ticket = limiter.acquire(ignore_pause=waited)
+        outcome, pause, failure = adaptive_limit.ERROR, None, None
         try:
-            # 세마포어는 POST 구간만 잡는다 — 백오프 sleep 동안 붙잡고 있으면
-            # 다른 스레드가 빈 슬롯을 못 쓴다
+            started = time.monotonic()
             with _slot:
-                resp = requests.post(NVIDIA_API_URL, headers=headers, json=payload, timeout=timeout)
-            if resp.status_code == 429:
-                # 병렬 호출 중이라 rate limit이 실제로 걸린다. 1~2초 후 재시도하면
-                # 대개 또 걸리므로 서버가 알려주는 Retry-After를 우선 따른다.
-                if attempt >= retries:
-                    logger.warning("LLM rate limited (429) — out of retries")
-                    _record("http_error", "HTTP 429: rate limited (재시도 소진)")
+                if stream:
+                    resp = http_client.post(NVIDIA_API_URL, headers=headers, json=payload, stream=True,
+                                            timeout=(_STREAM_CONNECT_SECONDS, _STREAM_IDLE_SECONDS))
+                else:
+                    resp = http_client.post(NVIDIA_API_URL, headers=headers, json=payload, timeout=timeout)
+                if resp.status_code == 429:
+                    # 병렬 호출 중이라 rate limit이 실제로 걸린다. 1~2초 후 재시도하면
+                    # 대개 또 걸리므로 서버가 알려주는 Retry-After를 우선 따른다 —
+                    # 같은 키의 다른 스레드도 그동안 새 요청을 보내지 않는다(limiter 정지)
+                    outcome = adaptive_limit.THROTTLED
+                    if attempt >= retries:
+                        logger.warning("LLM rate limited (429) — out of retries")
+                        _record("http_error", "HTTP 429: rate limited (재시도 소진)")
+                        return None
+                    pause = _retry_after_seconds(resp) or _RATE_LIMIT_BACKOFF[attempt]
+                elif resp.status_code >= 500:
+                    raise requests.HTTPError(f"retryable status {resp.status_code}")
+                elif not resp.ok:
+                    # 4xx는 재시도해도 안 바뀌므로 응답 본문을 로그로 남기고 바로 포기
+                    logger.warning(f"LLM call rejected ({resp.status_code}): {resp.text[:500]}")
+                    _record("http_error", f"HTTP {resp.status_code}: {resp.text[:200]}")
                     return None
-                wait = _retry_after_seconds(resp) or _RATE_LIMIT_BACKOFF[attempt]
-                logger.warning(f"LLM rate limited (429) — waiting {wait}s")
-                time.sleep(wait)
-                continue
-            if resp.status_code >= 500:
-                raise requests.HTTPError(f"retryable status {resp.status_code}")
-            if not resp.ok:
-                # 4xx는 재시도해도 안 바뀌므로 응답 본문을 로그로 남기고 바로 포기
-                logger.warning(f"LLM call rejected ({resp.status_code}): {resp.text[:500]}")
-                _record("http_error", f"HTTP {resp.status_code}: {resp.text[:200]}")
-                return None
-            data = resp.json()
-            content = data["choices"][0]["message"]["content"]
-            _record("ok")
-            return content
+                elif stream:
+                    content, cut, outcome, usage = _read_stream(resp, started + timeout, on_item)
+                    if cut:
+                        _record("stream_cut", cut)
+                    else:
+                        _record("ok")
+                    _hand_over_usage(usage, on_usage)
+                    return content
+                else:
+                    data = resp.json()
+                    choice = data["choices"][0]
+                    content = choice["message"]["content"]
+                    _record("ok")
+                    outcome = adaptive_limit.OK
+                    if data.get("usage"):
+                        _hand_over_usage(dict(data["usage"], finish_reason=choice.get("finish_reason")),
+                                         on_usage)
+                    return content
         except Exception as e:
-            logger.warning(f"LLM call failed (attempt {attempt + 1}/{retries + 1}): {e}")
-            if attempt < retries:
-                time.sleep(2 ** attempt)
-            else:
-                _record("network_error", f"{type(e).__name__}: {str(e)[:200]}")
+            failure = e
+            if isinstance(e, requests.Timeout):
+                outcome = adaptive_limit.TIMEOUT
+        finally:
+            limiter.release(ticket, outcome, pause)
+
+        # 429를 받은 스레드는 정지 시간만큼 여기서 이미 잠들었다 — 다시 들어갈 때 기다리지 않는다
+        waited = bool(pause)
+        if pause:
+            logger.warning(f"LLM rate limited (429) — waiting {pause}s")
+            time.sleep(pause)
+            continue
+        logger.warning(f"LLM call failed (attempt {attempt + 1}/{retries + 1}): {failure}")
+        if attempt < retries:
+            time.sleep(2 ** attempt)
+        else:
+            _record("network_error", f"{type(failure).__name__}: {str(failure)[:200]}")
 
     return None
 
 
+def _hand_over_usage(usage: Optional[Dict], on_usage: Optional[Callable[[dict], None]]) -> None:
+    if not usage:
+        return
+    _record_usage(usage)
+    if on_usage is not None:
+        on_usage(usage)
+
+
+def _read_stream(resp, deadline: float,
+                 on_item: Optional[Callable[[dict], None]]) -> Tuple[str, str, str, Optional[Dict]]:
+    """
+    SSE 응답("data: {...}" 줄, "data: [DONE]"으로 끝)을 읽어 (본문, 끊긴 사유, 결과, usage)를
+    돌려준다. 끝까지 받았으면 사유는 ''. 결과는 키별 상한(adaptive_limit)에 넘길 값 — 끝까지
+    받았으면 OK, 호출 마감에 잘렸으면 TIMEOUT(키가 과부하라는 가장 흔한 신호), 전체 시간
+    예산·연결 끊김이면 ERROR(키 탓이 아니라 상한을 그대로 둔다).
+    usage는 마지막 청크(choices가 빈)에 오고, 마지막 choice의 finish_reason을 붙인다.
+    아무것도 못 받고 끊기면 예외를 그대로 올려 재시도하게 한다 — 일부라도 받았으면 다시
+    요청하지 않는다(이미 넘긴 항목이 두 번 나간다).
+    """
+    parser = ArrayItems()
+    parts: List[str] = []
+    cut = ""
+    outcome = adaptive_limit.OK
+    usage = None
+    finish_reason = None
+    try:
+        # 바이트로 받아 줄마다 UTF-8로 푼다 — SSE는 늘 UTF-8인데 text/event-stream에 charset이
+        # 없으면 requests의 decode_unicode는 ISO-8859-1로 풀어 한글이 깨진다
+        for raw in resp.iter_lines():
+            line = raw.decode("utf-8", errors="replace") if isinstance(raw, bytes) else raw
+            if line and line.startswith("data:"):
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                try:
+                    event = json.loads(data)
+                    choices = event.get("choices") or [{}]
+                    delta = choices[0].get("delta") or {}
+                except (ValueError, TypeError, AttributeError):
+                    continue
+                usage = event.get("usage") or usage
+                finish_reason = choices[0].get("finish_reason") or finish_reason
+                text = delta.get("content") or ""
+                if text:
+                    parts.append(text)
+                    for item in parser.feed(text):
+                        if on_item is not None:
+                            on_item(item)
+            # 마감은 줄 사이에서만 본다 — 토큰이 계속 오는 동안 한 번은 걸린다
+            if time.monotonic() > deadline:
+                cut, outcome = "스트림 마감(timeout) — 받은 데까지만 사용", adaptive_limit.TIMEOUT
+                break
+            if _budget_exhausted():
+                cut, outcome = (f"LLM 시간 예산 {LLM_TIME_BUDGET_SECONDS}초 초과 — 받은 데까지만 사용",
+                                adaptive_limit.ERROR)
+                break
+    except (requests.RequestException, OSError) as e:
+        if not parts:
+            raise
+        cut, outcome = f"스트림 끊김 ({type(e).__name__}) — 받은 데까지만 사용", adaptive_limit.ERROR
+    finally:
+        resp.close()
+    content = "".join(parts)
+    http_client.record(NVIDIA_API_URL, nbytes=len(content.encode("utf-8")))
+    if cut:
+        logger.warning(f"LLM stream cut after {len(content)} chars, {parser.count} items: {cut}")
+        return content, cut, outcome, None
+    if usage:
+        usage = dict(usage, finish_reason=finish_reason)
+    return content, cut, outcome, usage
+
+
 def _retry_after_seconds(resp) -> Optional[int]:
     """429 응답의 Retry-After(초 단위 정수형만) — 없거나 이상하면 None."""
     raw = resp.headers.get("Retry-After")
@@ -207,9 +391,10 @@ def probe_key(api_key: Optional[str], label: str) -> bool:
     if not api_key:
         KEY_STATUS[label] = "미설정"
         return False
+    _KEY_LABELS[api_key] = label
 
     try:
-        resp = requests.post(
+        resp = http_client.post(
             NVIDIA_API_URL,
             headers={"Authorization": f"Bearer {api_key}"},
             json={
@@ -237,10 +422,17 @@ def probe_key(api_key: Optional[str], label: str) -> bool:
 
 
 def key_status_report() -> str:
-    if not KEY_STATUS:
+    gauges = concurrency_gauges()
+    if not KEY_STATUS and not gauges:
         return "(키 점검 기록 없음)"
-    width = max(len(k) for k in KEY_STATUS)
-    return "\n".join(f"{k.ljust(width)}  {v}" for k, v in sorted(KEY_STATUS.items()))
+    width = max(len(k) for k in list(KEY_STATUS) + list(gauges))
+    lines = [f"{k.ljust(width)}  {v}" for k, v in sorted(KEY_STATUS.items())]
+    # 요약을 돈 뒤라면 키마다 동시 호출이 어디에 자리 잡았는지도 같이 — 무료 키의 실제 한도다
+    for label, g in sorted(gauges.items()):
+        latency = f"{g['latency']}초" if g["latency"] is not None else "-"
+        lines.append(f"{label.ljust(width)}  동시 상한 {g['limit']} · 최대 동시 {g['peak']} · "
+                     f"평균 지연 {latency} · 성공 {g['ok']} · 429 {g['throttled']} · 타임아웃 {g['timeout']}")
+    return "\n".join(lines)
 
 
 def _extract_json_block(text: str) -> Optional[str]:
@@ -248,42 +440,70 @@ def _extract_json_block(text: str) -> Optional[str]:
     return match.group(0) if match else None
 
 
+class ArrayItems:
+    """
+    JSON 배열 텍스트를 조각으로 받아, 최상위 객체가 닫힐 때마다 그 객체를 돌려주는 점진
+    파서. 첫 '['부터 보고, 문자열 안의 괄호·이스케이프는 건너뛰며, 깨진 객체는 버린다.
+    스트리밍(_read_stream)과 잘린 응답 복구(_salvage_array)가 같은 규칙을 쓴다.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._pos = -1  # 다음에 볼 위치. '['를 찾기 전에는 -1
+        self._depth = 0
+        self._in_str = False
+        self._escaped = False
+        self._obj_start = None
+        self.count = 0  # 지금까지 돌려준 객체 수
+
+    def feed(self, chunk: str) -> list:
+        self._text += chunk
+        text = self._text
+        if self._pos < 0:
+            start = text.find("[")
+            if start < 0:
+                return []
+            self._pos = start + 1
+
+        items = []
+        depth, in_str, escaped, obj_start = self._depth, self._in_str, self._escaped, self._obj_start
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+            if in_str:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_str = False
+                continue
+            if ch == '"':
+                in_str = True
+            elif ch == "{":
+                if depth == 0:
+                    obj_start = i
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0 and obj_start is not None:
+                    try:
+                        items.append(json.loads(text[obj_start:i + 1]))
+                    except json.JSONDecodeError:
+                        pass
+                    obj_start = None
+        self._pos = len(text)
+        self._depth, self._in_str, self._escaped, self._obj_start = depth, in_str, escaped, obj_start
+        self.count += len(items)
+        return items
+
+
 def _salvage_array(text: str) -> Optional[list]:
     """
     max_tokens에 걸려 배열이 닫히기 전에 잘린 응답에서 '완성된 객체'만 건져낸다.
     닫는 ']'가 없으면 위 정규식이 통째로 실패해 카테고리 전체가 폴백되는데,
     30건 중 22건이 멀쩡히 왔는데 0건으로 취급하는 건 아깝다.
     """
-    start = text.find("[")
-    if start < 0:
-        return None
-
-    items, depth, in_str, escaped, obj_start = [], 0, False, False, None
-    for i in range(start + 1, len(text)):
-        ch = text[i]
-        if in_str:
-            if escaped:
-                escaped = False
-            elif ch == "\\":
-                escaped = True
-            elif ch == '"':
-                in_str = False
-            continue
-        if ch == '"':
-            in_str = True
-        elif ch == "{":
-            if depth == 0:
-                obj_start = i
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0 and obj_start is not None:
-                try:
-                    items.append(json.loads(text[obj_start:i + 1]))
-                except json.JSONDecodeError:
-                    pass
-                obj_start = None
-    return items or None
+    return ArrayItems().feed(text) or None
 
 
 def call_llm_json(system_prompt: str, user_prompt: str, *, retries: int = 2,
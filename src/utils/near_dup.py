@@ -0,0 +1,128 @@
+"""
+MinHash/LSH Near-duplicate Titles
+news_aggregator._remove_duplicates는 제목 토큰([가-힣A-Za-z0-9]{2,}) 집합을 같은 매체의
+이전 제목 전부와 하나씩 비교했다 — 매체당 제곱 비용이고, 다른 매체가 같은 사안을 거의
+같은 제목으로 낸 건 못 잡았다. 토큰도 한국어에 잘 안 맞는다: "발사체를"/"발사체"처럼
+조사가 붙으면 다른 토큰이 된다.
+
+여기서는 정규화 제목(normalize_title)의 글자 SHINGLE_CHARS-gram 집합을 MinHash 서명으로
+줄이고, 서명을 BANDS개 띠로 나눠 띠마다 버킷에 넣는다(LSH). 새 제목은 띠 하나라도 같은
+버킷에 든 제목만 후보로 보고, 후보는 shingle 집합의 실제 자카드로 확인한다 — 비교 횟수가
+기사 수에 거의 무관하다.
+
+같은 매체의 재탕(제목만 살짝 바꿔 다시 낸 것)과 다른 매체의 같은 기사는 기준을 따로
+둔다. 다른 매체끼리는 같은 사안이라도 관점이 다른 기사일 수 있어 더 비슷해야 합친다.
+"""
+import random
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .dedup import normalize_title
+
+SHINGLE_CHARS = 3
+# 같은 매체 안에서 이만큼 비슷하면 같은 기사 ("…발사체 포착" / "…발사체 감지" ≈ 0.7)
+SAME_SOURCE_THRESHOLD = 0.5
+# 다른 매체끼리는 더 엄격하게 — 같은 사안의 다른 기사까지 합치지 않도록
+CROSS_SOURCE_THRESHOLD = 0.7
+# BANDS × ROWS = 서명 길이. 자카드 J인 두 제목이 후보가 될 확률은 1 - (1 - J^ROWS)^BANDS —
+# 32×2면 J=0.5에서 99.99%, J=0.1에서 27%. 놓치지 않는 쪽으로 잡고, 헛후보는 실제
+# 자카드 확인이 거른다
+BANDS = 32
+ROWS = 2
+
+_PRIME = (1 << 31) - 1
+_rng = random.Random(20260817)  # 실행마다 같은 서명이 나오도록 고정 시드
+
+
+def _permutations(count: int) -> Tuple[np.ndarray, np.ndarray]:
+    a = np.array([_rng.randrange(1, _PRIME) for _ in range(count)], dtype=np.uint64)
+    b = np.array([_rng.randrange(0, _PRIME) for _ in range(count)], dtype=np.uint64)
+    return a, b
+
+
+_PERMUTATIONS: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+
+def shingles(title: str) -> Set[str]:
+    """정규화 제목의 글자 n-gram 집합. 너무 짧으면 제목 전체 하나."""
+    text = normalize_title(title or "")
+    if len(text) <= SHINGLE_CHARS:
+        return {text} if text else set()
+    return {text[i:i + SHINGLE_CHARS] for i in range(len(text) - SHINGLE_CHARS + 1)}
+
+
+def minhash(items: Set[str], size: int) -> np.ndarray:
+    """집합의 MinHash 서명 (길이 size)."""
+    if size not in _PERMUTATIONS:
+        _PERMUTATIONS[size] = _permutations(size)
+    a, b = _PERMUTATIONS[size]
+    hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in items), dtype=np.uint64,
+                         count=len(items))
+    # (a·h + b) mod p — h < 2^32, a < 2^31이라 uint64에서 넘치지 않는다
+    return ((a[:, None] * hashes[None, :] + b[:, None]) % _PRIME).min(axis=1)
+
+
+def jaccard(x: Set[str], y: Set[str]) -> float:
+    union = len(x | y)
+    return len(x & y) / union if union else 0.0
+
+
+class NearDupIndex:
+    """
+    제목을 하나씩 넣으며 이미 넣은 것 중 근사 중복을 찾는다.
+    match(title, source) → 중복이면 그 항목의 id, 아니면 None. add(id, title, source)로 등록.
+    """
+
+    def __init__(self, threshold: float = SAME_SOURCE_THRESHOLD,
+                 cross_source_threshold: Optional[float] = CROSS_SOURCE_THRESHOLD,
+                 bands: int = BANDS, rows: int = ROWS):
+        """cross_source_threshold=None이면 다른 매체끼리는 합치지 않는다 (예전 동작)."""
+        self.threshold = threshold
+        self.cross_source_threshold = cross_source_threshold
+        self.bands = bands
+        self.rows = rows
+        self._buckets: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+        self._items: Dict[int, Tuple[Set[str], str]] = {}
+        self._pending: Dict[str, Tuple[Set[str], List[Tuple[int, bytes]]]] = {}
+        self.compared = 0  # 실제 자카드를 계산한 후보 수 (비용 확인용)
+
+    def _keys(self, title: str) -> Tuple[Set[str], List[Tuple[int, bytes]]]:
+        cached = self._pending.get(title)
+        if cached is not None:
+            return cached
+        grams = shingles(title)
+        keys = []
+        if grams:
+            signature = minhash(grams, self.bands * self.rows)
+            keys = [(band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+                    for band in range(self.bands)]
+        self._pending = {title: (grams, keys)}  # match 직후 add가 다시 계산하지 않게
+        return grams, keys
+
+    def match(self, title: str, source: str) -> Optional[int]:
+        grams, keys = self._keys(title)
+        seen = set()
+        candidates = []
+        for key in keys:
+            for item_id in self._buckets.get(key, ()):
+                if item_id not in seen:
+                    seen.add(item_id)
+                    candidates.append(item_id)
+        for item_id in sorted(candidates):  # 먼저 넣은 것 우선 — 예전 순차 비교와 같게
+            other, other_source = self._items[item_id]
+            limit = self.threshold if other_source == source else self.cross_source_threshold
+            if limit is None:
+                continue
+            self.compared += 1
+            if jaccard(grams, other) >= limit:
+                return item_id
+        return None
+
+    def add(self, item_id: int, title: str, source: str) -> None:
+        grams, keys = self._keys(title)
+        self._items[item_id] = (grams, source)
+        for key in keys:
+            self._buckets[key].append(item_id)
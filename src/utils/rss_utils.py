@@ -1,9 +1,13 @@
 import calendar
 import html
-import requests
 import feedparser
 import re
+import time
 from datetime import datetime, timedelta, timezone
+from typing import NamedTuple, Optional
+
+from . import feed_stream, http_client
+from .feed_cache import content_digest
 
 
 USER_AGENT = {
@@ -11,20 +15,95 @@ USER_AGENT = {
 }
 
 
-def fetch_feed(url: str):
+class FeedDownload(NamedTuple):
+    """네트워크 단계의 결과. 캐시 적중이면 content 대신 cached(저장된 레코드)가 있다."""
+    url: str
+    content: Optional[bytes] = None
+    cached: Optional[dict] = None
+    etag: str = ""
+    last_modified: str = ""
+    digest: str = ""
+
+
+def download_feed(url: str, cache=None) -> Optional[FeedDownload]:
+    """
+    피드 원문만 받아 온다(파싱 없음). 실패하면 None.
+    cache(FeedCache)를 주면 조건부 GET을 보내고, 304이거나 본문이 지난번과
+    같으면 저장해 둔 레코드를 돌려준다 — 다시 파싱할 필요가 없다.
+    수집 엔진이 네트워크 대기와 파싱(CPU)을 서로 다른 풀에서 돌릴 수 있게 나눠 뒀다.
+    """
+    headers = dict(USER_AGENT)
+    if cache is not None:
+        headers.update(cache.validators(url))
     try:
-        response = requests.get(url, headers=USER_AGENT, timeout=10)
+        response = http_client.get(url, headers=headers, timeout=10)
+        if response.status_code == 304 and cache is not None:
+            record = cache.hit(url, "not_modified")
+            if record is not None:
+                return FeedDownload(url, cached=record)
         response.raise_for_status()
 
-        feed = feedparser.parse(response.content)
+        digest = content_digest(response.content) if cache is not None else ""
+        if cache is not None:
+            record = cache.get(url)
+            if record and record.get("digest") == digest:
+                return FeedDownload(url, cached=cache.hit(url, "same_digest"))
 
-        if feed.bozo:
-            return None
+        return FeedDownload(
+            url, content=response.content, etag=response.headers.get("ETag") or "",
+            last_modified=response.headers.get("Last-Modified") or "", digest=digest,
+        )
+    except Exception:
+        return None
 
-        return feed
 
-    except Exception:
+def parse_download(download: Optional[FeedDownload], cache=None, limit: int = 0):
+    """
+    download_feed 결과 → feedparser 결과(또는 같은 모양). 실패하면 None.
+    limit을 주면 앞쪽 limit건만 스트리밍으로 파싱하고(feed_stream), XML로 못 읽는
+    문서만 feedparser로 전체 파싱한다.
+    """
+    if download is None:
         return None
+    if download.cached is not None:
+        return feed_from_record(download.cached)
+    feed = feed_stream.parse_feed(download.content, limit) if limit else None
+    if feed is None:
+        try:
+            feed = feedparser.parse(download.content)
+        except Exception:
+            return None
+
+        if feed.bozo:
+            return None
+
+    if cache is not None:
+        cache.put(download.url, feed, etag=download.etag,
+                  last_modified=download.last_modified, digest=download.digest)
+    return feed
+
+
+def fetch_feed(url: str, cache=None):
+    """피드를 받아 파싱한다. 실패하면 None."""
+    return parse_download(download_feed(url, cache), cache)
+
+
+def feed_from_record(record):
+    """FeedCache 레코드 → feedparser 결과와 같은 모양(entries, feed.updated_parsed)."""
+    def as_struct(value):
+        return time.struct_time(value) if value else None
+
+    entries = []
+    for raw in record.get("entries") or []:
+        entry = feedparser.FeedParserDict(raw)
+        for key in ("published_parsed", "updated_parsed"):
+            if raw.get(key):
+                entry[key] = as_struct(raw[key])
+        entries.append(entry)
+    meta = feedparser.FeedParserDict()
+    if record.get("feed_updated"):
+        meta["updated_parsed"] = as_struct(record["feed_updated"])
+    return feedparser.FeedParserDict(feed=meta, entries=entries, bozo=0)
 
 
 _GOOGLE_NEWS_WRAPPER = re.compile(
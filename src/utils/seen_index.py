@@ -0,0 +1,143 @@
+"""
+Persistent Seen-link Index
+전날까지 실은 기사를 다시 싣지 않으려고(실측 21%) 수집 시작마다 최근 N일 일일
+스냅샷(하루 ~160KB)을 전부 json.load하고, 기사마다 _canonical_link(urlsplit +
+parse_qsl + urlencode)를 다시 돌렸다. 쓰는 건 링크뿐이다.
+
+스냅샷을 저장할 때(html_generator._save_raw_snapshot) 그날 실린 링크를 한 줄씩
+"날짜<TAB>정규화 링크 해시"로 덧붙여 두고, 수집은 이 파일 하나만 읽어 날짜 범위로
+자른다. 줄은 날짜 순으로 쌓이므로 범위는 이분 탐색으로 찾는다. KEEP_DAYS보다 오래된
+줄은 덧붙일 때 파일을 다시 써서 버린다 — 되돌아볼 일수를 30·90일로 늘려도
+스냅샷 수십 개를 여는 비용이 생기지 않는다.
+
+덧붙이다 중단돼 반쯤 쓰인 줄은 읽을 때 건너뛴다. 파일이 없으면(처음 도입한 날)
+남아 있는 스냅샷에서 한 번 만든다(backfill).
+"""
+import bisect
+import hashlib
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, List, Set, Tuple
+
+from .dedup import _canonical_link, load_recent_links
+
+_KST = timezone(timedelta(hours=9))
+
+INDEX_FILE = "seen_links.tsv"
+# 이보다 오래된 줄은 버린다 — news_aggregator.CROSS_DAY_LOOKBACK_DAYS보다 커야 한다
+KEEP_DAYS = 31
+# 링크 해시 길이(바이트). 하루 수백 건 × KEEP_DAYS면 8바이트로 충돌 걱정이 없다
+_KEY_BYTES = 8
+
+
+def link_key(link: str) -> str:
+    """정규화 링크의 짧은 해시 — 인덱스와 수집 필터(seen_links)가 같은 키를 쓴다."""
+    return canonical_key(_canonical_link(link))
+
+
+def canonical_key(canonical: str) -> str:
+    """이미 정규화한 링크의 해시 (NewsArticle.link_key가 정규화 결과를 재사용)."""
+    if not canonical:
+        return ""
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=_KEY_BYTES).hexdigest()
+
+
+def _today(today=None) -> date:
+    if today is None:
+        return datetime.now(_KST).date()
+    return today.date() if isinstance(today, datetime) else today
+
+
+class SeenIndex:
+    """
+    raw_data_dir/seen_links.tsv — "YYYY-MM-DD\\t<hex>" 줄의 날짜 순 덧붙이기 파일.
+    filename을 바꾸면 같은 형식으로 다른 8바이트 키(story_fingerprint의 SimHash)를 담는다.
+    """
+
+    def __init__(self, raw_data_dir: str = "", filename: str = INDEX_FILE):
+        self.raw_data_dir = raw_data_dir
+        self.path = os.path.join(raw_data_dir, filename) if raw_data_dir else ""
+
+    def exists(self) -> bool:
+        return bool(self.path) and os.path.exists(self.path)
+
+    def _read(self) -> List[Tuple[str, str]]:
+        if not self.exists():
+            return []
+        entries = []
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    day, _, key = line.rstrip("\n").partition("\t")
+                    if len(day) == 10 and len(key) == 2 * _KEY_BYTES:
+                        entries.append((day, key))
+        except OSError:
+            return []
+        # 덧붙이기라 거의 항상 이미 정렬돼 있다 (정렬은 그대로 O(n))
+        entries.sort(key=lambda e: e[0])
+        return entries
+
+    def recent(self, days: int, today=None) -> Set[str]:
+        """오늘을 뺀 최근 days일 동안 실린 링크의 link_key 집합."""
+        base = _today(today)
+        entries = self._read()
+        dates = [day for day, _ in entries]
+        lo = bisect.bisect_left(dates, (base - timedelta(days=days)).isoformat())
+        hi = bisect.bisect_left(dates, base.isoformat())
+        return {key for _, key in entries[lo:hi]}
+
+    def record(self, links: Iterable[str], date_str: str, keep_days: int = KEEP_DAYS) -> int:
+        """
+        date_str(YYYY-MM-DD)에 실린 링크를 덧붙인다. 같은 날 재실행이면 이미 있는 것은
+        건너뛴다. 덧붙인 줄 수를 돌려준다.
+        """
+        return self.record_keys((link_key(link) for link in links), date_str, keep_days)
+
+    def record_keys(self, keys: Iterable[str], date_str: str, keep_days: int = KEEP_DAYS) -> int:
+        """record와 같되 이미 만든 16자리 hex 키를 그대로 덧붙인다."""
+        if not self.path:
+            return 0
+        entries = self._read()
+        already = {key for day, key in entries if day == date_str}
+        new = []
+        for key in keys:
+            if key and len(key) == 2 * _KEY_BYTES and key not in already:
+                already.add(key)
+                new.append(key)
+
+        oldest_kept = (date.fromisoformat(date_str) - timedelta(days=keep_days)).isoformat()
+        os.makedirs(self.raw_data_dir, exist_ok=True)
+        if entries and entries[0][0] < oldest_kept:
+            # 만료된 줄이 생겼다 — 남길 것만 모아 통째로 다시 쓴다(원자적 교체)
+            kept = [e for e in entries if e[0] >= oldest_kept] + [(date_str, k) for k in new]
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.writelines(f"{day}\t{key}\n" for day, key in kept)
+            os.replace(tmp, self.path)
+        elif new:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.writelines(f"{date_str}\t{key}\n" for key in new)
+        return len(new)
+
+    def backfill(self, days: int = KEEP_DAYS, today=None) -> int:
+        """인덱스가 없을 때 남아 있는 일일 스냅샷에서 한 번 만든다. 덧붙인 줄 수."""
+        base = _today(today)
+        added = 0
+        for back in range(days, 0, -1):
+            day = base - timedelta(days=back)
+            # load_recent_links(days=1)는 기준일 '전날' 하루치를 읽는다
+            next_day = datetime.combine(day + timedelta(days=1), datetime.min.time(), _KST)
+            links = load_recent_links(self.raw_data_dir, days=1, today=next_day)
+            if links:
+                added += self.record(links, day.isoformat())
+        return added
+
+
+def load_seen_keys(raw_data_dir: str, days: int, today=None) -> Set[str]:
+    """수집용 — 최근 days일 실린 링크의 link_key. 인덱스가 없으면 스냅샷에서 먼저 만든다."""
+    index = SeenIndex(raw_data_dir)
+    if not index.path:
+        return set()
+    if not index.exists() and os.path.isdir(raw_data_dir):
+        index.backfill(KEEP_DAYS, today)
+    return index.recent(days, today)
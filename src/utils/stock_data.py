@@ -16,9 +16,9 @@ from io import StringIO
 from typing import Dict, List, Optional
 
 import pandas as pd
-import requests
 import yfinance as yf
 
+from . import http_client
 from .logger import setup_logger
 
 logger = setup_logger()
@@ -78,7 +78,7 @@ def _fetch_domestic_history(code: str, pages: int = 3) -> Optional[pd.DataFrame]
     try:
         for page in range(1, pages + 1):
             url = f"https://finance.naver.com/item/sise_day.naver?code={code}&page={page}"
-            resp = requests.get(url, headers=_HEADERS, timeout=_REQUEST_TIMEOUT)
+            resp = http_client.get(url, headers=_HEADERS, timeout=_REQUEST_TIMEOUT)
             resp.encoding = "euc-kr"
             tables = pd.read_html(StringIO(resp.text))
             df = tables[0].dropna()
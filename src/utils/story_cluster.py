@@ -0,0 +1,145 @@
+"""
+Cross-source Story Clustering
+큰 사건은 연합뉴스·연합뉴스TV·구글 뉴스·한겨레가 거의 동시에 낸다. 제목이 서로 달라
+near_dup(제목 자카드)에는 안 걸리고, 매체 균형 선별(_select_balanced)에서 매체마다 한
+자리씩 차지한 뒤 _summarize_chunk가 같은 사건을 네 번 요약한다 — 토큰과 호출을 쓰고,
+그만큼 다른 사건이 들어갈 자리가 줄어든다.
+
+중복 제거 뒤, 선별 전에 한 카테고리의 기사(국내·해외 함께)를 제목+요약 앞부분의 글자
+n-gram TF-IDF 벡터로 만들고 코사인 유사도로 같은 사건끼리 묶는다. 묶음마다 가장 상세한
+기사 하나만 대표로 남기고, 나머지 매체·링크는 대표의 related_sources에 붙인다. 묶음
+크기(cluster_size)는 '여러 매체가 다룬 사건'이라는 중요도 신호로 쓴다.
+
+묶기는 단일 연결(single-linkage)이 아니라 대표 기준이다: 대표와 직접 비슷한 기사만
+들어간다. 단일 연결이면 A~B, B~C가 이어져 다른 사건(금리 동결 / 금리 전망)까지 한
+덩어리가 된다. 유사도가 넘어도 제목의 숫자(같은 단위에 다른 값)나 방향(급등 / 하락)이
+어긋나면 묶지 않는다 — 주어와 사건 낱말이 같은 다른 사건은 n-gram이 가르지 못한다.
+"""
+import re
+from collections import defaultdict
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from .dedup import normalize_title
+
+# 한국어는 조사가 붙어 단어 단위가 흔들린다("발사체를"/"발사체") — 글자 n-gram으로 본다
+NGRAM_CHARS = 2
+# 요약은 앞부분만 — 리드 문장이 사건을 말하고, 뒤쪽은 매체마다 다른 배경 설명이다
+SUMMARY_CHARS = 160
+# 대표와 이만큼 비슷해야 같은 사건. 같은 사건 다른 매체 기사가 0.32~0.62, 같은 주제의
+# 다른 사건(금리 동결 / 금리 전망)이 0.1 이하, 주어만 같은 다른 사건("삼성전자, 갤럭시
+# 신제품 공개" / "삼성전자, 반도체 신공장 착공")이 0.23이었다 — 0.25로 두었을 때는 날짜
+# 표기까지 겹쳐 후자가 한 묶음이 되고 작은 쪽이 지면에서 빠졌다.
+# 주어에 사건 낱말까지 같은 기사("주가 급등" / "주가 하락", 3분기 / 4분기 영업이익)는
+# 0.39~0.43으로 같은 사건보다 높게 나와 문턱으로는 못 가른다 — _conflicts가 제목으로 가른다
+SIMILARITY_THRESHOLD = 0.3
+# 제목에서 값을 비교하는 단위. 같은 단위에 값이 다르면 다른 사건이다(3분기 / 4분기).
+# 속보의 사망자 수처럼 같은 사건의 숫자가 바뀌는 경우도 갈라지지만, 두 번 요약되는 편이
+# 한 사건이 지면에서 빠지는 것보다 낫다
+NUMBER_UNITS = ("%", "분기", "조", "억", "만", "원", "달러", "회", "년", "월", "명", "배", "위",
+                "나노", "건", "개", "곳")
+# 제목의 방향 낱말. 한쪽 낱말만 있는 제목끼리 방향이 다르면 다른 사건이다
+RISING_WORDS = ("급등", "상승", "반등", "증가", "인상", "확대", "돌파", "호조", "강세", "최고")
+FALLING_WORDS = ("급락", "하락", "감소", "인하", "축소", "하향", "부진", "약세", "최저")
+# 이만큼의 매체가 다룬 사건은 LLM이 실패해도 중요 기사로 본다
+IMPORTANT_CLUSTER_SIZE = 3
+
+_SPACES = re.compile(r"\s+")
+# 같은 날 기사라면 다 들어 있는 날짜("17일")와 말머리("[속보]")는 사건과 무관하게 겹친다
+_NOISE = re.compile(r"\d{1,2}일|\[[^\]]{1,10}\]")
+_NUMBER = re.compile(r"(\d+(?:\.\d+)?)\s*(" + "|".join(sorted(NUMBER_UNITS, key=len, reverse=True)) + ")")
+
+
+def _text(article) -> str:
+    summary = _SPACES.sub(" ", (article.summary or "")[:SUMMARY_CHARS])
+    title = _NOISE.sub(" ", article.title or "")
+    return normalize_title(title) + " " + normalize_title(_NOISE.sub(" ", summary))
+
+
+def _numbers(title: str) -> Dict[str, set]:
+    found: Dict[str, set] = defaultdict(set)
+    for value, unit in _NUMBER.findall(re.sub(r"(?<=\d),(?=\d)", "", _NOISE.sub(" ", title))):
+        found[unit].add(float(value))
+    return found
+
+
+def _direction(title: str) -> int:
+    rising = any(w in title for w in RISING_WORDS)
+    falling = any(w in title for w in FALLING_WORDS)
+    return int(rising) - int(falling)
+
+
+def _conflicts(a: str, b: str) -> bool:
+    """두 제목이 숫자나 방향에서 어긋나 같은 사건일 수 없나."""
+    numbers_a, numbers_b = _numbers(a), _numbers(b)
+    if any(numbers_a[unit].isdisjoint(numbers_b[unit]) for unit in numbers_a.keys() & numbers_b.keys()):
+        return True
+    return _direction(a) * _direction(b) < 0
+
+
+def _ngrams(text: str) -> List[str]:
+    if len(text) <= NGRAM_CHARS:
+        return [text] if text.strip() else []
+    grams = (text[i:i + NGRAM_CHARS] for i in range(len(text) - NGRAM_CHARS + 1))
+    return [g for g in grams if g.strip()]
+
+
+def tfidf_matrix(texts: Sequence[str]) -> np.ndarray:
+    """행마다 L2 정규화된 TF-IDF 벡터 (문서 × n-gram). 행끼리 내적이 곧 코사인 유사도."""
+    vocab: Dict[str, int] = {}
+    rows = []
+    for text in texts:
+        counts: Dict[int, int] = defaultdict(int)
+        for gram in _ngrams(text):
+            counts[vocab.setdefault(gram, len(vocab))] += 1
+        rows.append(counts)
+
+    matrix = np.zeros((len(texts), len(vocab)), dtype=np.float32)
+    for i, counts in enumerate(rows):
+        if counts:
+            matrix[i, list(counts)] = list(counts.values())
+    if not vocab:
+        return matrix
+    # 여러 기사에 흔한 n-gram("정부", "발표")일수록 가중치를 낮춘다 (smooth idf)
+    df = np.count_nonzero(matrix, axis=0)
+    matrix *= np.log((1 + len(texts)) / (1 + df)) + 1
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return matrix / norms
+
+
+def _detail(article) -> int:
+    return len(article.summary or "")
+
+
+def cluster_stories(articles: List, threshold: float = SIMILARITY_THRESHOLD) -> List:
+    """
+    같은 사건을 다룬 기사를 묶어 대표만 돌려준다 (입력 순서 유지).
+    대표에는 cluster_size(묶음 기사 수)와 related_sources([{source, link, fingerprint}])를 채운다.
+    """
+    if len(articles) < 2:
+        return list(articles)
+
+    similarity = tfidf_matrix([_text(a) for a in articles])
+    similarity = similarity @ similarity.T
+
+    # 가장 상세한 기사부터 대표가 된다 — 동률이면 입력 순서
+    order = sorted(range(len(articles)), key=lambda i: (-_detail(articles[i]), i))
+    assigned = np.zeros(len(articles), dtype=bool)
+    leaders = []
+    for i in order:
+        if assigned[i]:
+            continue
+        members = [j for j in np.flatnonzero((similarity[i] >= threshold) & ~assigned)
+                   if j == i or not _conflicts(articles[i].title or "", articles[j].title or "")]
+        assigned[members] = True
+        assigned[i] = True
+        leader = articles[i]
+        others = [articles[j] for j in members if j != i]
+        leader.cluster_size = 1 + len(others)
+        leader.related_sources = [{"source": a.source, "link": a.link,
+                                   "fingerprint": a.fingerprint} for a in others]
+        leaders.append(i)
+
+    return [articles[i] for i in sorted(leaders)]
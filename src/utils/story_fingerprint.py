@@ -0,0 +1,106 @@
+"""
+Cross-day Story Fingerprints
+seen_index는 정규화 링크로만 '이미 실은 기사'를 거른다. 같은 기사가 새 URL로 다시 오면
+(구글 뉴스 리다이렉트 링크, 동아 / 동아 건강 피드, 통신사 기사 전재) 그대로 통과해
+다시 요약된다. 스냅샷의 제목은 LLM이 매일 다르게 재서술한 것이라 비교에 못 쓴다.
+
+수집 시점의 원래 제목 + 요약 앞부분으로 64비트 SimHash를 만들어 기사에 붙여 두고
+(NewsArticle.fingerprint), 스냅샷을 저장할 때 seen_index와 같은 형식의 날짜별 덧붙이기
+파일(seen_fingerprints.tsv)에 남긴다. 다음 실행은 최근 N일치를 읽어 해밍 거리
+MAX_DISTANCE 이하인 기사를 '이미 실은 기사'로 뺀다.
+
+거리 d 이하인 두 64비트 값은 d+1개 블록 중 적어도 하나가 통째로 같다(비둘기집) —
+블록 값별 버킷만 보면 되므로 조회 한 번에 저장된 지문의 블록당 1/256 남짓만 비교한다.
+"""
+import hashlib
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from .dedup import normalize_title
+from .seen_index import SeenIndex
+
+FINGERPRINT_FILE = "seen_fingerprints.tsv"
+SHINGLE_CHARS = 3
+# 요약은 앞부분만 — 전재 기사는 리드가 같고 끝(기자 서명·관련 기사)이 다르다
+SUMMARY_CHARS = 200
+# 같은 기사에 "[속보]" 머리말이 붙거나 요약 끝 한 문장이 다르면 6비트 안팎, 다른 기사
+# (같은 사건의 다른 매체 기사 포함)끼리는 25비트 이상이었다. 블록이 1바이트씩 8개가 된다
+MAX_DISTANCE = 7
+_BITS = 64
+_BLOCKS = MAX_DISTANCE + 1
+_BLOCK_BITS = _BITS // _BLOCKS
+_SHIFTS = np.arange(_BITS, dtype=np.uint64)
+_SPACES = re.compile(r"\s+")
+
+
+def simhash(text: str) -> int:
+    """글자 SHINGLE_CHARS-gram의 64비트 SimHash. 빈 텍스트면 0."""
+    if len(text) < SHINGLE_CHARS:
+        grams = [text] if text else []
+    else:
+        grams = [text[i:i + SHINGLE_CHARS] for i in range(len(text) - SHINGLE_CHARS + 1)]
+    if not grams:
+        return 0
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "big")
+         for g in grams), dtype=np.uint64, count=len(grams))
+    bits = (hashes[:, None] >> _SHIFTS[None, :]) & np.uint64(1)
+    votes = 2 * bits.sum(axis=0, dtype=np.int64) - len(grams)
+    return int(np.sum(np.left_shift(np.uint64(1), _SHIFTS[votes > 0]), dtype=np.uint64))
+
+
+def fingerprint(title: str, summary: str = "") -> str:
+    """원래(LLM 이전) 제목·요약의 지문 — seen_index 키와 같은 16자리 hex. 내용이 없으면 ''."""
+    lead = _SPACES.sub(" ", (summary or "")[:SUMMARY_CHARS])
+    text = normalize_title(title or "") + normalize_title(lead)
+    value = simhash(text)
+    return f"{value:016x}" if value else ""
+
+
+class FingerprintLookup:
+    """지문 집합에서 해밍 거리 MAX_DISTANCE 이내의 것이 있는지 블록 버킷으로 찾는다."""
+
+    def __init__(self, keys: Iterable[str] = ()):
+        self._buckets: List[Dict[int, List[int]]] = [defaultdict(list) for _ in range(_BLOCKS)]
+        self.size = 0
+        self.compared = 0  # 해밍 거리를 계산한 후보 수 (비용 확인용)
+        for key in keys:
+            self.add(key)
+
+    @staticmethod
+    def _blocks(value: int) -> List[int]:
+        mask = (1 << _BLOCK_BITS) - 1
+        return [(value >> (b * _BLOCK_BITS)) & mask for b in range(_BLOCKS)]
+
+    def add(self, key: str) -> None:
+        try:
+            value = int(key, 16)
+        except (TypeError, ValueError):
+            return
+        for b, block in enumerate(self._blocks(value)):
+            self._buckets[b][block].append(value)
+        self.size += 1
+
+    def match(self, key: str) -> bool:
+        if not key:
+            return False
+        value = int(key, 16)
+        for b, block in enumerate(self._blocks(value)):
+            for other in self._buckets[b].get(block, ()):
+                self.compared += 1
+                if bin(value ^ other).count("1") <= MAX_DISTANCE:
+                    return True
+        return False
+
+
+def load_seen_fingerprints(raw_data_dir: str, days: int, today=None) -> FingerprintLookup:
+    """수집용 — 오늘을 뺀 최근 days일 동안 실린 기사의 지문. 인덱스가 없으면 비어 있다."""
+    return FingerprintLookup(SeenIndex(raw_data_dir, FINGERPRINT_FILE).recent(days, today))
+
+
+def record_fingerprints(raw_data_dir: str, keys: Iterable[str], date_str: str) -> int:
+    """그날 실린 기사의 지문을 덧붙인다 (html_generator._save_raw_snapshot)."""
+    return SeenIndex(raw_data_dir, FINGERPRINT_FILE).record_keys(keys, date_str)
@@ -0,0 +1,99 @@
+"""
+Per-article LLM Summary Cache
+같은 날 재실행(타임아웃·push 실패 뒤 재시도, workflow_dispatch)이면 _summarize_chunk가
+모든 기사를 다시 LLM에 보낸다. 청크 단위(프롬프트 전체)로 캐시하면 기사 구성이 조금만
+달라져도 — 새 기사 하나가 끼면 뒤 청크가 전부 밀린다 — 다 빗나간다.
+
+기사 하나의 응답 항목(paraphrased_title, summary_250, detail_600, is_important,
+off_topic, exclude)을 "정규화 링크 + 입력(제목·본문/요약·카테고리) 해시 + 모델 +
+프롬프트 버전" 키로 남긴다. 요약 단계는 캐시에 없는 기사만 청크로 묶어 보낸다.
+입력이나 프롬프트가 바뀌면 키가 달라져 자연히 다시 요약된다.
+"""
+import hashlib
+import json
+import threading
+import time
+from typing import Dict, Optional
+
+from .json_store import load_json, save_json
+
+# 기사는 MAX_ARTICLE_AGE_DAYS(3일)가 지나면 다시 실리지 않는다
+TTL_DAYS = 3
+MAX_BYTES = 4 * 1024 * 1024
+
+# 응답 항목에서 남길 필드 (id는 청크 안 번호라 빼고 저장한다)
+FIELDS = ("paraphrased_title", "summary_250", "detail_600", "is_important", "off_topic", "exclude")
+
+
+def input_digest(*parts: str) -> str:
+    """요약 입력의 해시 — 순서대로 이어 붙인 문자열 기준."""
+    joined = "\x1f".join(part or "" for part in parts)
+    return hashlib.blake2b(joined.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def cache_key(canonical_link: str, digest: str, model: str, prompt_version: int) -> str:
+    return input_digest(canonical_link, digest, model, str(prompt_version))
+
+
+class SummaryCache:
+    """key → {항목 필드…, at, used} (스레드 안전). path가 ''면 저장하지 않는다."""
+
+    def __init__(self, path: str = "", ttl_days: float = TTL_DAYS, max_bytes: int = MAX_BYTES):
+        self.path = path
+        self.ttl = ttl_days * 86400
+        self.max_bytes = max_bytes
+        self._records: Dict[str, Dict] = load_json(path, {}) if path else {}
+        self._lock = threading.Lock()
+        self.stats = {"hit": 0, "miss": 0, "stored": 0}
+
+    def lookup(self, key: str, need_detail: bool = False) -> Optional[Dict]:
+        """
+        유효한 항목이면 응답 항목 dict. need_detail인데 상세 요약 없이 저장된 항목
+        (재시도 스윕은 detail 없이 받는다)은 없는 것으로 본다. 단 exclude·off_topic
+        항목은 지면에 안 실려 상세 요약이 필요 없다 — 그대로 쓴다.
+        """
+        now = time.time()
+        with self._lock:
+            record = self._records.get(key)
+            usable = (record is not None and now - record.get("at", 0) <= self.ttl
+                      and (not need_detail or record.get("detail_600")
+                           or record.get("exclude") or record.get("off_topic")))
+            if not usable:
+                self.stats["miss"] += 1
+                return None
+            record["used"] = now
+            self.stats["hit"] += 1
+            return {field: record.get(field) for field in FIELDS}
+
+    def store(self, key: str, item: Dict) -> None:
+        now = time.time()
+        record = {field: item.get(field) for field in FIELDS if item.get(field) is not None}
+        record.update(at=now, used=now)
+        with self._lock:
+            previous = self._records.get(key)
+            # 상세 요약이 있던 항목을 detail 없는 재시도 결과로 덮어 잃지 않게
+            if previous and previous.get("detail_600") and not record.get("detail_600"):
+                record["detail_600"] = previous["detail_600"]
+            self._records[key] = record
+            self.stats["stored"] += 1
+
+    def _evict(self, now: float) -> None:
+        self._records = {k: r for k, r in self._records.items() if now - r.get("at", 0) <= self.ttl}
+        sizes = {k: len(json.dumps(r, ensure_ascii=False).encode("utf-8"))
+                 for k, r in self._records.items()}
+        total = sum(sizes.values())
+        for key in sorted(self._records, key=lambda k: self._records[k].get("used", 0)):
+            if total <= self.max_bytes:
+                break
+            total -= sizes[key]
+            del self._records[key]
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            self._evict(time.time())
+            save_json(self.path, self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
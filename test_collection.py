@@ -0,0 +1,1226 @@
+"""
+Self-check: 수집 단계(피드 캐시·수집 스케줄링) 검증
+실제 피드는 받지 않는다 — HTTP 호출을 가짜 응답으로 바꿔치기해서
+"서버가 이렇게 답했을 때" 시나리오만 확인한다.
+
+python test_collection.py 로 실행. 실패 시 AssertionError로 즉시 중단.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+
+from src.utils import http_client, rss_utils
+from src.utils.feed_cache import FeedCache
+from src.utils.seen_index import link_key
+
+_RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>t</title>
+<item><title>First &amp; one</title><link>https://e/1</link>
+<description>desc 1</description><pubDate>Mon, 17 Aug 2026 01:00:00 +0000</pubDate></item>
+<item><title>Second</title><link>https://e/2</link>
+<description>desc 2</description><pubDate>Mon, 17 Aug 2026 00:00:00 +0000</pubDate></item>
+</channel></rss>"""
+
+
+class _Resp:
+    def __init__(self, status, content=b"", headers=None):
+        self.status_code = status
+        self.content = content
+        self.headers = headers or {}
+
+    encoding = None
+
+    def iter_content(self, chunk_size=1):
+        self.read = 0
+        for start in range(0, len(self.content), chunk_size):
+            self.read += len(self.content[start:start + chunk_size])
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", "replace")
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+
+def test_feed_cache_serves_entries_on_304():
+    """
+    두 번째 요청은 If-None-Match를 보내고, 304면 다시 파싱하지 않고 저장된 항목을
+    그대로 써야 한다. 캐시 파일을 다시 읽어도(다음 실행) 같은 결과가 나와야 한다.
+    피드 전문에서 뽑은 본문도 새로 파싱한 것과 같아야 한다 — 앞쪽이 사진 태그로 긴 전문도.
+    """
+    from src.collectors.rss_collector import parse_entries
+
+    photos = "".join(f'<figure><img src="https://e/photo/{i:04d}-{"x" * 80}.jpg"></figure>' for i in range(60))
+    prose = "<p>위원회는 오늘 결론을 냈다. 반대 의견도 기록으로 남겼다. 시행은 다음 달부터다.</p>" * 30
+    rss = _RSS.replace(b'<rss version="2.0">',
+                       b'<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">')
+    rss = rss.replace(b"<description>desc 1</description>",
+                      b"<description>desc 1</description><content:encoded><![CDATA["
+                      + (photos + prose).encode("utf-8") + b"]]></content:encoded>")
+    tmp = tempfile.mkdtemp(prefix="feed_cache_")
+    sent = []
+
+    def fake_get(url, headers=None, **kwargs):
+        sent.append(dict(headers or {}))
+        if (headers or {}).get("If-None-Match") == '"v1"':
+            return _Resp(304)
+        return _Resp(200, rss, {"ETag": '"v1"'})
+
+    original = http_client.get
+    http_client.get = fake_get
+    try:
+        path = os.path.join(tmp, "feeds.json")
+        cache = FeedCache(path)
+        first = rss_utils.fetch_feed("https://e/feed", cache=cache)
+        assert len(first.entries) == 2 and cache.stats["refreshed"] == 1
+        cache.save()
+
+        # 다음 실행: 파일에서 다시 읽은 캐시
+        cache = FeedCache(path)
+        second = rss_utils.fetch_feed("https://e/feed", cache=cache)
+        assert sent[-1].get("If-None-Match") == '"v1"', f"검증자를 보내지 않았다: {sent[-1]}"
+        assert cache.stats["not_modified"] == 1, f"304가 캐시 적중으로 처리되지 않았다: {cache.stats}"
+        assert [e.get("title") for e in second.entries] == [e.get("title") for e in first.entries]
+        assert second.entries[0].get("description") == "desc 1", "description 별칭이 사라졌다"
+        assert tuple(second.entries[0].get("published_parsed")) == tuple(first.entries[0].published_parsed), \
+            "발행일이 캐시를 거치며 바뀌었다"
+
+        fresh = parse_entries("e", rss_utils.FeedDownload("https://e/feed", content=rss), 10)
+        cached = parse_entries("e", rss_utils.download_feed("https://e/feed", cache=cache), 10)
+        assert fresh.cache_entries is not None and cached.cache_entries is None
+        assert "위원회는 오늘 결론을 냈다" in fresh.articles[0]["body"], fresh.articles[0]["body"][:80]
+        assert [a["body"] for a in cached.articles] == [a["body"] for a in fresh.articles], \
+            "캐시를 거친 본문이 새로 파싱한 본문과 다르다"
+    finally:
+        http_client.get = original
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_feed_cache_evicts_by_age_and_size():
+    """data/에 커밋되는 파일이라 오래 안 쓴 피드와 상한 초과분은 버려야 한다."""
+    tmp = tempfile.mkdtemp(prefix="feed_cache_")
+    try:
+        path = os.path.join(tmp, "feeds.json")
+        cache = FeedCache(path, max_age_days=7, max_bytes=2000)
+        feed = rss_utils.feedparser.parse(_RSS)
+        for i in range(5):
+            cache.put(f"https://e/{i}", feed, etag=f"e{i}")
+        now = time.time()
+        cache._records["https://e/0"]["used"] = now - 8 * 86400  # 목록에서 빠진 피드
+        for i in range(1, 5):
+            cache._records[f"https://e/{i}"]["used"] = now - i
+        cache.save()
+
+        kept = FeedCache(path)
+        assert "https://e/0" not in kept._records, "오래 안 쓴 피드가 남아 있다"
+        assert "https://e/1" in kept._records, "가장 최근에 쓴 피드가 먼저 버려졌다"
+        assert len(kept) < 4, f"크기 상한이 적용되지 않았다: {len(kept)}"
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_async_collector_overlaps_feeds_and_caps_per_host():
+    """
+    async 모드는 모든 피드를 한꺼번에 띄워야 한다(수집 시간 ≈ 가장 느린 피드).
+    단, 같은 호스트에는 PER_HOST_CONCURRENCY를 넘겨 붙으면 안 되고,
+    결과는 jobs 순서 그대로여야 한다.
+    """
+    import threading
+    from src.collectors import async_collector
+
+    lock = threading.Lock()
+    in_flight, peak = {}, {}
+
+    class FakeCollector:
+        def download(self, category):
+            host = category.split("/")[0]
+            with lock:
+                in_flight[host] = in_flight.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), in_flight[host])
+            time.sleep(0.1)
+            with lock:
+                in_flight[host] -= 1
+            return category
+
+        def parse(self, category, download, limit):
+            return [download]
+
+    jobs = [({"id": f"s{i}", "feeds": {f"h{i % 3}/c{i}": f"https://h{i % 3}.example/c{i}"}},
+             f"h{i % 3}/c{i}") for i in range(18)]
+    started = time.monotonic()
+    results = async_collector.collect_all(jobs, lambda source: FakeCollector(), per_host=3)
+    elapsed = time.monotonic() - started
+
+    assert [r[1] for r in results] == [c for _, c in jobs], "결과 순서가 jobs와 다르다"
+    assert all(r[2] == [r[1]] for r in results)
+    assert max(peak.values()) <= 3, f"호스트별 상한을 넘었다: {peak}"
+    # 호스트 3곳 × 상한 3 → 18건이 0.1초짜리 2묶음. 12스레드 고정 풀이면 이보다 느리다
+    assert elapsed < 0.5, f"피드들이 동시에 돌지 않았다: {elapsed:.2f}s"
+
+
+def test_slowest_feeds_are_scheduled_first():
+    """
+    느린 피드가 목록 끝에 있으면 마지막에 시작해 수집 단계 전체가 늘어난다.
+    지연 기록이 남아 다음 실행에서 느린 순으로 정렬되고, 그 순서의 예상
+    makespan이 선언 순서보다 짧아야 한다. 기록 없는 피드는 중앙값 취급.
+    """
+    from src.utils.feed_stats import FeedStats, predict_makespan
+
+    tmp = tempfile.mkdtemp(prefix="feed_stats_")
+    try:
+        path = os.path.join(tmp, "feed_stats.json")
+        stats = FeedStats(path)
+        declared = {"a": 1.0, "b": 1.0, "c": 1.0, "d": 1.0, "slow": 4.0}
+        for key, seconds in declared.items():
+            for jitter in (0.0, 0.1, -0.1):
+                stats.record_fetch(key, seconds + jitter)
+        stats.save()
+
+        stats = FeedStats(path)  # 다음 실행
+        ordered = stats.order_slowest_first(list(declared) + ["new"], key_of=lambda k: k)
+        assert ordered[0] == "slow", f"가장 느린 피드가 먼저 시작하지 않는다: {ordered}"
+        assert ordered.index("new") > 0, "기록 없는 피드가 중앙값이 아니라 최악값으로 취급됐다"
+
+        lpt = predict_makespan([stats.expected_latency(k) for k in ordered if k != "new"], 2)
+        naive = predict_makespan(list(declared.values()), 2)
+        assert lpt < naive, f"LPT 순서가 선언 순서보다 짧지 않다: {lpt} vs {naive}"
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_dead_feeds_back_off_and_get_probed():
+    """
+    쓸 기사를 BACKOFF_AFTER_EMPTY_RUNS번 연속 못 낸 피드는 건너뛰되,
+    PROBE_EVERY_RUNS번에 한 번은 다시 받아 보고 되살아났으면 바로 복귀해야 한다.
+    실행 요약에는 무소득 피드와 깔때기 합계가 나와야 한다.
+    """
+    from src.utils import feed_stats as fs
+
+    tmp = tempfile.mkdtemp(prefix="feed_stats_")
+    path = os.path.join(tmp, "feed_stats.json")
+
+    def run(fresh):
+        stats = fs.FeedStats(path)
+        if stats.should_skip("dead/world"):
+            stats.mark_skipped("dead/world")
+            fetched = False
+        else:
+            stats.record_fetch("dead/world", 0.5, 4096)
+            stats.count("dead/world", "entries", 10)
+            stats.count("dead/world", "stale", 10 - fresh)
+            stats.count("dead/world", "fresh", fresh)
+            fetched = True
+        stats.finish_run()
+        report = stats.report()
+        stats.save()
+        return fetched, report
+
+    try:
+        for _ in range(fs.BACKOFF_AFTER_EMPTY_RUNS):
+            fetched, report = run(fresh=0)
+            assert fetched
+        assert "dead/world" in report and "entries 10 → stale 10" in report, report
+
+        history = [run(fresh=0)[0] for _ in range(fs.PROBE_EVERY_RUNS)]
+        assert history == [False] * (fs.PROBE_EVERY_RUNS - 1) + [True], \
+            f"건너뛰기·재확인 주기가 어긋났다: {history}"
+        _, report = run(fresh=0)
+        assert "건너뜀" in report and "dead/world" in report, report
+
+        # 재확인 때 되살아났으면 다음 실행부터 다시 매번 받는다
+        for _ in range(fs.PROBE_EVERY_RUNS - 2):
+            run(fresh=0)
+        assert run(fresh=2)[0], "재확인 실행에서 피드를 받지 않았다"
+        assert run(fresh=2)[0], "되살아난 피드가 계속 건너뛰어진다"
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_failed_feed_downloads_do_not_count_as_empty_runs():
+    """
+    받기 실패(연결 오류·5xx)는 피드가 쓸 기사를 못 낸 게 아니다 — 몇 번 연속 실패해도
+    백오프에 들어가지 않아야 한다. 실행 요약에는 받기 실패로 따로 나온다.
+    """
+    from src.collectors.rss_collector import RSSCollector
+    from src.utils import feed_stats as fs
+
+    tmp = tempfile.mkdtemp(prefix="feed_stats_")
+    path = os.path.join(tmp, "feed_stats.json")
+
+    def fake_get(url, **kwargs):
+        raise requests.ConnectionError("connection reset")
+
+    original = http_client.get
+    http_client.get = fake_get
+    try:
+        for _ in range(fs.BACKOFF_AFTER_EMPTY_RUNS + 1):
+            stats = fs.FeedStats(path)
+            assert not stats.should_skip("flaky/world"), "받기 실패만으로 백오프에 들어갔다"
+            collector = RSSCollector("flaky", "Flaky", {"world": "https://e/feed"}, feed_stats=stats)
+            assert collector.collect("world") == []
+            stats.finish_run()
+            report = stats.report()
+            stats.save()
+        assert "받기 실패" in report and "flaky/world" in report, report
+        assert "쓸 기사 0건" not in report, report
+    finally:
+        http_client.get = original
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_streaming_parse_stops_at_limit_and_filters_before_cleaning():
+    """
+    큰 피드도 앞쪽 limit건만 읽어야 하고(뒤쪽이 깨져 있어도 상관없다), 결과는
+    feedparser와 같아야 한다. XML로 못 읽는 문서는 feedparser로 폴백한다.
+    오래된·이미 실은 기사는 clean_html을 부르기 전에 버려야 한다.
+    """
+    from datetime import datetime, timedelta, timezone
+    from src.collectors import rss_collector
+    from src.utils import feed_stream
+
+    items = b"".join(
+        b"<item><title>T%d &amp; x</title><link>https://e/%d</link><description><![CDATA[<p>d%d</p>]]>"
+        b"</description><pubDate>Mon, 17 Aug 2026 %02d:00:00 +0000</pubDate></item>" % (i, i, i, 23 - i)
+        for i in range(20)
+    )
+    doc = (b'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>t</title>'
+           + items + b"<item><title>broken")  # limit 뒤쪽은 잘린 문서
+    streamed = feed_stream.parse_feed(doc, 5)
+    assert streamed is not None and len(streamed.entries) == 5, "limit에서 멈추지 않았다"
+    reference = rss_utils.feedparser.parse(doc.replace(b"<item><title>broken", b"</channel></rss>"))
+    for mine, theirs in zip(streamed.entries, reference.entries):
+        for key in ("title", "link", "summary", "published_parsed"):
+            assert mine.get(key) == theirs.get(key), f"{key}: {mine.get(key)!r} != {theirs.get(key)!r}"
+
+    assert feed_stream.parse_feed(b"<rss><channel><item><title>&nbsp;</title></item></channel></rss>", 5) is None
+    bare_channel = rss_utils.parse_download(rss_utils.FeedDownload(
+        "https://e/feed", content=b"<channel><item><title>a</title><link>https://e/a</link></item></channel>"),
+        limit=5)
+    assert bare_channel is not None and len(bare_channel.entries) == 1, "feedparser 폴백이 안 됐다"
+
+    cleaned = []
+    original = rss_collector.clean_html
+
+    def counting_clean_html(text):
+        cleaned.append(text)
+        return original(text)
+
+    rss_collector.clean_html = counting_clean_html
+    try:
+        collector = rss_collector.RSSCollector(
+            "src", "Src", {"world": "https://e/feed"},
+            cutoff=datetime(2026, 8, 17, 20, tzinfo=timezone.utc) - timedelta(minutes=1),
+            seen_links={link_key("https://e/0")},
+        )
+        download = rss_utils.FeedDownload("https://e/feed", content=doc)
+        articles = collector.parse("world", download, limit=10)
+    finally:
+        rss_collector.clean_html = original
+    # 0번은 이미 실림, 1~3번(20~22시)만 cutoff 이후, 나머지는 오래됨
+    assert [a.link for a in articles] == ["https://e/1", "https://e/2", "https://e/3"], \
+        [a.link for a in articles]
+    assert len(cleaned) == 2 * len(articles), f"버릴 기사까지 clean_html을 거쳤다: {len(cleaned)}회"
+
+
+def test_parse_stage_runs_in_worker_processes():
+    """
+    파싱 단계는 ProcessPoolExecutor에서 돌고 기본형 레코드만 돌려줘야 한다.
+    결과(기사·캐시 항목·깔때기 수)는 같은 프로세스에서 파싱한 것과 같아야 한다.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from datetime import datetime, timezone
+    from src.collectors import rss_collector
+    from src.utils.feed_stats import FeedStats
+
+    cutoff = datetime(2026, 8, 17, 0, 30, tzinfo=timezone.utc)
+    download = rss_utils.FeedDownload("https://e/feed", content=_RSS, etag='"v1"')
+    local = rss_collector.parse_entries("src", download, 10, cutoff, {link_key("https://e/9")})
+    with ProcessPoolExecutor(max_workers=2, initializer=rss_collector.init_parse_worker,
+                             initargs=(cutoff, {link_key("https://e/9")})) as pool:
+        remote = pool.submit(rss_collector.parse_in_worker, "src", download, 10).result()
+    assert remote.articles == local.articles and remote.cache_entries == local.cache_entries
+    assert remote.counts == {"entries": 2, "stale": 1}, remote.counts
+
+    cache = FeedCache()
+    stats = FeedStats()
+    collector = rss_collector.RSSCollector("src", "Src", {"world": "https://e/feed"},
+                                           feed_cache=cache, feed_stats=stats)
+    articles = collector.absorb("world", download, remote)
+    assert [a.title for a in articles] == ["First & one"] and articles[0].feed_key == "src/world"
+    assert cache.validators("https://e/feed") == {"If-None-Match": '"v1"'}, "파싱 결과가 캐시에 안 들어갔다"
+    assert stats.totals()["stale"] == 1
+
+
+def test_feed_full_text_skips_body_fetch():
+    """
+    content:encoded로 본문 전체를 주는 피드(WordPress 계열)는 그걸 본문으로 쓰고
+    article_body가 페이지를 다시 받지 않아야 한다. 아낀 요청은 매체별로 센다.
+    피드 캐시를 거친 다음 실행(304)에서도 전문이 남아 있어야 한다.
+    """
+    from src.collectors import rss_collector
+    from src.utils import article_body
+
+    prose = "".join(f"<p>문단 {i}에서 정부는 새 정책을 발표했다. 전문가들은 효과를 지켜봐야 한다고 말했다. </p>"
+                    for i in range(12))
+    doc = ('<?xml version="1.0" encoding="UTF-8"?><rss version="2.0" '
+           'xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel><title>t</title>'
+           '<item><title>전문 기사</title><link>https://e/full</link><description>짧은 발췌 […]</description>'
+           '<pubDate>Mon, 17 Aug 2026 01:00:00 +0000</pubDate>'
+           f'<content:encoded><![CDATA[{prose}]]></content:encoded></item>'
+           '<item><title>발췌만</title><link>https://e/short</link><description>짧은 발췌</description></item>'
+           '</channel></rss>').encode("utf-8")
+
+    cache = FeedCache()
+    collector = rss_collector.RSSCollector("wp", "WP", {"it": "https://e/feed"}, feed_cache=cache)
+    articles = collector.parse("it", rss_utils.FeedDownload("https://e/feed", content=doc), limit=10)
+    full, short = articles
+    assert full.body_source == "feed" and "정부는 새 정책" in full.body, full.body[:80]
+    assert not short.body and not short.body_source
+    assert not article_body.needs_body(full) and article_body.needs_body(short)
+
+    cached = collector.parse("it", rss_utils.FeedDownload("https://e/feed", cached=cache.get("https://e/feed")),
+                             limit=10)
+    assert cached[0].body == full.body, "캐시에서 되살린 항목에 전문이 없다"
+
+    requested = []
+
+    def fake_get(url, **kwargs):
+        requested.append(url)
+        return _Resp(404)
+
+    original_get, original_stats = http_client.get, dict(article_body.BODY_STATS)
+    original_deadline = article_body._deadline
+    http_client.get = fake_get
+    article_body.BODY_STATS.clear()
+    article_body._deadline = None
+    try:
+        article_body.enrich(articles)
+        assert requested == ["https://e/short"], f"전문이 있는 기사까지 페이지를 받았다: {requested}"
+        assert article_body.BODY_STATS["WP"] == {"from_feed": 1, "cached": 0, "fetched": 0, "failed": 1,
+                                                 "skipped": 0}, \
+            article_body.BODY_STATS
+        assert "전문 1" in article_body.stats_summary()
+    finally:
+        http_client.get = original_get
+        article_body.BODY_STATS.clear()
+        article_body.BODY_STATS.update(original_stats)
+        article_body._deadline = original_deadline
+
+
+def test_body_cache_skips_known_pages_on_rerun():
+    """
+    재실행은 이미 본문을 뽑은 페이지와 실패한 페이지(403)를 다시 받지 않아야 한다.
+    추적 파라미터만 다른 링크는 같은 기사다. 실패 기록은 성공보다 빨리 만료된다.
+    """
+    from datetime import datetime, timezone
+    from src.collectors.base_collector import NewsArticle
+    from src.utils import article_body
+    from src.utils.body_cache import BodyCache
+
+    prose = "".join(f"<p>문단 {i}에서 위원회는 결론을 냈다. 반대 의견도 기록됐다. </p>" for i in range(15))
+    page = f'<html><head><meta property="article:published_time" content="2026-08-17T09:00:00+09:00">' \
+           f'</head><body><article>{prose}</article></body></html>'.encode("utf-8")
+    requested = []
+
+    def fake_get(url, **kwargs):
+        requested.append(url)
+        return _Resp(403) if "blocked" in url else _Resp(200, page)
+
+    def articles():
+        made = []
+        for link in ("https://e/ok?utm_source=rss", "https://e/blocked"):
+            article = NewsArticle("t", link, datetime(2026, 8, 17, tzinfo=timezone.utc), "짧다", "S")
+            article.date_is_approximate = True
+            made.append(article)
+        return made
+
+    tmp = tempfile.mkdtemp(prefix="body_cache_")
+    original_get, original_deadline = http_client.get, article_body._deadline
+    http_client.get = fake_get
+    article_body._deadline = None
+    try:
+        path = os.path.join(tmp, "bodies.json")
+        cache = BodyCache(path)
+        first = articles()
+        assert article_body.enrich(first, cache=cache) == 1
+        cache.save()
+        assert len(requested) == 2
+
+        cache = BodyCache(path)  # 같은 날 재실행
+        second = articles()
+        second[0].link = "https://e/ok"
+        assert article_body.enrich(second, cache=cache) == 1
+        assert len(requested) == 2, f"캐시에 있는 페이지를 다시 받았다: {requested[2:]}"
+        assert second[0].body == first[0].body and not second[0].date_is_approximate, \
+            "캐시의 본문·발행일이 반영되지 않았다"
+        assert cache.stats == {"hit": 1, "negative_hit": 1, "miss": 0, "stored": 0}, cache.stats
+
+        # 실패 기록만 만료 → 그것만 다시 시도
+        for record in cache._records.values():
+            record["at"] -= 13 * 3600
+        article_body.enrich(articles(), cache=cache)
+        assert requested[2:] == ["https://e/blocked"], requested
+    finally:
+        http_client.get = original_get
+        article_body._deadline = original_deadline
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_body_fetch_stops_once_article_is_read():
+    """
+    본문을 다 본 뒤의 스크립트·댓글 더미는 받지 않아야 한다. <article>이 없으면
+    문단 텍스트가 충분히 모였을 때, 그것도 아니면 바이트 상한에서 멈춘다.
+    어느 경우든 본문은 그대로 뽑혀야 한다.
+    """
+    from src.utils import article_body
+
+    prose = "".join(f"<p>문단 {i}에서 위원회는 결론을 냈다. 반대 의견도 기록됐다. </p>" for i in range(15))
+    junk = "<script>" + "x" * 2_000_000 + "</script>"
+    head = '<html><head><meta charset="utf-8"></head><body>'
+    pages = {
+        "https://e/article": f"{head}<article>{prose}</article>{junk}</body></html>",
+        "https://e/div": f'{head}<div class="content">{prose * 10}</div>{junk}</body></html>',
+        "https://e/junk": f"{head}{junk}{prose}</body></html>",
+    }
+    served = {}
+
+    def fake_get(url, stream=False, **kwargs):
+        assert stream, "본문 페이지를 통째로 받고 있다"
+        served[url] = _Resp(200, pages[url].encode("utf-8"))
+        return served[url]
+
+    original = http_client.get
+    http_client.get = fake_get
+    try:
+        for url in ("https://e/article", "https://e/div"):
+            body = article_body.fetch_body(url)
+            assert body and "위원회는 결론을" in body, f"{url}: 본문을 못 뽑았다"
+            assert served[url].read < 100_000, f"{url}: 본문 뒤까지 받았다 ({served[url].read}B)"
+        assert article_body.fetch_body("https://e/junk", max_bytes=64 * 1024) is None
+        assert served["https://e/junk"].read < 100_000, "바이트 상한에서 멈추지 않았다"
+    finally:
+        http_client.get = original
+
+
+def test_body_extraction_learns_container_per_host():
+    """
+    호스트마다 본문이 있던 컨테이너 경로를 배워 두고 다음 실행에서 그것부터 본다 —
+    전체 후보 탐색(_pick_body)을 건너뛴다. 개편으로 경로가 안 맞으면 전체 탐색으로
+    돌아가 새 경로를 배운다.
+    """
+    from src.utils import article_body
+    from src.utils.body_profiles import ExtractionProfiles
+
+    prose = "".join(f"<p>문단 {i}에서 위원회는 결론을 냈다. 반대 의견도 기록됐다. </p>" for i in range(15))
+    head = '<html><head><meta charset="utf-8"></head><body>'
+    layout = {"class": "article-text"}
+
+    def fake_get(url, stream=False, **kwargs):
+        page = (f'{head}<div id="content"><div class="{layout["class"]}">{prose}</div>'
+                f'<p class="related">관련기사: 다른 소식</p></div></body></html>')
+        return _Resp(200, page.encode("utf-8"))
+
+    scans = []
+    original_get, original_pick = http_client.get, article_body._pick_body
+
+    def counting_pick(tree):
+        scans.append(1)
+        return original_pick(tree)
+
+    http_client.get = fake_get
+    article_body._pick_body = counting_pick
+    tmp = tempfile.mkdtemp(prefix="body_profiles_")
+    try:
+        path = os.path.join(tmp, "body_profiles.json")
+        profiles = ExtractionProfiles(path)
+        body, _, _, _ = article_body._fetch("https://www.e.kr/a/1", False, profiles=profiles)
+        assert body and "위원회는 결론을" in body
+        assert profiles.path_for("e.kr") == '//div[@class="article-text"]', profiles._records
+        profiles.save()
+
+        profiles = ExtractionProfiles(path)  # 다음 실행
+        scans.clear()
+        for n in range(2, 5):
+            body, _, _, _ = article_body._fetch(f"https://e.kr/a/{n}", False, profiles=profiles)
+            assert body and "위원회는 결론을" in body
+        assert not scans, "배운 경로가 있는데 전체 탐색을 했다"
+        assert profiles.stats["e.kr"] == {"hit": 3, "miss": 0, "learned": 0}, profiles.stats
+
+        layout["class"] = "news_body"  # 개편
+        body, _, _, _ = article_body._fetch("https://e.kr/a/5", False, profiles=profiles)
+        assert body and scans, "경로가 안 맞는데 전체 탐색으로 돌아가지 않았다"
+        assert profiles.path_for("e.kr") == '//div[@class="news_body"]'
+        assert profiles.stats["e.kr"] == {"hit": 3, "miss": 1, "learned": 1}, profiles.stats
+        assert "적중 3/4" in profiles.summary(), profiles.summary()
+    finally:
+        http_client.get = original_get
+        article_body._pick_body = original_pick
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_body_fetch_schedules_by_host_and_skips_blocked_hosts():
+    """
+    해외 기사 → 성공률 높은 호스트 → 기록 없는 호스트 순으로 받고, 늘 실패하는 호스트는
+    받지 않되 주기적으로 다시 찔러 본다. 한 호스트에 동시에 _PER_HOST_WORKERS개까지만.
+    """
+    import threading
+    from datetime import datetime, timezone
+    from src.collectors.base_collector import NewsArticle
+    from src.utils import article_body, body_hosts
+    from src.utils.body_hosts import HostHistory
+
+    page = ('<html><head><meta charset="utf-8"></head><body><article>'
+            + "<p>위원회는 결론을 냈다. 반대 의견도 기록됐다. </p>" * 30 + "</article></body></html>")
+    requested, active, peak = [], {}, {}
+    lock = threading.Lock()
+
+    def fake_get(url, stream=False, **kwargs):
+        host = url.split("/")[2]
+        with lock:
+            requested.append(host)
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+        time.sleep(0.02)
+        with lock:
+            active[host] -= 1
+        return _Resp(200 if host != "blocked.kr" else 403, page.encode("utf-8"))
+
+    def article(host, n, region="domestic"):
+        made = NewsArticle("t", f"https://{host}/{n}", datetime(2026, 8, 17, tzinfo=timezone.utc), "짧다", "S")
+        made.region = region
+        return made
+
+    hosts = HostHistory()
+    for _ in range(5):
+        hosts.record("good.kr", True)
+        hosts.record("blocked.kr", False)
+        hosts.record("slow.com", False)
+    hosts.record("slow.com", True)
+
+    original = (http_client.get, article_body._deadline, article_body._WORKERS, dict(article_body.BODY_STATS))
+    http_client.get = fake_get
+    article_body._deadline = None
+    try:
+        article_body._WORKERS = 1
+        articles = [article("new.kr", 1), article("blocked.kr", 1), article("good.kr", 1),
+                    article("slow.com", 1, "overseas")]
+        assert article_body.enrich(articles, hosts=hosts) == 3
+        assert requested == ["slow.com", "good.kr", "new.kr"], f"받는 순서가 틀렸다: {requested}"
+        assert hosts.skipped_now == {"blocked.kr": 1}
+        assert article_body.BODY_STATS["S"]["skipped"] == 1
+
+        # 건너뛰기만 계속하지 않는다 — PROBE_EVERY_RUNS번째 실행에 한 번은 다시 받는다
+        for _ in range(body_hosts.PROBE_EVERY_RUNS - 2):
+            assert hosts.should_skip("blocked.kr")
+            hosts.mark_skipped("blocked.kr", 1)
+        assert not hosts.should_skip("blocked.kr"), "막힌 호스트를 다시 확인하지 않는다"
+
+        article_body._WORKERS = 8
+        requested.clear()
+        article_body.enrich([article("busy.kr", n) for n in range(6)] + [article("other.kr", 1)])
+        assert peak["busy.kr"] <= article_body._PER_HOST_WORKERS, f"한 호스트에 {peak['busy.kr']}개 동시 요청"
+        assert len(requested) == 7
+    finally:
+        http_client.get, article_body._deadline, article_body._WORKERS, stats = original
+        article_body.BODY_STATS.clear()
+        article_body.BODY_STATS.update(stats)
+
+
+def test_body_fetch_keys_hosts_by_redirect_target():
+    """
+    구글 뉴스 링크는 호스트가 다 같다 — 결과는 리다이렉트 뒤의 실제 매체 호스트로 남기고,
+    다음 실행은 알아 둔 실제 호스트로 건너뛰기·호스트당 동시 요청 상한을 정한다. 막힌
+    매체 하나 때문에 같은 링크 호스트의 다른 매체까지 건너뛰거나 한 줄로 서지 않는다.
+    """
+    import threading
+    from datetime import datetime, timezone
+    from src.collectors.base_collector import NewsArticle
+    from src.utils import article_body
+    from src.utils.body_hosts import HostHistory
+
+    page = ('<html><head><meta charset="utf-8"></head><body><article>'
+            + "<p>위원회는 결론을 냈다. 반대 의견도 기록됐다. </p>" * 30 + "</article></body></html>")
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fake_get(url, stream=False, **kwargs):
+        outlet, n = url.rsplit("/", 1)[1].split("-")
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        resp = _Resp(403 if outlet == "blocked.kr" else 200, page.encode("utf-8"))
+        resp.url = f"https://{outlet}/{n}"
+        return resp
+
+    def article(outlet, n):
+        return NewsArticle("t", f"https://news.google.com/rss/articles/{outlet}-{n}",
+                           datetime(2026, 8, 17, tzinfo=timezone.utc), "짧다", "구글 뉴스")
+
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "body_hosts.json")
+    original = (http_client.get, article_body._deadline, article_body._WORKERS, dict(article_body.BODY_STATS))
+    http_client.get = fake_get
+    try:
+        article_body._WORKERS = 8
+        article_body._deadline = None
+        hosts = HostHistory(path)
+        outlets = [("blocked.kr", n) for n in range(5)] + [("good.kr", n) for n in range(3)] \
+            + [("other.kr", n) for n in range(3)]
+        assert article_body.enrich([article(*o) for o in outlets], hosts=hosts) == 6
+        assert hosts.success_rate("news.google.com") is None, "링크 호스트로 기록했다"
+        assert hosts.success_rate("good.kr") == 1.0 and hosts.success_rate("blocked.kr") == 0.0
+        hosts.save()
+
+        # 다음 실행: 알아 둔 실제 호스트로 막힌 매체만 건너뛰고, 매체마다 따로 상한을 쓴다
+        hosts = HostHistory(path)
+        assert hosts.redirect_for(article("good.kr", 1).link) == "good.kr"
+        peak[0] = 0
+        article_body._deadline = None
+        assert article_body.enrich([article(*o) for o in outlets], hosts=hosts) == 6
+        assert hosts.skipped_now == {"blocked.kr": 5}, hosts.skipped_now
+        assert peak[0] > article_body._PER_HOST_WORKERS, \
+            f"구글 뉴스 링크가 한 호스트 상한에 묶였다 (동시 {peak[0]}개)"
+    finally:
+        http_client.get, article_body._deadline, article_body._WORKERS, stats = original
+        article_body.BODY_STATS.clear()
+        article_body.BODY_STATS.update(stats)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def test_body_stage_ends_at_its_deadline_despite_in_flight_fetches():
+    """
+    예산이 끝나면 돌고 있는 요청을 기다리지 않고 바로 돌아와야 한다. 조금씩 흘려보내는
+    페이지는 요청별 시간 상한(_REQUEST_SECONDS)에서 끊겨야 한다.
+    """
+    from datetime import datetime, timezone
+    from src.collectors.base_collector import NewsArticle
+    from src.utils import article_body
+
+    page = ('<html><head><meta charset="utf-8"></head><body><article>'
+            + "<p>위원회는 결론을 냈다. 반대 의견도 기록됐다. </p>" * 30 + "</article></body></html>")
+
+    class _Trickle(_Resp):
+        def iter_content(self, chunk_size=1):
+            for i in range(0, len(self.content), 64):
+                time.sleep(0.05)
+                self.read = i + 64
+                yield self.content[i:i + 64]
+
+    def fake_get(url, stream=False, timeout=None, **kwargs):
+        assert timeout is not None and timeout <= article_body._TIMEOUT
+        if "hang" in url:
+            time.sleep(2.0)
+        return _Trickle(200, ("<html><body>" + "x" * 100_000).encode("utf-8")) if "trickle" in url \
+            else _Resp(200, page.encode("utf-8"))
+
+    def article(link):
+        return NewsArticle("t", link, datetime(2026, 8, 17, tzinfo=timezone.utc), "짧다", "S")
+
+    original = (http_client.get, article_body._deadline, article_body._REQUEST_SECONDS,
+                dict(article_body.BODY_STATS))
+    http_client.get = fake_get
+    try:
+        article_body._REQUEST_SECONDS = 0.3
+        started = time.monotonic()
+        body, _, outcome, _ = article_body._fetch("https://e/trickle", False)
+        assert outcome == "timeout" and body is None, outcome
+        assert time.monotonic() - started < 0.6, "요청별 시간 상한에서 끊지 않았다"
+
+        article_body._REQUEST_SECONDS = 12
+        article_body._deadline = time.monotonic() + 0.3
+        started = time.monotonic()
+        articles = [article("https://fast/1"), article("https://hang/1"), article("https://hang/2")]
+        assert article_body.enrich(articles) == 1
+        elapsed = time.monotonic() - started
+        assert elapsed < 0.6, f"예산 뒤에도 돌고 있는 요청을 기다렸다 ({elapsed:.2f}s)"
+        assert articles[0].body and not articles[1].body
+    finally:
+        http_client.get, article_body._deadline, article_body._REQUEST_SECONDS, stats = original
+        article_body.BODY_STATS.clear()
+        article_body.BODY_STATS.update(stats)
+
+
+def test_page_dates_and_body_come_from_one_parse():
+    """
+    발행일은 같은 파스에서 메타(name=/property=)나 JSON-LD(@graph 안)에서 읽고,
+    스크립트·내비게이션은 파싱 중에 떨어져 나가야 한다 — 그 뒤의 본문 텍스트는 남는다.
+    """
+    from datetime import datetime, timezone
+    from src.utils import article_body
+
+    prose = "".join(f"<p>문단 {i}에서 위원회는 결론을 냈다. 반대 의견도 기록됐다. </p>" for i in range(15))
+    ld = ('{"@context": "https://schema.org", "@graph": [{"@type": "WebPage"}, '
+          '{"@type": "NewsArticle", "datePublished": "2026-08-17T09:30:00+09:00"}]}')
+    pages = {
+        "https://e/meta": ('<html><head><meta charset="utf-8">'
+                           '<meta name="article:published_time" content="2026-08-16T12:00:00Z">'
+                           f'</head><body><nav>{"메뉴 " * 300}</nav><article>{prose}'
+                           '<p>끝으로 <script>var x = 1;</script>마지막 문장이다.</p></article></body></html>'),
+        "https://e/jsonld": ('<html><head><meta charset="utf-8">'
+                             f'<script type="application/ld+json">{ld}</script></head>'
+                             f'<body><div class="article-body">{prose}</div></body></html>'),
+    }
+    original = http_client.get
+    http_client.get = lambda url, **kwargs: _Resp(200, pages[url].encode("utf-8"))
+    try:
+        body, published = article_body.fetch_body("https://e/meta", want_date=True)
+        assert published == datetime(2026, 8, 16, 12, tzinfo=timezone.utc), published
+        assert "메뉴" not in body and "var x" not in body, "본문이 아닌 부분이 남았다"
+        assert body.rstrip().endswith("마지막 문장이다."), "떼어 낸 스크립트 뒤의 텍스트를 잃었다"
+
+        body, published = article_body.fetch_body("https://e/jsonld", want_date=True)
+        assert body and published == datetime(2026, 8, 17, 0, 30, tzinfo=timezone.utc), published
+    finally:
+        http_client.get = original
+
+
+def test_body_extraction_runs_in_worker_processes():
+    """
+    받기는 스레드, lxml 추출은 프로세스 풀에서. 결과(본문·발행일·배운 경로)는 같은
+    프로세스에서 추출한 것과 같아야 하고, 두 단계 시간이 따로 쌓여야 한다.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from datetime import datetime, timezone
+    from src.collectors.base_collector import NewsArticle
+    from src.utils import article_body
+    from src.utils.body_profiles import ExtractionProfiles
+
+    prose = "".join(f"<p>문단 {i}에서 위원회는 결론을 냈다. 반대 의견도 기록됐다. </p>" for i in range(15))
+    page = ('<html><head><meta charset="utf-8"><meta property="article:published_time" '
+            f'content="2026-08-16T12:00:00Z"></head><body><div class="news_body">{prose}</div>'
+            '</body></html>').encode("utf-8")
+    local = article_body.extract_page(page)
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        remote = pool.submit(article_body.extract_page, page).result()
+        assert remote._replace(seconds=0) == local._replace(seconds=0)
+        assert remote.path == '//div[@class="news_body"]' and remote.hit is None
+
+        original = (http_client.get, article_body._deadline, dict(article_body.STAGE_SECONDS),
+                    dict(article_body.BODY_STATS))
+        http_client.get = lambda url, **kwargs: _Resp(200, page)
+        article_body._deadline = None
+        article_body.STAGE_SECONDS.update(download=0.0, extract=0.0)
+        try:
+            profiles = ExtractionProfiles()
+            articles = [NewsArticle("t", f"https://e.kr/{n}", datetime(2026, 8, 17, tzinfo=timezone.utc),
+                                    "짧다", "S") for n in range(4)]
+            assert article_body.enrich(articles, profiles=profiles, extract_pool=pool, workers=2) == 4
+            assert all("위원회는 결론을" in a.body for a in articles)
+            assert profiles.path_for("e.kr") == remote.path, "프로세스의 추출 결과로 경로를 못 배웠다"
+            assert article_body.STAGE_SECONDS["extract"] > 0
+        finally:
+            http_client.get, article_body._deadline, stage, stats = original
+            article_body.STAGE_SECONDS.update(stage)
+            article_body.BODY_STATS.clear()
+            article_body.BODY_STATS.update(stats)
+
+
+def test_near_duplicate_titles_across_sources_without_pairwise_scan():
+    """
+    같은 매체의 재탕과 다른 매체의 거의 같은 제목을 합치고, 남길 땐 요약이 더 긴 쪽.
+    다른 매체의 '같은 사안, 다른 기사'는 남겨야 한다. 제목이 늘어도 실제 비교 횟수는
+    후보(LSH 버킷)만큼이라 전수 비교가 아니어야 한다.
+    """
+    import random
+    from datetime import datetime, timezone
+    from src.collectors.base_collector import NewsArticle
+    from src.news_aggregator import NewsAggregator
+    from src.utils.near_dup import NearDupIndex
+
+    def article(title, source, summary="요약"):
+        return NewsArticle(title, f"https://e/{source}/{title}", datetime(2026, 8, 17, tzinfo=timezone.utc),
+                           summary, source)
+
+    articles = [
+        article("북한, 동해상으로 미상 발사체 포착", "A", "짧다"),
+        article("북한, 동해상으로 미상 발사체 감지", "A", "더 긴 요약문이다"),
+        article("북한 동해상으로 미상 발사체 포착", "B"),
+        article("합참 \"북한 발사체, 사거리 분석 중\"", "B"),
+        article("코스피, 외국인 매도에 하락 마감", "C"),
+    ]
+    kept = NewsAggregator()._remove_duplicates(articles)
+    assert [a.title for a in kept] == ["북한, 동해상으로 미상 발사체 감지", "합참 \"북한 발사체, 사거리 분석 중\"",
+                                        "코스피, 외국인 매도에 하락 마감"], [a.title for a in kept]
+
+    rng = random.Random(7)
+    syllables = "가나다라마바사아자차카타파하경제정치사회문화과학세계국제시장금리주가"
+    index = NearDupIndex()
+    titles = ["".join(rng.choice(syllables) for _ in range(18)) for _ in range(600)]
+    for n, title in enumerate(titles):
+        if index.match(title, "S") is None:
+            index.add(n, title, "S")
+    assert index.compared < len(titles) * 3, f"후보 비교가 너무 많다: {index.compared}"
+
+
+def test_same_subject_different_events_stay_apart():
+    """
+    주어만 같은 다른 사건("삼성전자, 갤럭시 신제품 공개" / "삼성전자, 반도체 신공장 착공")은
+    같은 날 기사라 날짜 표기까지 겹쳐도 한 묶음이 되면 안 된다 — 묶이면 작은 쪽이 지면에서
+    빠진다. 같은 배치의 같은 사건 여러 매체 기사는 그대로 묶인다.
+    """
+    from datetime import datetime, timezone
+    from src.collectors.base_collector import NewsArticle
+    from src.utils.story_cluster import cluster_stories
+
+    def article(title, summary, source):
+        return NewsArticle(title, f"https://e/{source}/{len(title)}", datetime(2026, 8, 17, tzinfo=timezone.utc),
+                           summary, source)
+
+    articles = [
+        article("한국은행, 기준금리 연 3.5%로 동결…11회 연속",
+                "한국은행 금융통화위원회가 17일 기준금리를 연 3.5%로 동결했다.", "연합뉴스"),
+        article("한은 기준금리 3.5% 동결 결정",
+                "한국은행이 17일 금통위 회의를 열고 기준금리를 현 수준인 연 3.5%로 유지하기로 했다.", "한겨레"),
+        article("[속보] 한은, 기준금리 연 3.50% 동결",
+                "한국은행 금융통화위원회는 이날 통화정책방향 회의에서 기준금리를 동결했다.", "연합뉴스TV"),
+        article("전문가들 \"연내 금리 인하 어렵다\"…시장 전망 엇갈려",
+                "증권가에서는 하반기 금리 인하 시점을 두고 전망이 엇갈리고 있다.", "연합뉴스"),
+        article("삼성전자, 갤럭시 신제품 공개", "삼성전자가 17일 갤럭시 신제품을 공개했다.", "한겨레"),
+        article("삼성전자, 반도체 신공장 착공", "삼성전자가 17일 평택에 반도체 신공장을 착공했다.", "연합뉴스"),
+    ]
+    kept = cluster_stories(articles)
+    assert [a.title for a in kept] == [articles[i].title for i in (1, 3, 4, 5)], [a.title for a in kept]
+    assert [a.cluster_size for a in kept] == [3, 1, 1, 1], "갤럭시 공개와 신공장 착공은 다른 사건이다"
+
+
+def test_same_subject_and_event_word_with_different_facts_stay_apart():
+    """
+    주어와 사건 낱말까지 같은 다른 사건("주가 급등" / "주가 하락", 3분기 / 4분기 영업이익)은
+    유사도가 같은 사건보다 높게 나온다 — 제목의 방향 낱말과 숫자가 어긋나면 묶지 않는다.
+    """
+    from datetime import datetime, timezone
+    from src.collectors.base_collector import NewsArticle
+    from src.utils.story_cluster import cluster_stories
+
+    def article(title, summary, source):
+        return NewsArticle(title, f"https://e/{source}/{len(title)}", datetime(2026, 8, 17, tzinfo=timezone.utc),
+                           summary, source)
+
+    articles = [
+        article("한국은행, 기준금리 연 3.5%로 동결…11회 연속",
+                "한국은행 금융통화위원회가 17일 기준금리를 연 3.5%로 동결했다.", "연합뉴스"),
+        article("한은 기준금리 3.5% 동결 결정",
+                "한국은행이 17일 금통위 회의를 열고 기준금리를 현 수준인 연 3.5%로 유지하기로 했다.", "한겨레"),
+        article("[속보] 한은, 기준금리 연 3.50% 동결",
+                "한국은행 금융통화위원회는 이날 통화정책방향 회의에서 기준금리를 동결했다.", "연합뉴스TV"),
+        article("삼성전자 주가 5% 급등…외국인 순매수",
+                "삼성전자 주가가 17일 외국인 순매수에 힘입어 5% 넘게 올랐다.", "연합뉴스"),
+        article("삼성전자 주가 하락…외국인 매도 지속",
+                "삼성전자 주가가 외국인 매도세가 이어지며 이틀째 하락했다.", "한겨레"),
+        article("삼성전자 3분기 영업이익 10조 돌파", "삼성전자가 3분기 잠정 실적을 발표했다.", "경향신문"),
+        article("삼성전자, 4분기 영업이익 전망 하향",
+                "증권가가 삼성전자의 4분기 영업이익 추정치를 잇달아 낮추고 있다.", "연합뉴스"),
+    ]
+    kept = cluster_stories(articles)
+    assert [a.title for a in kept] == [articles[i].title for i in (1, 3, 4, 5, 6)], [a.title for a in kept]
+    assert [a.cluster_size for a in kept] == [3, 1, 1, 1, 1], "급등과 하락, 3분기와 4분기는 다른 사건이다"
+
+
+def test_balanced_selection_orders_outlets_by_newest_article():
+    """
+    매체 안에서는 여러 매체가 다룬 사건(cluster_size)이 먼저지만, 매체끼리의 순서는 여전히
+    '가장 최신 기사를 가진 매체부터'다. 매체의 첫 기사(오래된 큰 묶음)로 비교하면 최신
+    기사를 낸 매체가 뒤로 밀려 자리가 모자랄 때 빠진다.
+    """
+    from datetime import datetime, timedelta, timezone
+    from src.collectors.base_collector import NewsArticle
+    from src.news_aggregator import NewsAggregator
+
+    now = datetime(2026, 8, 17, 12, tzinfo=timezone.utc)
+
+    def article(title, source, hours_ago, cluster_size=1):
+        a = NewsArticle(title, f"https://e/{source}/{title}", now - timedelta(hours=hours_ago), "요약", source)
+        a.cluster_size = cluster_size
+        return a
+
+    articles = [
+        article("A 큰 사건", "A", 5, cluster_size=3),
+        article("A 방금 기사", "A", 0),
+        article("B 한 시간 전", "B", 1),
+        article("C 세 시간 전", "C", 3),
+    ]
+    picked = NewsAggregator()._select_balanced(articles, 3)
+    assert [a.title for a in picked] == ["A 큰 사건", "B 한 시간 전", "C 세 시간 전"], [a.title for a in picked]
+    picked = NewsAggregator()._select_balanced(articles, 1)
+    assert [a.title for a in picked] == ["A 큰 사건"], "최신 기사를 가진 매체 A가 먼저 뽑혀야 한다"
+
+
+def test_same_story_from_several_sources_is_summarized_once():
+    """
+    같은 사건을 다른 제목으로 낸 여러 매체 기사는 가장 상세한 하나로 묶이고, 빠진 매체는
+    대표의 related_sources로 남아 요약 입력에 출처 근거로 붙는다. 같은 주제의 다른
+    사건은 묶이지 않는다. LLM이 실패해도 여러 매체가 다룬 사건은 중요 기사다.
+    """
+    from datetime import datetime, timezone
+    from src.collectors.base_collector import NewsArticle
+    from src import summarizer
+    from src.utils.story_cluster import cluster_stories
+
+    def article(title, summary, source):
+        return NewsArticle(title, f"https://e/{source}/{len(title)}", datetime(2026, 8, 17, tzinfo=timezone.utc),
+                           summary, source)
+
+    articles = [
+        article("한국은행, 기준금리 연 3.5%로 동결…11회 연속",
+                "한국은행 금융통화위원회가 17일 기준금리를 연 3.5%로 동결했다.", "연합뉴스"),
+        article("한은 기준금리 3.5% 동결 결정",
+                "한국은행이 17일 금통위 회의를 열고 기준금리를 현 수준인 연 3.5%로 유지하기로 했다.", "한겨레"),
+        article("[속보] 한은, 기준금리 연 3.50% 동결",
+                "한국은행 금융통화위원회는 이날 통화정책방향 회의에서 기준금리를 동결했다.", "연합뉴스TV"),
+        article("전문가들 \"연내 금리 인하 어렵다\"…시장 전망 엇갈려",
+                "증권가에서는 하반기 금리 인하 시점을 두고 전망이 엇갈리고 있다.", "연합뉴스"),
+        article("삼성전자 3분기 영업이익 10조 돌파", "삼성전자가 3분기 잠정 실적을 발표했다.", "한겨레"),
+    ]
+    kept = cluster_stories(articles)
+    assert [a.title for a in kept] == [articles[1].title, articles[3].title, articles[4].title], \
+        [a.title for a in kept]
+    leader = kept[0]
+    assert leader.cluster_size == 3
+    assert sorted(r["source"] for r in leader.related_sources) == ["연합뉴스", "연합뉴스TV"]
+    assert kept[1].cluster_size == 1 and kept[1].related_sources == []
+
+    captured = {}
+
+    def fake_call(system, user, **kwargs):
+        captured["user"] = user
+        return None
+
+    original = summarizer.call_llm_json
+    summarizer.call_llm_json = fake_call
+    try:
+        summarizer._summarize_chunk("경제", kept)
+    finally:
+        summarizer.call_llm_json = original
+    assert "[한겨레/ko +연합뉴스, 연합뉴스TV]" in captured["user"], captured["user"]
+    assert leader.is_important, "여러 매체가 다룬 사건은 폴백에서도 중요 기사여야 한다"
+
+
+def test_story_republished_under_new_url_is_dropped_next_day():
+    """
+    어제 실은 기사가 다른 URL·머리말로 다시 오면 원래 제목·요약의 지문으로 걸러 seen으로
+    센다. 다른 기사는 남는다. 조회는 블록 버킷만 보므로 저장된 지문 전부와 비교하지 않는다.
+    """
+    import random
+    from datetime import datetime, timezone
+    from src.collectors.base_collector import NewsArticle
+    from src.news_aggregator import NewsAggregator
+    from src.utils.feed_stats import FeedStats
+    from src.utils.story_fingerprint import (FingerprintLookup, fingerprint, load_seen_fingerprints,
+                                             record_fingerprints)
+
+    summary = "한국은행 금융통화위원회가 17일 기준금리를 연 3.5%로 동결했다. 이는 물가 상승 우려 때문이다."
+    yesterday = fingerprint("한국은행, 기준금리 연 3.5%로 동결…11회 연속", summary)
+    tmp = tempfile.mkdtemp()
+    try:
+        record_fingerprints(tmp, [yesterday], "2026-08-16")
+        seen = load_seen_fingerprints(tmp, 7, today=datetime(2026, 8, 17, tzinfo=timezone.utc))
+        assert seen.size == 1
+
+        published = datetime(2026, 8, 17, tzinfo=timezone.utc)
+        repost = NewsArticle("[속보] 한국은행, 기준금리 연 3.5%로 동결…11회 연속", "https://news.google.com/x/1",
+                             published, summary + " 김기자", "구글 뉴스")
+        other = NewsArticle("북한, 동해상으로 탄도미사일 발사", "https://e/2", published,
+                            "합동참모본부는 북한이 오늘 오전 동해상으로 탄도미사일을 발사했다고 밝혔다.", "연합뉴스")
+        repost.feed_key = other.feed_key = "googlenews/politics"
+        stats = FeedStats("")
+        kept = NewsAggregator._keep_fresh({"region": "domestic"}, [repost, other], stats, seen)
+        assert kept == [other], [a.title for a in kept]
+        assert stats.totals()["seen"] == 1 and stats.totals()["fresh"] == 1, stats.totals()
+        assert other.fingerprint, "남은 기사에도 스냅샷에 남길 지문이 붙어야 한다"
+    finally:
+        shutil.rmtree(tmp)
+
+    rng = random.Random(3)
+    lookup = FingerprintLookup(f"{rng.getrandbits(64):016x}" for _ in range(5000))
+    for _ in range(100):
+        lookup.match(f"{rng.getrandbits(64):016x}")
+    assert lookup.compared < 100 * 5000 / 10, f"조회당 비교가 너무 많다: {lookup.compared / 100:.0f}"
+
+
+def test_article_snapshot_round_trip_rerenders_same_page():
+    """
+    NewsArticle은 필드를 전부 선언한 slotted 레코드이고, 스냅샷(to_dict → JSON → from_dict)을
+    거쳐도 렌더링 결과가 같다. 정규화 링크·링크 키는 한 번만 계산해 둔다.
+    """
+    import json
+    from datetime import datetime, timezone
+    from src.collectors.base_collector import NewsArticle
+    from src.html_generator import HTMLGenerator
+    from src.utils.seen_index import link_key
+
+    article = NewsArticle("Fed holds rates", "https://e/world/1?utm_source=rss&id=7",
+                          datetime(2026, 8, 17, 1, tzinfo=timezone.utc), "요약", "Reuters", "world")
+    article.region, article.language, article.is_important = "overseas", "en", True
+    article.original_title, article.original_summary = "Fed holds rates steady", "The Fed held..."
+    article.detail_summary, article.detail_path = "상세 요약", "/2026/08/17/a.html"
+    article.related_sources = [{"source": "AP", "link": "https://e/ap/1", "fingerprint": ""}]
+    article.cluster_size, article.body = 2, "본문"
+    try:
+        article.made_up_field = 1
+        raise AssertionError("선언되지 않은 필드를 붙일 수 있으면 안 된다 (__slots__)")
+    except AttributeError:
+        pass
+
+    assert article.canonical_link == "https://e/world/1?id=7"
+    assert article.link_key == link_key(article.link)
+
+    restored = NewsArticle.from_dict(json.loads(json.dumps(article.to_dict(with_body=False))))
+    assert "body" not in article.to_dict(with_body=False)
+    assert NewsArticle.from_dict(article.to_dict()).to_dict() == article.to_dict()
+    assert restored.published == article.published and restored.related_sources == article.related_sources
+
+    template_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "templates")
+    output_dir = tempfile.mkdtemp()
+    try:
+        gen = HTMLGenerator(template_dir, output_dir)
+        pages = []
+        for a in (article, restored):
+            out_file = os.path.join(output_dir, "out.html")
+            gen._generate_briefing_page(category="world", regions={"domestic": [], "overseas": [a]},
+                                        output_file=out_file, date_str="2026-08-17",
+                                        date_path="2026/08/17", nav_categories=[])
+            with open(out_file, encoding="utf-8") as f:
+                pages.append(f.read())
+        assert pages[0] == pages[1], "스냅샷에서 되살린 기사의 렌더링이 달라졌다"
+        assert "외 1곳 보도" in pages[0] and "Fed holds rates steady" in pages[0]
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def test_body_fetch_timeouts_are_not_cached_or_held_against_host():
+    """
+    소켓 타임아웃(연결·본문 읽기 모두)은 "timeout"이다 — 느린 망 탓일 수 있어 음성 캐시에
+    넣지 않고 호스트 실패율에도 세지 않는다. 연결 거부 같은 네트워크 오류는 그대로 남긴다.
+    """
+    from datetime import datetime, timezone
+    from urllib3.exceptions import ReadTimeoutError
+    from src.collectors.base_collector import NewsArticle
+    from src.utils import article_body
+    from src.utils.body_cache import BodyCache
+    from src.utils.body_hosts import HostHistory
+
+    class _Stalled(_Resp):
+        def iter_content(self, chunk_size=1):
+            yield b"<html><body>"
+            raise requests.ConnectionError(ReadTimeoutError(None, self.url, "Read timed out."))
+
+    def fake_get(url, **kwargs):
+        if "slow" in url:
+            raise requests.ReadTimeout("read timed out")
+        if "stalled" in url:
+            resp = _Stalled(200)
+            resp.url = url
+            return resp
+        raise requests.ConnectionError("connection refused")
+
+    def article(link):
+        return NewsArticle("t", link, datetime(2026, 8, 17, tzinfo=timezone.utc), "짧다", "S")
+
+    original = (http_client.get, dict(article_body.BODY_STATS))
+    http_client.get = fake_get
+    try:
+        assert article_body._fetch("https://slow.kr/1", False)[2] == "timeout"
+        assert article_body._fetch("https://stalled.kr/1", False)[2] == "timeout"
+        assert article_body._fetch("https://down.kr/1", False)[2] == "error"
+
+        cache, hosts = BodyCache(), HostHistory()
+        links = ["https://slow.kr/1", "https://stalled.kr/1", "https://down.kr/1"]
+        assert article_body.enrich([article(link) for link in links], cache=cache, hosts=hosts) == 0
+        assert cache.lookup(links[0]) is None and cache.lookup(links[1]) is None, \
+            "타임아웃이 음성 캐시에 남았다"
+        assert hosts.success_rate("slow.kr") is None and hosts.success_rate("stalled.kr") is None, \
+            "타임아웃이 호스트 실패로 세어졌다"
+        assert cache.lookup(links[2])["outcome"] == "error" and hosts.success_rate("down.kr") == 0.0
+    finally:
+        http_client.get, stats = original
+        article_body.BODY_STATS.clear()
+        article_body.BODY_STATS.update(stats)
+
+
+def test_fetch_left_running_past_deadline_does_not_extract_or_learn():
+    """
+    예산이 끝난 뒤에도 남아 돈 받기 스레드는 닫힌 추출 풀에 넘기거나, 이미 저장된 추출
+    경로 기록에 배우지 않는다 — 페이지를 다 받았어도 그냥 "timeout"으로 끝낸다.
+    """
+    from src.utils import article_body
+
+    page = ('<html><head><meta charset="utf-8"></head><body><article>'
+            + "<p>위원회는 결론을 냈다. 반대 의견도 기록됐다. </p>" * 30 + "</article></body></html>")
+    touched = []
+
+    class ClosedPool:
+        def submit(self, *args, **kwargs):
+            touched.append("submit")
+            raise RuntimeError("cannot schedule new futures after shutdown")
+
+    class Profiles:
+        def path_for(self, host):
+            return None
+
+        def __getattr__(self, name):
+            touched.append(name)
+            return lambda *args, **kwargs: None
+
+    def fake_get(url, **kwargs):
+        time.sleep(0.15)
+        return _Resp(200, page.encode("utf-8"))
+
+    original = (http_client.get, article_body._deadline)
+    http_client.get = fake_get
+    try:
+        article_body._deadline = time.monotonic() + 0.05
+        body, _, outcome, _ = article_body._fetch("https://e.kr/1", False, profiles=Profiles(),
+                                                  extract_pool=ClosedPool())
+        assert body is None and outcome == "timeout", outcome
+        assert touched == [], f"예산 뒤에 남은 스레드가 추출·학습을 했다: {touched}"
+    finally:
+        http_client.get, article_body._deadline = original
+
+
+if __name__ == "__main__":
+    test_feed_cache_serves_entries_on_304()
+    test_feed_cache_evicts_by_age_and_size()
+    test_async_collector_overlaps_feeds_and_caps_per_host()
+    test_slowest_feeds_are_scheduled_first()
+    test_dead_feeds_back_off_and_get_probed()
+    test_failed_feed_downloads_do_not_count_as_empty_runs()
+    test_streaming_parse_stops_at_limit_and_filters_before_cleaning()
+    test_parse_stage_runs_in_worker_processes()
+    test_feed_full_text_skips_body_fetch()
+    test_body_cache_skips_known_pages_on_rerun()
+    test_body_fetch_stops_once_article_is_read()
+    test_body_extraction_learns_container_per_host()
+    test_body_fetch_schedules_by_host_and_skips_blocked_hosts()
+    test_body_fetch_keys_hosts_by_redirect_target()
+    test_body_stage_ends_at_its_deadline_despite_in_flight_fetches()
+    test_body_fetch_timeouts_are_not_cached_or_held_against_host()
+    test_fetch_left_running_past_deadline_does_not_extract_or_learn()
+    test_page_dates_and_body_come_from_one_parse()
+    test_body_extraction_runs_in_worker_processes()
+    test_near_duplicate_titles_across_sources_without_pairwise_scan()
+    test_same_story_from_several_sources_is_summarized_once()
+    test_story_republished_under_new_url_is_dropped_next_day()
+    test_article_snapshot_round_trip_rerenders_same_page()
+    test_balanced_selection_orders_outlets_by_newest_article()
+    test_same_subject_different_events_stay_apart()
+    test_same_subject_and_event_word_with_different_facts_stay_apart()
+    print("OK: collection self-checks passed")
@@ -54,7 +54,10 @@ def test_call_llm_json_salvages_truncated(monkeypatched):
 
 
 def test_chunking_splits_calls():
-    """30건이면 CHUNK_SIZE(8) 기준으로 4번 나눠 호출해야 한다."""
+    """
+    짧은 기사 30건은 토큰 예산보다 기사 수 상한(MAX_CHUNK_ARTICLES=16)에 먼저 걸린다 —
+    2번으로 나누되 15건씩 고르게 나눠야 한다(16 + 14가 아니라).
+    """
     articles = [_article(i) for i in range(30)]
     calls = []
 
@@ -76,16 +79,16 @@ def test_chunking_splits_calls():
     finally:
         llm_client.call_llm = original
 
-    assert len(calls) == 4, f"청크 4회 호출을 기대했는데 {len(calls)}회: {calls}"
+    assert len(calls) == 2, f"청크 2회 호출을 기대했는데 {len(calls)}회: {calls}"
     # 청크는 병렬로 돌아 완료 순서가 매번 다르다 — 크기 구성만 확인한다
-    assert sorted(calls) == [6, 8, 8, 8], f"청크 크기 분배가 이상하다: {calls}"
+    assert sorted(calls) == [15, 15], f"청크 크기 분배가 이상하다: {calls}"
     assert len(kept) == 30, f"기사 30건이 유지돼야 하는데 {len(kept)}건"
     assert kept[0].title == "재서술0", "LLM 결과가 반영되지 않았다"
 
 
 def test_one_bad_chunk_does_not_kill_the_rest():
     """청크 하나가 실패해도 나머지 청크는 LLM 결과를 유지해야 한다."""
-    articles = [_article(i) for i in range(16)]
+    articles = [_article(i) for i in range(32)]
 
     def flaky_call(system, user, **kwargs):
         # 첫 청크(제목0이 들어간 덩어리)는 재프롬프트를 해도 계속 실패시킨다
@@ -106,9 +109,9 @@ def test_one_bad_chunk_does_not_kill_the_rest():
     finally:
         llm_client.call_llm = original
 
-    assert len(kept) == 16, f"16건이 유지돼야 하는데 {len(kept)}건"
+    assert len(kept) == 32, f"32건이 유지돼야 하는데 {len(kept)}건"
     assert kept[0].title == "제목0", "실패한 청크는 원래 제목이 남아야 한다"
-    assert kept[8].title == "재서술", "성공한 청크까지 폴백되면 안 된다"
+    assert kept[16].title == "재서술", "성공한 청크까지 폴백되면 안 된다"
 
 
 def test_parallel_chunks_preserve_article_order():
@@ -140,8 +143,8 @@ def test_parallel_chunks_preserve_article_order():
         llm_client.call_llm = original
 
     assert len(kept) == 24, f"24건이 유지돼야 하는데 {len(kept)}건"
-    # 각 청크 안에서 id가 1부터 다시 시작하므로 제목은 T0..T7 이 3번 반복된다
-    expected = [f"T{i % summarizer.CHUNK_SIZE}" for i in range(24)]
+    # 12건씩 두 청크 — 각 청크 안에서 id가 1부터 다시 시작하므로 제목은 T0..T11 이 2번 반복된다
+    expected = [f"T{i % 12}" for i in range(24)]
     assert [a.title for a in kept] == expected, \
         f"병렬 실행 후 기사 순서가 뒤바뀌었다: {[a.title for a in kept][:10]}"
 
@@ -193,6 +196,7 @@ def test_rate_limit_retry_waits_and_gives_up_cleanly():
     except 절에서 또 sleep 하는 버그가 있었다).
     """
     import requests
+    from src.utils import http_client
 
     class FakeResp:
         status_code = 429
@@ -201,10 +205,10 @@ def test_rate_limit_retry_waits_and_gives_up_cleanly():
         text = "rate limited"
 
     sleeps = []
-    orig_post, orig_sleep = requests.post, llm_client.time.sleep
+    orig_post, orig_sleep = http_client.post, llm_client.time.sleep
     orig_deadline = llm_client._deadline
     llm_client.time.sleep = lambda s: sleeps.append(s)
-    requests.post = lambda *a, **k: FakeResp()
+    http_client.post = lambda *a, **k: FakeResp()
     os.environ["NVIDIA_API_KEY"] = "test-key"
     try:
         llm_client._deadline = None
@@ -213,11 +217,44 @@ def test_rate_limit_retry_waits_and_gives_up_cleanly():
         assert sleeps == [7, 7], f"Retry-After(7초)를 따라 2회만 대기해야 하는데 {sleeps}"
         assert llm_client.LLM_STATS["http_error"] == before + 1, "429가 http_error로 집계되지 않았다"
     finally:
-        requests.post, llm_client.time.sleep = orig_post, orig_sleep
+        http_client.post, llm_client.time.sleep = orig_post, orig_sleep
         llm_client._deadline = orig_deadline
+        llm_client._limiters.clear()  # 429로 걸린 키 정지(Retry-After)를 다음 테스트에 남기지 않는다
         os.environ.pop("NVIDIA_API_KEY", None)
 
 
+def test_http_client_shares_session_and_counts_per_host():
+    """
+    모듈마다 맨 requests.get/post를 부르면 요청마다 TLS 연결을 새로 맺는다.
+    공유 세션 하나를 쓰고, 호스트별 호출 수·바이트가 집계돼야 한다.
+    """
+    from src.utils import http_client
+
+    class FakeSession:
+        def __init__(self): self.calls = []
+        def request(self, method, url, **kw):
+            self.calls.append((method, url))
+            resp = type("R", (), {})()
+            resp.status_code, resp.content = 200, b"x" * 10
+            return resp
+
+    original = http_client._session
+    fake = FakeSession()
+    http_client._session = fake
+    try:
+        before = dict(http_client.HTTP_STATS.get("stats.example", {}))
+        http_client.get("https://stats.example/a")
+        http_client.post("https://stats.example/b", json={})
+        assert http_client.session() is fake, "호출마다 세션을 새로 만든다"
+        assert [m for m, _ in fake.calls] == ["GET", "POST"]
+        after = http_client.HTTP_STATS["stats.example"]
+        assert after["calls"] - before.get("calls", 0) == 2, after
+        assert after["bytes"] - before.get("bytes", 0) == 20, after
+        assert "stats.example" in http_client.stats_summary()
+    finally:
+        http_client._session = original
+
+
 def test_retry_after_header_is_clamped():
     class R:
         def __init__(self, v): self.headers = {"Retry-After": v} if v is not None else {}
@@ -232,7 +269,7 @@ def test_dead_category_key_falls_back_to_working_key():
     카테고리 키 8개 중 하나가 잘못돼도 그 카테고리만 통째로 실패하면 안 된다.
     죽은 키는 살아있는 키로 대체되고, 키별 상태가 기록돼야 한다.
     """
-    import requests
+    from src.utils import http_client
 
     class Resp:
         def __init__(self, code): self.status_code = code; self.ok = code == 200; self.text = 'x'
@@ -246,12 +283,12 @@ def test_dead_category_key_falls_back_to_working_key():
     cats = ['politics', 'world']
     for c in cats:
         saved_env[c] = os.environ.get(f'NVIDIA_API_KEY_{c.upper()}')
-    orig_post = requests.post
+    orig_post = http_client.post
     orig_status = dict(llm_client.KEY_STATUS)
     try:
         os.environ['NVIDIA_API_KEY_POLITICS'] = 'good-politics'
         os.environ['NVIDIA_API_KEY_WORLD'] = 'bad-world'
-        requests.post = fake_post
+        http_client.post = fake_post
         llm_client.KEY_STATUS.clear()
         resolved = summarizer.resolve_keys(cats)
 
@@ -261,7 +298,7 @@ def test_dead_category_key_falls_back_to_working_key():
         joined = " ".join(llm_client.KEY_STATUS.values())
         assert 'HTTP 401' in joined, f"키 실패 사유가 기록되지 않았다: {llm_client.KEY_STATUS}"
     finally:
-        requests.post = orig_post
+        http_client.post = orig_post
         llm_client.KEY_STATUS.clear()
         llm_client.KEY_STATUS.update(orig_status)
         for c, v in saved_env.items():
@@ -279,42 +316,43 @@ def test_probe_timeout_does_not_discard_key():
     (working keys: 1로 떨어져 전부 한 키에 몰렸다). 타임아웃은 '판단 불가'여야 한다.
     """
     import requests
+    from src.utils import http_client
 
     def timeout_post(*a, **k):
         raise requests.exceptions.ReadTimeout("read timed out")
 
-    orig_post = requests.post
+    orig_post = http_client.post
     orig_status = dict(llm_client.KEY_STATUS)
     try:
-        requests.post = timeout_post
+        http_client.post = timeout_post
         llm_client.KEY_STATUS.clear()
         assert llm_client.probe_key("some-key", "politics") is True, \
             "타임아웃인데 키를 버렸다 (멀쩡한 키가 폐기됨)"
         assert "확인 불가" in llm_client.KEY_STATUS["politics"], \
             f"판단 불가로 기록되지 않았다: {llm_client.KEY_STATUS}"
     finally:
-        requests.post = orig_post
+        http_client.post = orig_post
         llm_client.KEY_STATUS.clear()
         llm_client.KEY_STATUS.update(orig_status)
 
 
 def test_rate_limited_key_is_kept():
     """429는 rate limit이지 키 문제가 아니다 — 버리면 안 된다."""
-    import requests
+    from src.utils import http_client
 
     class Resp:
         status_code = 429
         ok = False
         text = "rate limited"
 
-    orig_post = requests.post
+    orig_post = http_client.post
     orig_status = dict(llm_client.KEY_STATUS)
     try:
-        requests.post = lambda *a, **k: Resp()
+        http_client.post = lambda *a, **k: Resp()
         llm_client.KEY_STATUS.clear()
         assert llm_client.probe_key("k", "world") is True, "429인데 키를 버렸다"
     finally:
-        requests.post = orig_post
+        http_client.post = orig_post
         llm_client.KEY_STATUS.clear()
         llm_client.KEY_STATUS.update(orig_status)
 
@@ -356,6 +394,49 @@ def test_cross_day_links_are_loaded_from_snapshots():
         shutil.rmtree(root, ignore_errors=True)
 
 
+def test_seen_index_replaces_snapshot_rescans():
+    """
+    '이미 실은 기사' 필터는 스냅샷을 다시 열지 않고 seen_index 한 파일을 날짜 범위로
+    읽어야 한다. 처음엔 스냅샷에서 만들고, 오늘 줄은 (같은 날 재실행이라) 거르지 않고,
+    KEEP_DAYS가 지난 줄은 덧붙일 때 버린다.
+    """
+    import json, shutil, tempfile
+    from src.utils import seen_index
+    from src.utils.seen_index import SeenIndex, link_key, load_seen_keys
+
+    root = tempfile.mkdtemp(prefix="seen_")
+    try:
+        today = datetime(2026, 8, 14, tzinfo=timezone(timedelta(hours=9)))
+        path = os.path.join(root, "2026", "08")
+        os.makedirs(path)
+        with open(os.path.join(path, "13.json"), "w", encoding="utf-8") as f:
+            json.dump({"date": "2026-08-13", "categories": {
+                "politics": {"domestic": [{"link": "https://e/a?utm_source=x"}]}}}, f)
+
+        keys = load_seen_keys(root, 7, today)
+        assert keys == {link_key("https://e/a?utm_source=y")}, "스냅샷에서 인덱스를 만들지 못했다"
+
+        index = SeenIndex(root)
+        os.remove(os.path.join(path, "13.json"))  # 이제 스냅샷은 읽지 않는다
+        assert index.record(["https://e/b", "https://e/b/"], "2026-08-14") == 1, "같은 기사를 두 번 적었다"
+        assert index.record(["https://e/b"], "2026-08-14") == 0, "같은 날 재실행이 줄을 또 적었다"
+        assert load_seen_keys(root, 7, today) == keys, "오늘 실은 링크는 오늘 수집에서 거르면 안 된다"
+        tomorrow = today + timedelta(days=1)
+        assert load_seen_keys(root, 7, tomorrow) == keys | {link_key("https://e/b")}
+        assert load_seen_keys(root, 1, tomorrow) == {link_key("https://e/b")}, "범위 밖 날짜가 섞였다"
+
+        with open(index.path, "a", encoding="utf-8") as f:
+            f.write("2026-08-1")  # 덧붙이다 중단된 줄
+        later = (today + timedelta(days=seen_index.KEEP_DAYS)).date().isoformat()
+        index.record(["https://e/c"], later)
+        with open(index.path, encoding="utf-8") as f:
+            days = [line.split("\t")[0] for line in f]
+        assert days == ["2026-08-14", later], f"만료된 줄·깨진 줄이 남았다: {days}"
+        assert load_seen_keys("", 7) == set(), "경로가 없으면 빈 집합"
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
 def test_listing_keeps_one_line_per_article():
     """
     번호 목록의 한 항목이 여러 줄로 쪼개지면 모델이 번호와 기사를 잘못 대응시켜
@@ -511,12 +592,467 @@ def test_needs_body_targets_short_and_truncated():
     class Fake:
         def __init__(self, summary):
             self.summary = summary
+            self.body_source = ""
+            self.date_is_approximate = False
 
     assert article_body.needs_body(Fake("짧은 요약")), "짧은 요약은 본문을 받아와야 한다"
     assert article_body.needs_body(Fake("가" * 400 + "…")), "…로 잘린 요약도 본문 대상"
     assert not article_body.needs_body(Fake("가" * 400)), "충분히 긴 요약은 그대로 쓴다"
 
 
+def test_summary_cache_reuses_per_article_results_across_reruns():
+    """
+    같은 날 재실행이면 이미 요약한 기사는 LLM에 다시 보내지 않는다. 기사 구성이 바뀌어
+    청크가 달라져도(새 기사 하나가 맨 앞에 끼어도) 새 기사만 청크로 보낸다.
+    분야 무관 판정도 캐시에서 그대로 적용되고, 적중/미적중이 LLM_STATS에 잡힌다.
+    상세 요약이 필요한 해외 기사는 detail 없이 저장된 항목을 쓰지 않는다.
+    """
+    import shutil
+    import tempfile
+    from src.utils.summary_cache import SummaryCache
+
+    sent = []
+
+    def fake_call(system, user, **kwargs):
+        listing = user.split("기사 목록:\n", 1)[1]
+        titles = re.findall(r"\] (제목\d+) —", listing)
+        sent.extend(titles)
+        detail = "detail_600" in user
+        items = ", ".join(
+            f'{{"id": {i + 1}, "paraphrased_title": "재서술 {t}", "summary_250": "요약 {t}", '
+            + (f'"detail_600": "상세 {t}", ' if detail else "") +
+            f'"is_important": false, '
+            f'"off_topic": {"true" if t == "제목3" else "false"}, "exclude": false}}'
+            for i, t in enumerate(titles)
+        )
+        return f"[{items}]"
+
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "summaries.json")
+    original = llm_client.call_llm
+    llm_client.call_llm = fake_call
+    try:
+        cache = SummaryCache(path)
+        kept = summarizer.summarize_region("it", "IT", [_article(i) for i in range(10)], "domestic", "k", cache)
+        assert len(sent) == 10 and len(kept) == 9, (sent, len(kept))
+        cache.save()
+
+        sent.clear()
+        before = dict(llm_client.LLM_STATS)
+        cache = SummaryCache(path)
+        rerun = [_article(99)] + [_article(i) for i in range(10)]
+        kept = summarizer.summarize_region("it", "IT", rerun, "domestic", "k", cache)
+        assert sent == ["제목99"], f"캐시에 있는 기사까지 다시 보냈다: {sent}"
+        assert [a.title for a in kept][:3] == ["재서술 제목99", "재서술 제목0", "재서술 제목1"]
+        assert "재서술 제목3" not in [a.title for a in kept], "분야 무관 판정도 캐시에서 적용돼야 한다"
+        assert llm_client.LLM_STATS["cache_hit"] - before["cache_hit"] == 10
+        assert llm_client.LLM_STATS["cache_miss"] - before["cache_miss"] == 1
+        assert "요약 캐시 적중" in llm_client.stats_summary()
+
+        # 재시도 스윕처럼 detail 없이 받은 항목은 해외(상세 요약 필요)에서는 빗나간다
+        sent.clear()
+        summarizer._summarize_chunk("IT", [_article(50)], "k", want_detail=False, cache=cache)
+        summarizer.summarize_region("it", "IT", [_article(50)], "overseas", "k", cache)
+        assert sent == ["제목50", "제목50"], sent
+    finally:
+        llm_client.call_llm = original
+        shutil.rmtree(tmp)
+
+
+def test_summary_cache_skips_llm_for_excluded_articles_on_rerun():
+    """
+    LLM이 exclude·off_topic으로 판정한 기사는 detail 없이 저장된다. 상세 요약이 필요한
+    해외 기사라도 재실행에서 그 판정을 캐시로 쓰고 LLM에 다시 보내지 않는다.
+    """
+    import shutil
+    import tempfile
+    from src.utils.summary_cache import SummaryCache
+
+    sent = []
+
+    def fake_call(system, user, **kwargs):
+        listing = user.split("기사 목록:\n", 1)[1]
+        titles = re.findall(r"\] (제목\d+) —", listing)
+        sent.extend(titles)
+        items = ", ".join(
+            f'{{"id": {i + 1}, "exclude": true}}' if t == "제목1" else
+            f'{{"id": {i + 1}, "paraphrased_title": "재서술 {t}", "summary_250": "요약 {t}", '
+            f'"detail_600": "상세 {t}", "is_important": false, "off_topic": false, "exclude": false}}'
+            for i, t in enumerate(titles)
+        )
+        return f"[{items}]"
+
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "summaries.json")
+    original = llm_client.call_llm
+    llm_client.call_llm = fake_call
+    try:
+        cache = SummaryCache(path)
+        kept = summarizer.summarize_region("world", "국제", [_article(i) for i in range(3)], "overseas", "k", cache)
+        assert sent == ["제목0", "제목1", "제목2"] and len(kept) == 2, (sent, len(kept))
+        cache.save()
+
+        sent.clear()
+        cache = SummaryCache(path)
+        kept = summarizer.summarize_region("world", "국제", [_article(i) for i in range(3)], "overseas", "k", cache)
+        assert sent == [], f"제외 판정된 기사를 다시 보냈다: {sent}"
+        assert [a.title for a in kept] == ["재서술 제목0", "재서술 제목2"], [a.title for a in kept]
+    finally:
+        llm_client.call_llm = original
+        shutil.rmtree(tmp)
+
+
+def test_streaming_hands_over_items_and_keeps_them_on_disconnect():
+    """
+    stream=True면 배열 객체가 닫히는 대로 on_item으로 넘어오고, 생성 도중 연결이 끊겨도
+    그때까지 완성된 기사는 살아남는다(재요청하지 않는다). 점진 파서는 한 글자씩 받아도
+    한 번에 받은 것(_salvage_array)과 같은 결과를 낸다.
+    """
+    import json as _json
+    import requests
+    from src.utils import http_client
+
+    body = ('[{"id": 1, "summary_250": "괄호 } 포함"}, {"id": 2, "summary_250": "따옴표 \\" 포함"}, '
+            '{"id": 3, "summary_250": "생성 중')
+    parser = llm_client.ArrayItems()
+    streamed = [item for ch in body for item in parser.feed(ch)]
+    assert streamed == llm_client._salvage_array(body) and len(streamed) == 2, streamed
+
+    handed = []
+
+    class StreamResp:
+        status_code, ok, text, headers = 200, True, "", {}
+        closed = False
+
+        def iter_lines(self, decode_unicode=False):
+            for i in range(0, len(body), 7):
+                yield "data: " + _json.dumps({"choices": [{"delta": {"content": body[i:i + 7]}}]})
+                yield ""
+                if i == 14:
+                    # 첫 객체가 닫히자마자 넘어왔어야 한다 — 끝까지 기다리지 않고
+                    assert handed == [{"id": 1, "summary_250": "괄호 } 포함"}] or handed == [], handed
+            raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+        def close(self):
+            self.closed = True
+
+    resp = StreamResp()
+    posts = []
+    orig_post, orig_deadline = http_client.post, llm_client._deadline
+    http_client.post = lambda url, **kw: posts.append(kw) or resp
+    os.environ["NVIDIA_API_KEY"] = "test-key"
+    try:
+        llm_client._deadline = None
+        before = llm_client.LLM_STATS["stream_cut"]
+        result = llm_client.call_llm_json("s", "u", stream=True, on_item=handed.append)
+        assert len(posts) == 1 and posts[0]["stream"] and posts[0]["json"]["stream"], "한 번만, 스트림으로 요청해야 한다"
+        assert [item["id"] for item in handed] == [1, 2], handed
+        assert [item["id"] for item in result] == [1, 2], result
+        assert llm_client.LLM_STATS["stream_cut"] == before + 1
+        assert resp.closed, "끊긴 스트림 연결을 닫아야 한다"
+    finally:
+        http_client.post, llm_client._deadline = orig_post, orig_deadline
+        os.environ.pop("NVIDIA_API_KEY", None)
+
+
+def test_stream_decodes_utf8_without_charset():
+    """
+    NIM의 text/event-stream 응답에는 charset이 없다. requests에 맡겨 풀면 ISO-8859-1로 읽혀
+    한글 델타가 깨지므로(또는 encoding이 None이면 bytes가 와서 startswith가 터진다),
+    줄마다 UTF-8로 풀어야 한다. 멀티바이트 글자가 바이트 청크 경계에 걸려도 마찬가지.
+    """
+    import json as _json
+    from src.utils import http_client
+
+    body = '[{"id": 1, "summary_250": "한글 요약 — 깨지면 안 된다"}]'
+    lines = [("data: " + _json.dumps({"choices": [{"delta": {"content": body[i:i + 5]}}]},
+                                     ensure_ascii=False)).encode("utf-8")
+             for i in range(0, len(body), 5)] + [b"", b"data: [DONE]"]
+
+    class BytesResp:
+        status_code, ok, text = 200, True, ""
+        headers = {"Content-Type": "text/event-stream"}
+        encoding = None
+
+        def iter_lines(self, decode_unicode=False):
+            for line in lines:
+                yield line.decode("iso-8859-1") if decode_unicode else line
+
+        def close(self):
+            pass
+
+    handed = []
+    orig_post, orig_deadline = http_client.post, llm_client._deadline
+    http_client.post = lambda url, **kw: BytesResp()
+    os.environ["NVIDIA_API_KEY"] = "test-key"
+    try:
+        llm_client._deadline = None
+        assert llm_client.call_llm("s", "u", stream=True, on_item=handed.append) == body
+        assert handed == [{"id": 1, "summary_250": "한글 요약 — 깨지면 안 된다"}], handed
+    finally:
+        http_client.post, llm_client._deadline = orig_post, orig_deadline
+        llm_client._limiters.clear()
+        os.environ.pop("NVIDIA_API_KEY", None)
+
+
+def test_stream_cut_by_call_deadline_lowers_key_limit():
+    """
+    호출 마감에 잘린 스트림은 키가 과부하라는 신호다 — 429·타임아웃처럼 키의 동시 호출
+    상한을 줄인다. 전체 시간 예산에 잘린 건 키 탓이 아니라 상한을 그대로 둔다.
+    """
+    import json as _json
+    import time
+    from src.utils import adaptive_limit, http_client
+
+    class SlowResp:
+        status_code, ok, text, headers = 200, True, "", {}
+
+        def iter_lines(self, decode_unicode=False):
+            for i in range(20):
+                time.sleep(0.02)
+                yield "data: " + _json.dumps({"choices": [{"delta": {"content": f'[{{"id": {i}}}, '}}]})
+
+        def close(self):
+            pass
+
+    orig_post, orig_deadline = http_client.post, llm_client._deadline
+    http_client.post = lambda url, **kw: SlowResp()
+    os.environ["NVIDIA_API_KEY"] = "test-key"
+    try:
+        llm_client._limiters.clear()
+        llm_client._deadline = None
+        assert llm_client.call_llm("s", "u", stream=True, timeout=0.1)
+        assert llm_client._limiter("test-key").limit == adaptive_limit.INITIAL_LIMIT * adaptive_limit.DECREASE_FACTOR, \
+            "마감에 잘린 스트림이 상한을 줄이지 않았다"
+
+        llm_client._limiters.clear()
+        llm_client._deadline = time.monotonic() + 0.1
+        assert llm_client.call_llm("s", "u", stream=True, timeout=60)
+        assert llm_client._limiter("test-key").limit == adaptive_limit.INITIAL_LIMIT, \
+            "전체 예산에 잘린 스트림으로 상한을 줄였다"
+    finally:
+        http_client.post, llm_client._deadline = orig_post, orig_deadline
+        llm_client._limiters.clear()
+        os.environ.pop("NVIDIA_API_KEY", None)
+
+
+def test_chunk_planner_packs_by_tokens_and_learns_from_usage():
+    """
+    청크는 기사 수가 아니라 추정 토큰으로 나눈다: 본문이 긴 해외 기사(상세 요약까지)는
+    작게, 짧은 기사는 크게 묶되 어느 청크도 출력 예산을 넘지 않는다. 응답 usage가
+    추정보다 크면(잘렸으면 더 크게) 다음 계획의 청크가 작아지고, 배율은 저장돼 다음
+    실행이 이어 쓴다. call_llm은 usage를 스트림 마지막 청크에서도 꺼내 넘긴다.
+    """
+    import json as _json
+    import shutil
+    import tempfile
+    from src.utils import chunk_planner, http_client
+    from src.utils.chunk_planner import ChunkPlanner
+
+    def long_article(n, body_chars):
+        a = _article(n)
+        a.body = "가나다라마 바사아자차 " * (body_chars // 12)
+        return a
+
+    planner = ChunkPlanner()
+    short = [_article(i) for i in range(12)]
+    long_ = [long_article(i, 1500) for i in range(12)]
+    assert len(planner.plan(short, False, summarizer.CHUNK_MAX_TOKENS)) == 1
+    detail = planner.plan(long_, True, summarizer.DETAIL_MAX_TOKENS)
+    assert 3 <= len(detail) <= 6, [len(c) for c in detail]
+    budget = min(chunk_planner.OUTPUT_BUDGET_TOKENS, summarizer.DETAIL_MAX_TOKENS * chunk_planner.MAX_TOKENS_FILL)
+    for chunk in detail:
+        assert sum(planner.estimate(a, True)[1] for a in chunk) <= budget
+    assert [a for c in detail for a in c] == long_, "순서를 유지한 연속 구간이어야 한다"
+    before = len(planner.plan(long_, False, summarizer.CHUNK_MAX_TOKENS))
+
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "token_usage.json")
+    try:
+        planner = ChunkPlanner(path)
+        chunk = long_[:4]
+        estimated = sum(planner.estimate(a, False)[1] for a in chunk)
+        for _ in range(5):
+            planner.observe(chunk, False, "프롬프트", {"prompt_tokens": 900, "completion_tokens": int(estimated * 2)})
+        assert planner.output_scale["summary"] > 1.6, planner.output_scale
+        assert planner.output_scale["detail"] == 1.0, "모드별로 따로 배워야 한다"
+        planner.observe(chunk, True, "프롬프트", {"completion_tokens": 100, "finish_reason": "length"})
+        assert planner.output_scale["detail"] == 1.0, "잘린 응답의 작은 출력으로 배율을 내리면 안 된다"
+        planner.save()
+
+        rerun = ChunkPlanner(path)
+        assert rerun.output_scale["summary"] == round(planner.output_scale["summary"], 4)
+        assert len(rerun.plan(long_, False, summarizer.CHUNK_MAX_TOKENS)) > before, "보정이 청크 크기에 반영돼야 한다"
+    finally:
+        shutil.rmtree(tmp)
+
+    events = [{"choices": [{"delta": {"content": '[{"id": 1}]'}}]},
+              {"choices": [{"delta": {}, "finish_reason": "stop"}]},
+              {"choices": [], "usage": {"prompt_tokens": 1200, "completion_tokens": 80}}]
+
+    class StreamResp:
+        status_code, ok, text, headers = 200, True, "", {}
+
+        def iter_lines(self, decode_unicode=False):
+            for event in events:
+                yield "data: " + _json.dumps(event)
+            yield "data: [DONE]"
+
+        def close(self):
+            pass
+
+    payloads, usages = [], []
+    orig_post, orig_deadline = http_client.post, llm_client._deadline
+    http_client.post = lambda url, **kw: payloads.append(kw["json"]) or StreamResp()
+    os.environ["NVIDIA_API_KEY"] = "test-key"
+    try:
+        llm_client._deadline = None
+        tokens = llm_client.LLM_STATS["prompt_tokens"]
+        assert llm_client.call_llm("s", "u", stream=True, on_usage=usages.append) == '[{"id": 1}]'
+        assert payloads[0]["stream_options"] == {"include_usage": True}
+        assert usages == [{"prompt_tokens": 1200, "completion_tokens": 80, "finish_reason": "stop"}], usages
+        assert llm_client.LLM_STATS["prompt_tokens"] == tokens + 1200
+        assert "토큰 입력" in llm_client.stats_summary()
+    finally:
+        http_client.post, llm_client._deadline = orig_post, orig_deadline
+        os.environ.pop("NVIDIA_API_KEY", None)
+
+
+def test_per_key_concurrency_adapts_to_throttling():
+    """
+    키마다 동시 호출 상한이 AIMD로 움직인다: 성공이 이어지면 늘고, 429면 절반이 되며,
+    같은 혼잡에 물린 429가 잇달아 와도 한 번만 준다. Retry-After 동안은 같은 키의 다른
+    스레드도 새 요청을 보내지 않고, 다른 키는 영향을 받지 않는다. 상한·지연은 키 점검
+    보고에 키 이름으로(키 값이 아니라) 나온다.
+    """
+    import threading
+    import time as _time
+    from src.utils import adaptive_limit, http_client
+    from src.utils.adaptive_limit import AdaptiveLimit
+
+    limiter = AdaptiveLimit()
+    for _ in range(20):
+        limiter.release(limiter.acquire(), adaptive_limit.OK)
+    grown = limiter.limit
+    assert grown > adaptive_limit.INITIAL_LIMIT + 2, f"성공이 이어졌는데 상한이 안 늘었다: {grown}"
+
+    tickets = [limiter.acquire() for _ in range(3)]
+    for ticket in tickets:
+        limiter.release(ticket, adaptive_limit.THROTTLED)
+    assert limiter.limit == grown * adaptive_limit.DECREASE_FACTOR, \
+        f"같은 혼잡의 429 세 번에 한 번만 줄어야 한다: {grown} → {limiter.limit}"
+    limiter.release(limiter.acquire(), adaptive_limit.TIMEOUT)
+    assert limiter.limit == max(adaptive_limit.MIN_LIMIT, grown * adaptive_limit.DECREASE_FACTOR ** 2)
+
+    paused = AdaptiveLimit()
+    paused.release(paused.acquire(), adaptive_limit.THROTTLED, pause=0.3)
+    entered = []
+    worker = threading.Thread(target=lambda: entered.append(paused.acquire()))
+    worker.start()
+    worker.join(0.1)
+    assert not entered, "Retry-After 정지 중에 같은 키로 새 요청이 나갔다"
+    assert AdaptiveLimit().acquire() is not None, "다른 키까지 멈추면 안 된다"
+    worker.join(1)
+    assert entered and paused.in_flight == 1, "정지가 풀린 뒤에는 들어가야 한다"
+
+    class OkResp:
+        status_code, ok, headers, text = 200, True, {}, ""
+
+        def json(self):
+            _time.sleep(0.01)
+            return {"choices": [{"message": {"content": "[]"}, "finish_reason": "stop"}]}
+
+    orig_post, orig_deadline = http_client.post, llm_client._deadline
+    http_client.post = lambda *a, **k: OkResp()
+    try:
+        llm_client._deadline = None
+        llm_client._limiters.clear()
+        llm_client._KEY_LABELS["secret-key-value"] = "politics"
+        for _ in range(4):
+            llm_client.call_llm("s", "u", api_key="secret-key-value")
+        gauges = llm_client.concurrency_gauges()["politics"]
+        assert gauges["ok"] == 4 and gauges["in_flight"] == 0 and gauges["latency"] is not None, gauges
+        assert gauges["limit"] > adaptive_limit.INITIAL_LIMIT
+        report = llm_client.key_status_report()
+        assert "politics" in report and "동시 상한" in report, report
+        assert "secret-key-value" not in report, "키 값이 보고에 노출됐다"
+    finally:
+        http_client.post, llm_client._deadline = orig_post, orig_deadline
+        llm_client._limiters.clear()
+        llm_client._KEY_LABELS.pop("secret-key-value", None)
+
+
+def test_global_scheduler_runs_largest_chunks_first_and_steals_idle_keys():
+    """
+    summarize_all은 모든 카테고리·지역의 청크를 한 스케줄러로 돌린다: 큰 청크부터 꺼내고,
+    제 카테고리 키가 꽉 차면 노는 다른 카테고리 키가 가져간다. IT의 AI 항목 추출은 IT
+    청크가 다 끝난 뒤에 돌고, 기사 순서는 카테고리·지역별로 그대로다.
+    """
+    import threading
+    import time as _time
+    from src.utils.chunk_planner import ChunkPlanner
+
+    calls = []
+    lock = threading.Lock()
+
+    def fake_call(system, user, api_key=None, **kwargs):
+        if "ai_subtype" in user:
+            with lock:
+                calls.append(("ai", api_key, 0))
+            return "[]"
+        count = user.count("[테스트/ko]")
+        limiter = llm_client._limiter(api_key)  # 실제 call_llm처럼 키 자리를 잡는다
+        ticket = limiter.acquire()
+        try:
+            with lock:
+                calls.append((user.split("\n", 1)[0], api_key, count))
+            _time.sleep(0.05)
+        finally:
+            limiter.release(ticket, "ok")
+        items = ", ".join(
+            f'{{"id": {i + 1}, "paraphrased_title": "T{i}", "summary_250": "S{i}", '
+            f'"is_important": false, "exclude": false}}' for i in range(count))
+        return f"[{items}]"
+
+    def buckets():
+        return {
+            "world": {"domestic": [_article(i) for i in range(40)], "overseas": []},
+            "science": {"domestic": [_article(100)], "overseas": []},
+            "it": {"domestic": [_article(200), _article(201)], "overseas": []},
+        }
+
+    keys = {"world": "k-world", "science": "k-science", "it": "k-it"}
+    orig = (llm_client.call_llm, summarizer.resolve_keys, llm_client.concurrency_ceiling)
+    llm_client.call_llm = fake_call
+    summarizer.resolve_keys = lambda cats: {c: keys[c] for c in cats}
+    try:
+        # 워커 하나면 꺼내는 순서가 그대로 보인다 — 큰 청크부터, AI 추출은 IT 청크 뒤
+        llm_client.concurrency_ceiling = lambda: 1
+        llm_client._limiters.clear()
+        summarizer.summarize_all(buckets())
+        plan = [len(c) for c in ChunkPlanner().plan([_article(i) for i in range(40)], False,
+                                                    summarizer.CHUNK_MAX_TOKENS)]
+        sizes = [count for _, _, count in calls]
+        assert len(plan) == 3 and sizes[:3] == sorted(plan, reverse=True), f"큰 청크부터 돌아야 한다: {calls}"
+        it_chunk = next(i for i, c in enumerate(calls) if c[0] == "카테고리: IT")
+        assert [c[0] for c in calls].index("ai") > it_chunk, f"AI 추출이 IT 요약보다 먼저 돌았다: {calls}"
+
+        calls.clear()
+        llm_client.concurrency_ceiling = lambda: 16
+        llm_client._limiters.clear()
+        data = buckets()
+        summarizer.summarize_all(data)
+        world = [key for first, key, _ in calls if first == "카테고리: 국제"]
+        assert len(world) == 3 and set(world) - {"k-world"}, \
+            f"world 키가 꽉 찼는데(상한 2) 다른 키가 청크를 가져가지 않았다: {calls}"
+        titles = [a.title for a in data["world"]["domestic"]]
+        assert titles == [f"T{i}" for size in plan for i in range(size)], titles[:16]
+        assert [a.title for a in data["it"]["domestic"]] == ["T0", "T1"]
+    finally:
+        llm_client.call_llm, summarizer.resolve_keys, llm_client.concurrency_ceiling = orig
+        llm_client._limiters.clear()
+
+
 def main():
     test_salvage_truncated_array()
     test_salvage_ignores_braces_inside_strings()
@@ -537,12 +1073,14 @@ def main():
     test_llm_time_budget_stops_calls()
     test_body_budget_is_global_not_per_category()
     test_rate_limit_retry_waits_and_gives_up_cleanly()
+    test_http_client_shares_session_and_counts_per_host()
     test_retry_after_header_is_clamped()
     test_dead_category_key_falls_back_to_working_key()
     test_probe_timeout_does_not_discard_key()
     test_rate_limited_key_is_kept()
     test_concurrency_scales_with_working_keys()
     test_cross_day_links_are_loaded_from_snapshots()
+    test_seen_index_replaces_snapshot_rescans()
     test_listing_keeps_one_line_per_article()
     test_trim_at_boundary_does_not_cut_mid_word_or_entity()
     test_clean_llm_text_unescapes_entities()
@@ -551,6 +1089,14 @@ def main():
     test_sparkline_color_follows_displayed_pct()
     test_prose_score_separates_body_from_headline_list()
     test_needs_body_targets_short_and_truncated()
+    test_summary_cache_reuses_per_article_results_across_reruns()
+    test_summary_cache_skips_llm_for_excluded_articles_on_rerun()
+    test_streaming_hands_over_items_and_keeps_them_on_disconnect()
+    test_stream_decodes_utf8_without_charset()
+    test_stream_cut_by_call_deadline_lowers_key_limit()
+    test_chunk_planner_packs_by_tokens_and_learns_from_usage()
+    test_per_key_concurrency_adapts_to_throttling()
+    test_global_scheduler_runs_largest_chunks_first_and_steals_idle_keys()
     print("OK: salvage + chunking + budget + body-extraction self-checks passed")
 
 